@@ -0,0 +1,162 @@
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
+
+from ..constants.settings import (
+    COMPLETION_CACHE_ENABLED,
+    COMPLETION_CACHE_MAX_ENTRIES,
+    COMPLETION_CACHE_DEFAULT_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+# How long a completion that embeds a given tool's output stays valid (seconds).
+# Mirrors how quickly the underlying data changes.
+TOOL_RESULT_TTLS = {
+    "get_ticker_price": 60,
+    "get_ticker_history": 900,
+    "calculate_price_trend": 900,
+    "calculate_period_statistics": 900,
+    "calculate_returns": 900,
+    "screen_price_trends": 900,
+    "calculate_technical_indicators": 900,
+    "calculate_price_analytics": 900,
+    "get_financial_news": 600,
+    "get_company_info": 3600,
+    "get_institutional_investors": 21600,
+    "get_sec_filings": 21600,
+    "get_financial_statements": 21600,
+}
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+TRAILING_PUNCTUATION = "?!. "
+
+
+def _normalize_text(text: str) -> str:
+    return (
+        WHITESPACE_PATTERN.sub(" ", text).strip().lower().rstrip(TRAILING_PUNCTUATION)
+    )
+
+
+def _normalize_tool_calls(tool_calls: List[Any]) -> List[Dict[str, Any]]:
+    normalized = []
+    for tool_call in tool_calls:
+        if not isinstance(tool_call, dict):
+            tool_call = tool_call.model_dump()
+        function = tool_call.get("function", {})
+        arguments = function.get("arguments")
+        try:
+            # Argument key order and spacing differ between generations
+            arguments = (
+                json.loads(arguments) if isinstance(arguments, str) else arguments
+            )
+        except json.JSONDecodeError:
+            pass
+        normalized.append({"name": function.get("name"), "arguments": arguments})
+    return normalized
+
+
+def normalize_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Tool call ids are random per request, so they are dropped; user text is
+    # case/whitespace/punctuation-folded so trivially different phrasings share a key.
+    normalized = []
+    for message in messages:
+        role = message.get("role")
+        entry: Dict[str, Any] = {"role": role}
+        content = message.get("content")
+        if content:
+            entry["content"] = _normalize_text(content) if role == "user" else content
+        if message.get("tool_calls"):
+            entry["tool_calls"] = _normalize_tool_calls(message["tool_calls"])
+        if role == "tool" and message.get("name"):
+            entry["name"] = message["name"]
+        normalized.append(entry)
+    return normalized
+
+
+def ttl_for_messages(messages: List[Dict[str, Any]]) -> int:
+    ttls = [
+        TOOL_RESULT_TTLS.get(message.get("name"), COMPLETION_CACHE_DEFAULT_TTL)
+        for message in messages
+        if message.get("role") == "tool"
+    ]
+    return min(ttls) if ttls else COMPLETION_CACHE_DEFAULT_TTL
+
+
+class CompletionCache:
+    def __init__(
+        self,
+        enabled: bool = COMPLETION_CACHE_ENABLED,
+        max_entries: int = COMPLETION_CACHE_MAX_ENTRIES,
+    ):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "bypassed": 0, "stores": 0}
+
+    def make_key(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict]],
+        tool_choice: Optional[str],
+        response_format: Optional[Dict],
+    ) -> Tuple[str, int]:
+        ttl = ttl_for_messages(messages)
+        payload = {
+            "model": model,
+            "messages": normalize_messages(messages),
+            "tools": sorted(tool["function"]["name"] for tool in tools or []),
+            "tool_choice": tool_choice if tools else None,
+            "response_format": response_format,
+            # Time bucket: identical requests in different buckets never share an entry
+            "bucket": int(time.time() // ttl),
+        }
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest(), ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: int):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            self._stats["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_bypass(self):
+        with self._lock:
+            self._stats["bypassed"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+completion_cache = CompletionCache()
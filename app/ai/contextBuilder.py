@@ -0,0 +1,196 @@
+import json
+import logging
+import threading
+from typing import List, Dict, Any, Tuple
+
+from ..constants.settings import (
+    CONTEXT_TOKEN_BUDGET,
+    CONTEXT_KEEP_RECENT_TURNS,
+    CONTEXT_SUMMARY_MAX_ITEMS,
+    CONTEXT_SUMMARY_MAX_CHARS,
+)
+from .tokens import count_message_tokens
+
+logger = logging.getLogger(__name__)
+
+# Fields that only restate the request or carry prose the model doesn't need
+# once the numbers are in front of it.
+DROPPED_SUMMARY_FIELDS = {"message", "requested_start_date", "requested_end_date"}
+SUMMARY_MARKER = '"_summarized":true'
+
+
+def _summarize_value(value: Any, depth: int = 0) -> Any:
+    if isinstance(value, str):
+        if len(value) > CONTEXT_SUMMARY_MAX_CHARS:
+            return value[:CONTEXT_SUMMARY_MAX_CHARS] + "..."
+        return value
+    if isinstance(value, dict):
+        if depth >= 3:
+            return f"<{len(value)} fields>"
+        summary = {}
+        for index, (key, item) in enumerate(value.items()):
+            if key in DROPPED_SUMMARY_FIELDS:
+                continue
+            if index >= CONTEXT_SUMMARY_MAX_ITEMS * 4:
+                summary["_omitted_fields"] = len(value) - index
+                break
+            summary[key] = _summarize_value(item, depth + 1)
+        return summary
+    if isinstance(value, list):
+        if depth >= 3:
+            return f"<{len(value)} items>"
+        items = [
+            _summarize_value(item, depth + 1)
+            for item in value[:CONTEXT_SUMMARY_MAX_ITEMS]
+        ]
+        if len(value) > CONTEXT_SUMMARY_MAX_ITEMS:
+            items.append(f"<{len(value) - CONTEXT_SUMMARY_MAX_ITEMS} more items>")
+        return items
+    return value
+
+
+def summarize_tool_content(content: str) -> str:
+    try:
+        data = json.loads(content)
+    except (TypeError, json.JSONDecodeError):
+        text = content or ""
+        if len(text) <= CONTEXT_SUMMARY_MAX_CHARS:
+            return text
+        return text[:CONTEXT_SUMMARY_MAX_CHARS] + "..."
+    summary = _summarize_value(data)
+    if isinstance(summary, dict):
+        summary["_summarized"] = True
+    return json.dumps(summary, separators=(",", ":"), default=str)
+
+
+def _recent_boundary(messages: List[Dict[str, Any]], keep_recent_turns: int) -> int:
+    # Index of the user message that starts the oldest turn kept verbatim
+    user_indexes = [i for i, m in enumerate(messages) if m.get("role") == "user"]
+    if not user_indexes:
+        return 0
+    return user_indexes[-min(keep_recent_turns, len(user_indexes))]
+
+
+class ContextBuilder:
+    def __init__(
+        self,
+        token_budget: int = CONTEXT_TOKEN_BUDGET,
+        keep_recent_turns: int = CONTEXT_KEEP_RECENT_TURNS,
+    ):
+        self.token_budget = token_budget
+        self.keep_recent_turns = keep_recent_turns
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "compacted_requests": 0,
+            "tokens_in": 0,
+            "tokens_out": 0,
+            "summarized_tool_messages": 0,
+            "dropped_messages": 0,
+            "over_budget_requests": 0,
+        }
+
+    def build(
+        self, messages: List[Dict[str, Any]], reserved_tokens: int = 0
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        # reserved_tokens covers what is sent alongside the messages (tool schemas,
+        # extra system prompts) so the whole request fits the model context.
+        budget = max(self.token_budget - reserved_tokens, 0)
+        token_counts = [count_message_tokens(message) for message in messages]
+        tokens_before = sum(token_counts)
+        result = {
+            "tokens_before": tokens_before,
+            "tokens_after": tokens_before,
+            "tokens_saved": 0,
+            "budget": budget,
+            "summarized_tool_messages": 0,
+            "dropped_messages": 0,
+        }
+        if tokens_before <= budget:
+            self._record(result)
+            return messages, result
+
+        compacted = [dict(message) for message in messages]
+        boundary = _recent_boundary(compacted, self.keep_recent_turns)
+        total = tokens_before
+
+        # Pass 1: summarize older tool outputs, oldest first
+        for index in range(boundary):
+            if total <= budget:
+                break
+            message = compacted[index]
+            if message.get("role") != "tool" or not message.get("content"):
+                continue
+            message["content"] = summarize_tool_content(message["content"])
+            new_count = count_message_tokens(message)
+            total -= token_counts[index] - new_count
+            token_counts[index] = new_count
+            result["summarized_tool_messages"] += 1
+
+        # Pass 2: drop whole older turns (user message + its tool traffic) so
+        # assistant tool_calls always keep their matching tool results
+        keep = [True] * len(compacted)
+        index = 0
+        while total > budget and index < boundary:
+            if compacted[index].get("role") == "system":
+                index += 1
+                continue
+            turn_end = index + 1
+            while turn_end < boundary and compacted[turn_end].get("role") != "user":
+                turn_end += 1
+            for dropped in range(index, turn_end):
+                if compacted[dropped].get("role") == "system":
+                    continue
+                keep[dropped] = False
+                total -= token_counts[dropped]
+                result["dropped_messages"] += 1
+            index = turn_end
+        compacted = [message for i, message in enumerate(compacted) if keep[i]]
+
+        # Pass 3 (last resort): the recent turns alone exceed the budget
+        if total > budget:
+            for message in compacted:
+                if total <= budget:
+                    break
+                if message.get("role") != "tool" or not message.get("content"):
+                    continue
+                if SUMMARY_MARKER in message["content"]:
+                    continue  # Already summarized in pass 1
+                before = count_message_tokens(message)
+                message["content"] = summarize_tool_content(message["content"])
+                total -= before - count_message_tokens(message)
+                result["summarized_tool_messages"] += 1
+
+        result["tokens_after"] = total
+        result["tokens_saved"] = tokens_before - total
+        logger.info(
+            f"Context compacted from {tokens_before} to {total} tokens (budget {budget}): summarized {result['summarized_tool_messages']} tool messages, dropped {result['dropped_messages']} messages."
+        )
+        self._record(result)
+        return compacted, result
+
+    def _record(self, result: Dict[str, Any]):
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["tokens_in"] += result["tokens_before"]
+            self._stats["tokens_out"] += result["tokens_after"]
+            self._stats["summarized_tool_messages"] += result[
+                "summarized_tool_messages"
+            ]
+            self._stats["dropped_messages"] += result["dropped_messages"]
+            if result["tokens_saved"]:
+                self._stats["compacted_requests"] += 1
+            if result["tokens_after"] > result["budget"]:
+                self._stats["over_budget_requests"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["tokens_saved"] = stats["tokens_in"] - stats["tokens_out"]
+        stats["avg_tokens_saved_per_request"] = (
+            stats["tokens_saved"] / stats["requests"] if stats["requests"] else 0.0
+        )
+        return stats
+
+
+context_builder = ContextBuilder()
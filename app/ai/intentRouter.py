@@ -0,0 +1,294 @@
+import re
+import time
+import uuid
+import logging
+import threading
+from typing import Optional, List, Dict, Any, Tuple
+
+from ..constants.settings import (
+    INTENT_ROUTER_ENABLED,
+    INTENT_ROUTER_MIN_CONFIDENCE,
+    INTENT_ROUTER_MAX_WORDS,
+)
+from ..constants.tickers import TICKER_ALIASES, TICKER_STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+
+# Keyword grammar per tool. Order matters only for logging; every tool whose
+# pattern matches is considered a candidate intent.
+INTENT_PATTERNS = {
+    "get_ticker_price": r"\b(price|quote|trading at|share price|stock price|how much is|last close)\b",
+    "get_ticker_history": r"\b(history|historical|price action)\b",
+    "get_company_info": r"\b(company info|company profile|profile|overview|tell me about|sector|industry|what does .+ do|business summary)\b",
+    "get_institutional_investors": r"\b(institutional|shareholders?|holders?|who owns|ownership)\b",
+    "get_sec_filings": r"\b(sec|filings?|10-?k|10-?q|8-?k|annual report|quarterly report)\b",
+    "get_financial_statements": r"\b(income statement|balance sheet|cash ?flow|revenue|net income|earnings statement|financials|financial statements?|total assets|total debt|free cash flow)\b",
+    "get_financial_news": r"\b(news|headlines?|latest on|what happened)\b",
+    "calculate_price_trend": r"\b(trend|trending|(?<!exponential )moving averages?|sma|golden cross|death cross)\b",
+    "calculate_period_statistics": r"\b(volatility|volatile|statistics|stats|standard deviation|std dev|median price|mean price)\b",
+    "calculate_returns": r"\b(returns?|annualized|performance|gain|gained)\b",
+    "calculate_technical_indicators": r"\b(technicals?|technical indicators?|ema|exponential moving average|rsi|relative strength|macd|bollinger( bands?)?|atr|average true range)\b",
+}
+
+# Indicator names as they appear in queries -> calculate_technical_indicators values
+INDICATOR_PATTERNS = [
+    ("ema", re.compile(r"\b(ema|exponential moving average)\b", re.I)),
+    ("rsi", re.compile(r"\b(rsi|relative strength)\b", re.I)),
+    ("macd", re.compile(r"\bmacd\b", re.I)),
+    ("bollinger", re.compile(r"\bbollinger\b", re.I)),
+    ("atr", re.compile(r"\b(atr|average true range)\b", re.I)),
+    ("volatility", re.compile(r"\bvolatility\b", re.I)),
+]
+
+# Price tools answered by one calculate_price_analytics call when several match.
+# get_ticker_history is left out: its default period (1 month) differs.
+PRICE_ANALYTICS_GROUPS = {
+    "calculate_period_statistics": "statistics",
+    "calculate_returns": "returns",
+    "calculate_price_trend": "trend",
+}
+
+# Anything that implies arguments the router does not extract (explicit or
+# relative ranges, comparisons, custom windows, analyst targets) is handed to
+# the LLM; the tools' default windows would silently answer something else.
+DEFER_PATTERN = re.compile(
+    r"\b(compare|comparison|versus|vs\.?|between|since|from|until|before|after|"
+    r"last \d+|past \d+|\d+[- ]?(day|week|month|year)s?|\d{4}-\d{2}-\d{2}|"
+    r"ytd|year to date|(last|past|this|previous) (week|month|quarter|year)|"
+    r"yesterday|target price|price targets?|"
+    r"january|february|march|april|may|june|july|august|september|october|"
+    r"november|december|q[1-4]|should i|predict|forecast|why)\b",
+    re.IGNORECASE,
+)
+
+STATEMENT_TYPE_PATTERNS = [
+    (
+        "balance_sheet",
+        re.compile(r"\b(balance sheet|assets|liabilit|debt|equity)", re.I),
+    ),
+    (
+        "cash_flow_statement",
+        re.compile(r"\b(cash ?flow|capex|capital expenditure)", re.I),
+    ),
+    (
+        "income_statement",
+        re.compile(r"\b(income|revenue|profit|earnings|ebitda|eps|sales)", re.I),
+    ),
+]
+
+# A company name alone ("apple") only counts as a ticker next to a word that
+# makes the query about the company rather than the everyday meaning
+COMPANY_CONTEXT_PATTERN = re.compile(
+    r"\b(stocks?|shares?|ticker|company|corp|corporation|inc|market cap|"
+    r"earnings|revenue|dividends?|investors?|shareholders?|filings?|10-?k|10-?q|"
+    r"8-?k|balance sheet|income statement|cash ?flow|financials|technicals?|"
+    r"rsi|macd|moving averages?|volatility|trading at)\b",
+    re.IGNORECASE,
+)
+FILING_TYPE_PATTERN = re.compile(r"\b(10-?k|10-?q|8-?k)\b", re.IGNORECASE)
+QUARTERLY_PATTERN = re.compile(r"\b(quarter|quarterly)\b", re.IGNORECASE)
+CASHTAG_PATTERN = re.compile(r"\$([A-Za-z]{1,5}(?:[.-][A-Za-z])?)\b")
+UPPER_TOKEN_PATTERN = re.compile(r"\b([A-Z]{1,5}(?:[.-][A-Z])?)\b")
+WORD_PATTERN = re.compile(r"[A-Za-z0-9$&'.-]+")
+
+
+def _build_name_pattern() -> Tuple[re.Pattern, Dict[str, str]]:
+    name_to_ticker = {}
+    for ticker, names in TICKER_ALIASES.items():
+        for name in names:
+            name_to_ticker[name.lower()] = ticker
+    # Longest names first so "bank of america" wins over shorter overlaps.
+    alternation = "|".join(
+        re.escape(name) for name in sorted(name_to_ticker, key=len, reverse=True)
+    )
+    return (
+        re.compile(rf"(?<![\w$])({alternation})(?:'s)?(?!\w)", re.IGNORECASE),
+        name_to_ticker,
+    )
+
+
+class IntentRouter:
+    def __init__(
+        self,
+        enabled: bool = INTENT_ROUTER_ENABLED,
+        min_confidence: float = INTENT_ROUTER_MIN_CONFIDENCE,
+        max_words: int = INTENT_ROUTER_MAX_WORDS,
+    ):
+        self.enabled = enabled
+        self.min_confidence = min_confidence
+        self.max_words = max_words
+        self.intent_patterns = {
+            name: re.compile(pattern, re.IGNORECASE)
+            for name, pattern in INTENT_PATTERNS.items()
+        }
+        self.name_pattern, self.name_to_ticker = _build_name_pattern()
+        self.known_tickers = set(TICKER_ALIASES)
+        self._lock = threading.Lock()
+        self._stats = {
+            "total": 0,
+            "routed": 0,
+            "deferred": 0,
+            "routed_by_tool": {},
+            "deferred_by_reason": {},
+            "total_routing_time_ms": 0.0,
+        }
+
+    def _extract_tickers(self, query: str) -> Tuple[List[str], float]:
+        # Returns (unique tickers in order of appearance, confidence of the resolution)
+        found: List[Tuple[int, str, float]] = []
+        for match in CASHTAG_PATTERN.finditer(query):
+            found.append((match.start(), match.group(1).upper(), 1.0))
+        for match in UPPER_TOKEN_PATTERN.finditer(query):
+            token = match.group(1)
+            if token in TICKER_STOPWORDS or token not in self.known_tickers:
+                continue
+            if match.start() > 0 and query[match.start() - 1] == "$":
+                continue  # Already captured as a cashtag
+            # Single-letter tickers (F, T, V, C) are easy to misread
+            found.append((match.start(), token, 0.95 if len(token) > 1 else 0.8))
+        if found or COMPANY_CONTEXT_PATTERN.search(query):
+            for match in self.name_pattern.finditer(query):
+                found.append(
+                    (match.start(), self.name_to_ticker[match.group(1).lower()], 0.9)
+                )
+
+        tickers: List[str] = []
+        confidence = 1.0
+        for _, ticker, ticker_confidence in sorted(found):
+            if ticker not in tickers:
+                tickers.append(ticker)
+            confidence = min(confidence, ticker_confidence)
+        return tickers, confidence if tickers else 0.0
+
+    def _build_arguments(
+        self, tool_name: str, ticker: str, query: str
+    ) -> Dict[str, Any]:
+        arguments: Dict[str, Any] = {"ticker": ticker}
+        if tool_name == "get_financial_statements":
+            arguments["statement_type"] = "income_statement"
+            for statement_type, pattern in STATEMENT_TYPE_PATTERNS:
+                if pattern.search(query):
+                    arguments["statement_type"] = statement_type
+                    break
+            arguments["period"] = (
+                "quarterly" if QUARTERLY_PATTERN.search(query) else "annual"
+            )
+        elif tool_name == "calculate_technical_indicators":
+            # No specific indicator named ("technicals") -> the tool's default set
+            indicators = [
+                name for name, pattern in INDICATOR_PATTERNS if pattern.search(query)
+            ]
+            if indicators:
+                arguments["indicators"] = indicators
+        elif tool_name == "calculate_price_analytics":
+            arguments["include"] = [
+                group
+                for name, group in PRICE_ANALYTICS_GROUPS.items()
+                if self.intent_patterns[name].search(query)
+            ]
+        elif tool_name == "get_sec_filings":
+            filing_match = FILING_TYPE_PATTERN.search(query)
+            if filing_match:
+                raw = filing_match.group(1).upper().replace("-", "")
+                arguments["filing_type"] = f"{raw[:-1]}-{raw[-1]}"
+        return arguments
+
+    def _classify(
+        self, query: str
+    ) -> Tuple[List[str], List[str], float, Optional[str]]:
+        # Returns (tools, tickers, confidence, defer_reason)
+        words = WORD_PATTERN.findall(query)
+        if not words:
+            return [], [], 0.0, "empty_query"
+        if len(words) > self.max_words:
+            return [], [], 0.0, "too_long"
+        if DEFER_PATTERN.search(query):
+            return [], [], 0.0, "needs_arguments"
+
+        tickers, ticker_confidence = self._extract_tickers(query)
+        if not tickers:
+            return [], [], 0.0, "no_ticker"
+        if len(tickers) > 1:
+            return [], tickers, 0.0, "multiple_tickers"
+
+        tools = [
+            name
+            for name, pattern in self.intent_patterns.items()
+            if pattern.search(query)
+        ]
+        # "price history" is history, not a quote
+        if "get_ticker_history" in tools and "get_ticker_price" in tools:
+            tools.remove("get_ticker_price")
+        # Several price metrics for one ticker share a single fetch
+        if sum(name in PRICE_ANALYTICS_GROUPS for name in tools) > 1:
+            tools = [name for name in tools if name not in PRICE_ANALYTICS_GROUPS]
+            tools.append("calculate_price_analytics")
+        if not tools:
+            return [], tickers, 0.0, "no_intent"
+        if len(tools) > 2:
+            return tools, tickers, 0.0, "too_many_intents"
+
+        intent_confidence = 1.0 if len(tools) == 1 else 0.9
+        return tools, tickers, ticker_confidence * intent_confidence, None
+
+    def route(self, user_query: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        if not self.enabled or not user_query:
+            return None
+
+        started = time.perf_counter()
+        query = user_query.strip()
+        tools, tickers, confidence, defer_reason = self._classify(query)
+        if defer_reason is None and confidence < self.min_confidence:
+            defer_reason = "low_confidence"
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        with self._lock:
+            self._stats["total"] += 1
+            self._stats["total_routing_time_ms"] += elapsed_ms
+            if defer_reason:
+                self._stats["deferred"] += 1
+                reasons = self._stats["deferred_by_reason"]
+                reasons[defer_reason] = reasons.get(defer_reason, 0) + 1
+            else:
+                self._stats["routed"] += 1
+                per_tool = self._stats["routed_by_tool"]
+                for tool_name in tools:
+                    per_tool[tool_name] = per_tool.get(tool_name, 0) + 1
+
+        if defer_reason:
+            logger.info(
+                f"Intent router deferred to LLM: reason={defer_reason} candidates={tools} tickers={tickers} confidence={confidence:.2f} time_ms={elapsed_ms:.3f} query={query!r}"
+            )
+            return None
+
+        ticker = tickers[0]
+        tool_calls = [
+            {
+                "tool_call_id": f"route_{uuid.uuid4().hex[:12]}",
+                "name": tool_name,
+                "arguments": self._build_arguments(tool_name, ticker, query),
+            }
+            for tool_name in tools
+        ]
+        logger.info(
+            f"Intent router bypassed LLM: tools={tools} ticker={ticker} confidence={confidence:.2f} time_ms={elapsed_ms:.3f} query={query!r}"
+        )
+        return tool_calls
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                **self._stats,
+                "routed_by_tool": dict(self._stats["routed_by_tool"]),
+                "deferred_by_reason": dict(self._stats["deferred_by_reason"]),
+            }
+        total = stats["total"]
+        stats["bypass_rate"] = stats["routed"] / total if total else 0.0
+        stats["avg_routing_time_ms"] = (
+            stats["total_routing_time_ms"] / total if total else 0.0
+        )
+        return stats
+
+
+intent_router = IntentRouter()
@@ -1,8 +1,15 @@
 import json
+import time
+import threading
+from collections import deque
 from openai import OpenAI
 from typing import Optional, List, Dict, Any
 from ..constants.prompts import TOOL_SELECTION_PROMPT
-from ..dataVendors.functionToolSchema import AVAILABLE_TOOLS
+from ..constants.settings import MODEL_ROUTES, LLM_ESCALATION_MODEL
+from .intentRouter import intent_router
+from .toolRetriever import tool_retriever
+from .completionCache import completion_cache
+from .contextBuilder import context_builder
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -14,9 +21,100 @@ client = OpenAI(
 )
 
 
+class ModelRouter:
+    LATENCY_WINDOW = 200  # Recent calls kept per model for percentile stats
+
+    def __init__(
+        self,
+        routes: Dict[str, str] = MODEL_ROUTES,
+        escalation_model: str = LLM_ESCALATION_MODEL,
+    ):
+        self.routes = dict(routes)
+        self.escalation_model = escalation_model
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def model_for(self, stage: str) -> str:
+        return self.routes.get(stage, self.escalation_model)
+
+    def escalation_for(self, model: str) -> Optional[str]:
+        return self.escalation_model if model != self.escalation_model else None
+
+    def _model_stats(self, model: str) -> Dict[str, Any]:
+        # Caller holds the lock
+        if model not in self._stats:
+            self._stats[model] = {
+                "calls": 0,
+                "errors": 0,
+                "malformed_tool_calls": 0,
+                "escalations": 0,
+                "total_latency_ms": 0.0,
+                "latencies_ms": deque(maxlen=self.LATENCY_WINDOW),
+            }
+        return self._stats[model]
+
+    def record_call(self, model: str, latency_ms: float, error: bool = False):
+        with self._lock:
+            stats = self._model_stats(model)
+            stats["calls"] += 1
+            stats["total_latency_ms"] += latency_ms
+            stats["latencies_ms"].append(latency_ms)
+            if error:
+                stats["errors"] += 1
+
+    def record_escalation(self, model: str, malformed: bool = False):
+        with self._lock:
+            stats = self._model_stats(model)
+            stats["escalations"] += 1
+            if malformed:
+                stats["malformed_tool_calls"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snapshot = {
+                model: {**stats, "latencies_ms": sorted(stats["latencies_ms"])}
+                for model, stats in self._stats.items()
+            }
+        per_model = {}
+        for model, stats in snapshot.items():
+            latencies = stats.pop("latencies_ms")
+            calls = stats["calls"]
+            stats["avg_latency_ms"] = (
+                stats["total_latency_ms"] / calls if calls else 0.0
+            )
+            stats["p50_latency_ms"] = (
+                latencies[len(latencies) // 2] if latencies else 0.0
+            )
+            stats["p95_latency_ms"] = (
+                latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+                if latencies
+                else 0.0
+            )
+            stats["error_rate"] = stats["errors"] / calls if calls else 0.0
+            per_model[model] = stats
+        return {"routes": dict(self.routes), "models": per_model}
+
+
+model_router = ModelRouter()
+
+
+def _has_malformed_tool_calls(completion: Any, tools: List[Dict]) -> bool:
+    allowed_names = {tool["function"]["name"] for tool in tools}
+    for tool_call in completion.choices[0].message.tool_calls or []:
+        if tool_call.function.name not in allowed_names:
+            return True
+        try:
+            if not isinstance(json.loads(tool_call.function.arguments or "{}"), dict):
+                return True
+        except json.JSONDecodeError:
+            return True
+    return False
+
+
 class LLM:
     def __init__(self):
         self.client = client
+        self.router = model_router
 
     def chatCompletion(
         self,
@@ -25,7 +123,21 @@ class LLM:
         response_format: Optional[Dict] = None,
         tools: Optional[List[Dict]] = None,
         tool_choice: Optional[str] = "auto",
+        use_cache: bool = True,
     ) -> Any:
+        cache_key = None
+        if use_cache and completion_cache.enabled:
+            cache_key, cache_ttl = completion_cache.make_key(
+                model, messages, tools, tool_choice, response_format
+            )
+            cached_completion = completion_cache.get(cache_key)
+            if cached_completion is not None:
+                logger.info(f"Completion cache hit for model {model}.")
+                return cached_completion
+        else:
+            completion_cache.record_bypass()
+
+        started = time.perf_counter()
         try:
             completion = self.client.chat.completions.create(
                 model=model,
@@ -36,29 +148,101 @@ class LLM:
                 tools=tools,
                 tool_choice=tool_choice,
             )
+            self.router.record_call(model, (time.perf_counter() - started) * 1000)
+            # Malformed tool calls are escalated by routedCompletion; caching
+            # them would replay the bad completion (and the escalation) on
+            # every repeat
+            if (
+                cache_key
+                and completion.choices
+                and not (tools and _has_malformed_tool_calls(completion, tools))
+            ):
+                completion_cache.set(cache_key, completion, cache_ttl)
             return completion
         except Exception as e:
+            self.router.record_call(
+                model, (time.perf_counter() - started) * 1000, error=True
+            )
             logger.error(f"Error during chat completion API call: {e}")
             raise
 
+    def routedCompletion(
+        self,
+        stage: str,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict]] = None,
+        tool_choice: Optional[str] = "auto",
+        use_cache: bool = True,
+    ) -> Any:
+        model = self.router.model_for(stage)
+        escalation_model = self.router.escalation_for(model)
+        try:
+            completion = self.chatCompletion(
+                model=model,
+                messages=messages,
+                tools=tools,
+                tool_choice=tool_choice,
+                use_cache=use_cache,
+            )
+        except Exception as e:
+            if not escalation_model:
+                raise
+            logger.warning(
+                f"Model {model} failed for stage {stage} ({e}); escalating to {escalation_model}."
+            )
+            self.router.record_escalation(model)
+            return self.chatCompletion(
+                model=escalation_model,
+                messages=messages,
+                tools=tools,
+                tool_choice=tool_choice,
+                use_cache=use_cache,
+            )
+
+        if tools and escalation_model and _has_malformed_tool_calls(completion, tools):
+            logger.warning(
+                f"Model {model} emitted malformed tool calls for stage {stage}; escalating to {escalation_model}."
+            )
+            self.router.record_escalation(model, malformed=True)
+            return self.chatCompletion(
+                model=escalation_model,
+                messages=messages,
+                tools=tools,
+                tool_choice=tool_choice,
+                use_cache=use_cache,
+            )
+        return completion
+
     def select_tools(
-        self, user_query: str, chat_history: List[Dict[str, str]]
+        self,
+        user_query: str,
+        chat_history: List[Dict[str, str]],
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
-        formatted_tools = json.dumps(AVAILABLE_TOOLS, indent=2)
+        routed_tool_calls = intent_router.route(user_query)
+        if routed_tool_calls is not None:
+            return routed_tool_calls
+
+        candidate_tools = tool_retriever.select(user_query)
+        formatted_tools = tool_retriever.format_for_prompt(candidate_tools)
         system_prompt = TOOL_SELECTION_PROMPT.format(tools=formatted_tools)
 
         messages = [{"role": "system", "content": system_prompt}]
         messages.extend(chat_history)
         messages.append({"role": "user", "content": user_query})
+        messages, _ = context_builder.build(
+            messages, reserved_tokens=tool_retriever.schema_tokens(candidate_tools)
+        )
 
         logger.info(f"Messages sent for tool selection: {messages}")
 
         try:
-            response = self.chatCompletion(
-                model="llama3-groq-70b-8192-tool-use-preview",
+            response = self.routedCompletion(
+                "tool_selection",
                 messages=messages,
-                tools=AVAILABLE_TOOLS,
+                tools=candidate_tools,
                 tool_choice="auto",
+                use_cache=use_cache,
             )
 
             tool_calls = []
@@ -0,0 +1,36 @@
+import re
+import json
+from typing import List, Dict, Any
+
+# Local token estimate. Not exact for the Llama tokenizer, but close enough to
+# budget prompts without a network call or tokenizer dependency: word pieces
+# are ~4 characters, punctuation is usually its own token.
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Per-message overhead for role markers in the chat template
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    total = 0
+    for piece in TOKEN_PATTERN.findall(text):
+        total += (len(piece) + 3) // 4 if len(piece) > 4 else 1
+    return total
+
+
+def count_message_tokens(message: Dict[str, Any]) -> int:
+    total = MESSAGE_OVERHEAD_TOKENS
+    content = message.get("content")
+    if content:
+        total += count_tokens(content if isinstance(content, str) else str(content))
+    if message.get("tool_calls"):
+        total += count_tokens(json.dumps(message["tool_calls"], separators=(",", ":")))
+    if message.get("name"):
+        total += 1
+    return total
+
+
+def count_messages_tokens(messages: List[Dict[str, Any]]) -> int:
+    return sum(count_message_tokens(message) for message in messages)
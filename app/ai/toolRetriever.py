@@ -0,0 +1,255 @@
+import re
+import json
+import math
+import logging
+import threading
+from typing import Optional, List, Dict, Any
+
+from ..constants.settings import (
+    TOOL_RETRIEVAL_ENABLED,
+    TOOL_RETRIEVAL_TOP_K,
+    TOOL_RETRIEVAL_MIN_SCORE,
+)
+from ..dataVendors.functionToolSchema import AVAILABLE_TOOLS
+from .tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Extra vocabulary users reach for that the schema descriptions don't contain.
+TOOL_KEYWORDS = {
+    "get_ticker_price": "price quote cost trading worth now today current last close",
+    "get_ticker_history": "history historical past performance movement chart range high low volume",
+    "get_company_info": "company profile overview about business sector industry employees market cap valuation pe beta dividend",
+    "get_institutional_investors": "institutional investors shareholders holders owners ownership funds stake",
+    "get_sec_filings": "sec filings filing report 10k 10q 8k annual quarterly edgar",
+    "get_financial_statements": "financials statement revenue sales income profit earnings margin assets liabilities debt equity cash flow capex ebitda eps",
+    "get_financial_news": "news headlines articles events announcement happened latest",
+    "calculate_price_trend": "trend trending sma moving average crossover golden death cross momentum bullish bearish",
+    "calculate_period_statistics": "statistics stats volatility volatile risk deviation std mean median average range",
+    "calculate_returns": "returns return performance gain loss growth annualized cagr ytd invested",
+    "calculate_technical_indicators": "technical indicators indicator ema exponential rsi relative strength overbought oversold macd bollinger bands atr average true range rolling volatility momentum",
+    "calculate_price_analytics": "analytics overview performance summary full analysis complete breakdown statistics returns trend volatility high low all metrics",
+    "screen_price_trends": "screen screener which stocks holdings portfolio watchlist universe list many all above below sma moving average trend",
+}
+
+STOP_WORDS = {
+    "a",
+    "an",
+    "the",
+    "of",
+    "for",
+    "to",
+    "in",
+    "on",
+    "and",
+    "or",
+    "is",
+    "are",
+    "was",
+    "what",
+    "whats",
+    "how",
+    "me",
+    "show",
+    "give",
+    "tell",
+    "get",
+    "please",
+    "can",
+    "you",
+    "i",
+    "my",
+    "it",
+    "its",
+    "this",
+    "that",
+    "with",
+    "by",
+    "be",
+    "do",
+    "does",
+    "stock",
+    "stocks",
+    "ticker",
+    "symbol",
+    "e",
+    "g",
+    "default",
+    "use",
+    "optional",
+    "yyyy",
+    "mm",
+    "dd",
+}
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Tools scoring below this fraction of the best match are dropped from top-k
+RELATIVE_SCORE_CUTOFF = 0.5
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens = []
+    for word in WORD_PATTERN.findall(text.lower().replace("_", " ")):
+        if word in STOP_WORDS:
+            continue
+        # Crude plural folding so "filings"/"filing" and "returns"/"return" match
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def _schema_text(tool: Dict[str, Any]) -> str:
+    function = tool["function"]
+    parts = [function["name"], function.get("description", "")]
+    for param_name, param in (
+        function.get("parameters", {}).get("properties", {}).items()
+    ):
+        if param_name in ("ticker", "data_vendor"):
+            continue  # Shared by every tool, carries no signal
+        parts.append(param_name)
+        parts.append(param.get("description", ""))
+        parts.extend(str(value) for value in param.get("enum", []))
+    parts.append(TOOL_KEYWORDS.get(function["name"], ""))
+    return " ".join(parts)
+
+
+class ToolRetriever:
+    def __init__(
+        self,
+        tools: List[Dict[str, Any]] = AVAILABLE_TOOLS,
+        enabled: bool = TOOL_RETRIEVAL_ENABLED,
+        top_k: int = TOOL_RETRIEVAL_TOP_K,
+        min_score: float = TOOL_RETRIEVAL_MIN_SCORE,
+    ):
+        self.tools = tools
+        self.enabled = enabled
+        self.top_k = top_k
+        self.min_score = min_score
+
+        # Precompile once: compact JSON and token cost per schema
+        self.compact_json = {
+            tool["function"]["name"]: json.dumps(tool, separators=(",", ":"))
+            for tool in tools
+        }
+        self.token_counts = {
+            name: count_tokens(compact) for name, compact in self.compact_json.items()
+        }
+        self.full_set_tokens = sum(self.token_counts.values())
+
+        # Lexical index (BM25)
+        self._doc_terms: List[Dict[str, int]] = []
+        self._doc_lengths: List[int] = []
+        document_frequency: Dict[str, int] = {}
+        for tool in tools:
+            terms = _tokenize(_schema_text(tool))
+            frequencies: Dict[str, int] = {}
+            for term in terms:
+                frequencies[term] = frequencies.get(term, 0) + 1
+            self._doc_terms.append(frequencies)
+            self._doc_lengths.append(len(terms))
+            for term in frequencies:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        self._avg_doc_length = (
+            sum(self._doc_lengths) / len(self._doc_lengths) if tools else 0.0
+        )
+        doc_count = len(tools)
+        self._idf = {
+            term: math.log(1 + (doc_count - freq + 0.5) / (freq + 0.5))
+            for term, freq in document_frequency.items()
+        }
+
+        self._lock = threading.Lock()
+        self._stats = {
+            "selections": 0,
+            "pruned": 0,
+            "fallbacks": 0,
+            "schema_tokens_sent": 0,
+            "schema_tokens_full": 0,
+        }
+        logger.info(
+            f"Tool retriever indexed {doc_count} tool schemas ({self.full_set_tokens} tokens as compact JSON)."
+        )
+
+    def rank(self, query: str) -> List[tuple]:
+        query_terms = set(_tokenize(query or ""))
+        scored = []
+        for index, frequencies in enumerate(self._doc_terms):
+            score = 0.0
+            length_norm = BM25_K1 * (
+                1 - BM25_B + BM25_B * self._doc_lengths[index] / self._avg_doc_length
+            )
+            for term in query_terms:
+                tf = frequencies.get(term)
+                if tf:
+                    score += self._idf[term] * tf * (BM25_K1 + 1) / (tf + length_norm)
+            scored.append((score, index))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return scored
+
+    def select(
+        self, query: Optional[str], top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        top_k = top_k or self.top_k
+        selected = self.tools
+        fallback_reason = None
+        if not self.enabled:
+            fallback_reason = "disabled"
+        else:
+            ranked = self.rank(query)
+            if not ranked or ranked[0][0] < self.min_score:
+                fallback_reason = "no_confident_match"
+            else:
+                cutoff = max(self.min_score, ranked[0][0] * RELATIVE_SCORE_CUTOFF)
+                keep = sorted(
+                    index for score, index in ranked[:top_k] if score >= cutoff
+                )
+                selected = [self.tools[index] for index in keep]
+
+        sent_tokens = self.schema_tokens(selected)
+        with self._lock:
+            self._stats["selections"] += 1
+            self._stats["schema_tokens_sent"] += sent_tokens
+            self._stats["schema_tokens_full"] += self.full_set_tokens
+            if fallback_reason:
+                self._stats["fallbacks"] += 1
+            else:
+                self._stats["pruned"] += 1
+
+        if fallback_reason:
+            logger.info(
+                f"Tool retrieval fell back to full tool set ({fallback_reason}) for query: {query!r}"
+            )
+        else:
+            logger.info(
+                f"Tool retrieval selected {[tool['function']['name'] for tool in selected]} ({sent_tokens}/{self.full_set_tokens} schema tokens)."
+            )
+        return selected
+
+    def schema_tokens(self, tools: Optional[List[Dict[str, Any]]]) -> int:
+        return sum(
+            self.token_counts.get(tool["function"]["name"], 0) for tool in tools or []
+        )
+
+    def format_for_prompt(self, tools: List[Dict[str, Any]]) -> str:
+        return (
+            "["
+            + ",".join(self.compact_json[tool["function"]["name"]] for tool in tools)
+            + "]"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        full = stats["schema_tokens_full"]
+        stats["schema_tokens_saved"] = full - stats["schema_tokens_sent"]
+        stats["schema_token_reduction"] = (
+            stats["schema_tokens_saved"] / full if full else 0.0
+        )
+        return stats
+
+
+tool_retriever = ToolRetriever()
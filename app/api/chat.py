@@ -1,12 +1,34 @@
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Body
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import json
+import time
+import asyncio
 import logging
 
 from ..ai.llm import LLM
-from ..dataVendors import functionTool
+from ..ai.intentRouter import intent_router
+from ..ai.toolRetriever import tool_retriever
+from ..ai.completionCache import completion_cache
+from ..ai.contextBuilder import context_builder
+from .jsonResponse import dumps, dumps_bytes
+from .pagination import snapshot_cache
+from .responseCache import response_cache
+from ..dataVendors.quoteService import quote_service
+from ..dataVendors.companySnapshot import company_snapshots
+from ..dataVendors.fundamentalsFreshness import fundamentals_freshness
+from ..dataVendors.toolExecutor import execute_tool_async, tool_call_key
+from ..dataVendors.vendorCache import vendor_cache
+from ..dataVendors.indicatorState import indicator_store
+from ..constants.settings import (
+    CHAT_MAX_TOOL_ROUNDS,
+    CHAT_DEADLINE_SECONDS,
+    BATCH_TOOL_MAX_CALLS,
+    BATCH_TOOL_TIMEOUT_SECONDS,
+)
+from ..sessions.sessionStoreFactory import SessionStoreFactory
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,6 +53,7 @@ class Message(BaseModel):
 class ChatRequest(BaseModel):
     messages: List[Message]
     data_vendor: DataVendor
+    use_cache: bool = True  # Set False to force fresh LLM completions
 
 
 class ToolCallResponseItem(BaseModel):
@@ -43,9 +66,57 @@ class ToolSelectionResponse(BaseModel):
     tools: List[ToolCallResponseItem]
 
 
+class ExecuteToolsRequest(BaseModel):
+    tool_calls: List[ToolCallResponseItem]
+    data_vendor: DataVendor
+    stream: bool = False  # NDJSON, one line per tool as it completes
+
+
+class SelectAndExecuteRequest(ChatRequest):
+    stream: bool = False
+
+
+class ToolExecutionResult(BaseModel):
+    tool_call_id: str
+    name: str
+    arguments: Dict[str, Any]
+    result: Any
+    elapsed_ms: float
+
+
+class ExecuteToolsResponse(BaseModel):
+    results: List[ToolExecutionResult]
+    elapsed_ms: float
+
+
 class ChatResponse(BaseModel):
     response: str
     tool_calls: Optional[List[Dict]] = None
+    session_id: Optional[str] = None
+    rounds: Optional[List[Dict[str, Any]]] = None  # Per-round agent timings
+
+
+class CreateSessionRequest(BaseModel):
+    data_vendor: DataVendor
+
+
+class CreateSessionResponse(BaseModel):
+    session_id: str
+
+
+class SessionMessageRequest(BaseModel):
+    content: str
+    api_key: Optional[str] = None  # Vendor API key is never persisted with the session
+    use_cache: bool = True
+
+
+class SessionInfo(BaseModel):
+    session_id: str
+    data_vendor: str
+    created_at: float
+    updated_at: float
+    message_count: int
+    messages: Optional[List[Dict[str, Any]]] = None
 
 
 @chatRouter.post("/select-tools", response_model=ToolSelectionResponse)
@@ -58,7 +129,9 @@ async def route_select_tools(chat_request: ChatRequest):
         chat_history = [
             msg.model_dump(exclude_none=True) for msg in chat_request.messages[:-1]
         ]
-        selected_tools = llm.select_tools(user_query, chat_history)
+        selected_tools = llm.select_tools(
+            user_query, chat_history, use_cache=chat_request.use_cache
+        )
 
         tools_to_return = [
             ToolCallResponseItem(
@@ -75,165 +148,451 @@ async def route_select_tools(chat_request: ChatRequest):
         raise HTTPException(status_code=500, detail=f"Error selecting tools: {str(e)}")
 
 
+async def _execute_tool_item(
+    tool: ToolCallResponseItem,
+    data_vendor: DataVendor,
+) -> ToolExecutionResult:
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            execute_tool_async(
+                tool.name, tool.arguments, data_vendor.name, data_vendor.api_key
+            ),
+            timeout=BATCH_TOOL_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        result = {"error": f"Tool {tool.name} timed out."}
+    return ToolExecutionResult(
+        tool_call_id=tool.tool_call_id,
+        name=tool.name,
+        arguments=tool.arguments,
+        result=result,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+
+
+async def _execute_tool_items(
+    tool_calls: List[ToolCallResponseItem],
+    data_vendor: DataVendor,
+    stream: bool,
+):
+    if len(tool_calls) > BATCH_TOOL_MAX_CALLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {BATCH_TOOL_MAX_CALLS} tool calls can be executed per request.",
+        )
+    started = time.perf_counter()
+    tasks = [
+        asyncio.ensure_future(_execute_tool_item(tool, data_vendor))
+        for tool in tool_calls
+    ]
+    logger.info(f"Executing {len(tasks)} tool calls in one batch (stream={stream}).")
+
+    if stream:
+
+        async def result_lines():
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    item = await next_done
+                    yield dumps_bytes(item) + b"\n"
+            finally:
+                for task in tasks:
+                    task.cancel()  # Client went away; stop waiting on the rest
+
+        return StreamingResponse(result_lines(), media_type="application/x-ndjson")
+
+    results = await asyncio.gather(*tasks)
+    return ExecuteToolsResponse(
+        results=results,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+
+
+@chatRouter.post("/execute-tools", response_model=ExecuteToolsResponse)
+async def execute_tools(execute_request: ExecuteToolsRequest):
+    # Runs the tool calls returned by /select-tools server-side, concurrently,
+    # so clients don't need one direct-endpoint round-trip per tool.
+    try:
+        return await _execute_tool_items(
+            execute_request.tool_calls,
+            execute_request.data_vendor,
+            execute_request.stream,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error in /execute-tools endpoint: {e}")
+        raise HTTPException(status_code=500, detail=f"Error executing tools: {str(e)}")
+
+
+@chatRouter.post("/select-and-execute", response_model=ExecuteToolsResponse)
+async def select_and_execute(chat_request: SelectAndExecuteRequest):
+    selection = await route_select_tools(chat_request)
+    try:
+        return await _execute_tool_items(
+            selection.tools, chat_request.data_vendor, chat_request.stream
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error in /select-and-execute endpoint: {e}")
+        raise HTTPException(status_code=500, detail=f"Error executing tools: {str(e)}")
+
+
+def _routed_tool_call_message(
+    routed_tool_calls: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    return {
+        "role": "assistant",
+        "tool_calls": [
+            {
+                "id": tool["tool_call_id"],
+                "type": "function",
+                "function": {
+                    "name": tool["name"],
+                    "arguments": json.dumps(tool["arguments"]),
+                },
+            }
+            for tool in routed_tool_calls
+        ],
+    }
+
+
+async def _run_tool_round(
+    tool_calls: List[Dict[str, Any]],
+    data_vendor_name: str,
+    data_vendor_api_key: Optional[str],
+    tool_results_memo: Dict[str, str],
+    timeout: float,
+) -> Tuple[List[Dict[str, Any]], int]:
+    # Executes one round of tool calls concurrently. Calls already answered
+    # earlier in the turn are served from tool_results_memo.
+    contents: Dict[str, str] = {}
+    pending: Dict[asyncio.Task, Tuple[str, Optional[str]]] = {}
+    reused = 0
+    for tool_call in tool_calls:
+        function_name = tool_call["function"]["name"]
+        raw_arguments = tool_call["function"]["arguments"]
+        try:
+            memo_key = tool_call_key(function_name, json.loads(raw_arguments or "{}"))
+        except (TypeError, json.JSONDecodeError):
+            memo_key = None
+        if memo_key and memo_key in tool_results_memo:
+            contents[tool_call["id"]] = tool_results_memo[memo_key]
+            reused += 1
+            continue
+        task = asyncio.create_task(
+            execute_tool_async(
+                function_name, raw_arguments, data_vendor_name, data_vendor_api_key
+            )
+        )
+        pending[task] = (tool_call["id"], memo_key)
+
+    if pending:
+        done, not_done = await asyncio.wait(pending, timeout=max(timeout, 0.0))
+        for task in done:
+            tool_call_id, memo_key = pending[task]
+            try:
+                function_response = task.result()
+                result_content = dumps(function_response)
+            except Exception as e:
+                logger.exception(f"General error processing tool call: {e}")
+                function_response = None
+                result_content = dumps({"error": "Server error processing tool call."})
+            contents[tool_call_id] = result_content
+            # Only successful results are reused; errors may be transient
+            if (
+                memo_key
+                and isinstance(function_response, dict)
+                and "error" not in function_response
+            ):
+                tool_results_memo[memo_key] = result_content
+        for task in not_done:
+            tool_call_id, _ = pending[task]
+            task.cancel()  # The worker thread finishes on its own; result is dropped
+            contents[tool_call_id] = dumps(
+                {"error": "Tool call timed out before the response deadline."}
+            )
+
+    tool_messages = []
+    for tool_call in tool_calls:
+        function_name = tool_call["function"]["name"]
+        result_content = contents[tool_call["id"]]
+        logger.info(f"Tool {function_name} result chars: {len(result_content)}")
+        tool_messages.append(
+            {
+                "role": "tool",
+                "tool_call_id": tool_call["id"],
+                "name": function_name,
+                "content": result_content,
+            }
+        )
+    return tool_messages, reused
+
+
+async def run_chat(
+    messages: List[Dict[str, Any]],
+    data_vendor_name: str,
+    data_vendor_api_key: Optional[str] = None,
+    use_cache: bool = True,
+) -> Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]:
+    # Runs one conversational turn as a bounded agent loop: up to
+    # CHAT_MAX_TOOL_ROUNDS rounds of (LLM -> concurrent tool calls) within
+    # CHAT_DEADLINE_SECONDS. Returns the final answer, the messages produced
+    # during the turn and per-round timings.
+    current_messages = list(messages)
+    user_query = current_messages[-1].get("content") if current_messages else None
+    if not user_query:
+        raise HTTPException(
+            status_code=400, detail="Last message must contain user query content."
+        )
+
+    system_prompt_date = {
+        "role": "system",
+        "content": f"Today's date is {datetime.today().strftime('%Y-%m-%d')}. Use this for any date calculations if the user doesn't specify a range.",
+    }
+    if not any(
+        msg.get("role") == "system" and "Today" in msg.get("content", "")
+        for msg in current_messages
+    ):
+        current_messages.insert(0, system_prompt_date)
+    turn_start = len(current_messages)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + CHAT_DEADLINE_SECONDS
+    candidate_tools = tool_retriever.select(user_query)
+    tool_results_memo: Dict[str, str] = {}
+    round_timings: List[Dict[str, Any]] = []
+    tool_results_count = 0
+    final_response_content = None
+
+    for round_index in range(CHAT_MAX_TOOL_ROUNDS):
+        round_started = loop.time()
+        routed_tool_calls = (
+            intent_router.route(user_query) if round_index == 0 else None
+        )
+        if routed_tool_calls is not None:
+            # Confident local routing: skip the tool-choice completion entirely
+            response_message = _routed_tool_call_message(routed_tool_calls)
+        else:
+            # After the first round the model may either answer or ask for more data
+            stage = "tool_selection"
+            if round_index > 0:
+                stage = "synthesis" if tool_results_count > 1 else "simple_render"
+            llm_messages, _ = context_builder.build(
+                current_messages,
+                reserved_tokens=tool_retriever.schema_tokens(candidate_tools),
+            )
+            llm_response = await asyncio.to_thread(
+                llm.routedCompletion,
+                stage,
+                messages=llm_messages,
+                tools=candidate_tools,
+                tool_choice="auto",
+                use_cache=use_cache,
+            )
+            response_message = llm_response.choices[0].message.model_dump(
+                exclude_none=True
+            )
+        llm_ms = (loop.time() - round_started) * 1000
+
+        tool_calls_made = response_message.get("tool_calls")
+        if not tool_calls_made:
+            # The model produced its answer; stop early
+            final_response_content = response_message.get("content")
+            round_timings.append(
+                {"round": round_index + 1, "llm_ms": round(llm_ms, 1), "tool_calls": 0}
+            )
+            break
+
+        current_messages.append(response_message)
+        logger.info(
+            f"Round {round_index + 1} tools requested: {[tc['function']['name'] for tc in tool_calls_made]}"
+        )
+        tools_started = loop.time()
+        tool_messages, reused = await _run_tool_round(
+            tool_calls_made,
+            data_vendor_name,
+            data_vendor_api_key,
+            tool_results_memo,
+            timeout=deadline - tools_started,
+        )
+        current_messages.extend(tool_messages)
+        tool_results_count += len(tool_messages)
+        timing = {
+            "round": round_index + 1,
+            "llm_ms": round(llm_ms, 1),
+            "tools_ms": round((loop.time() - tools_started) * 1000, 1),
+            "tool_calls": len(tool_calls_made),
+            "reused_results": reused,
+        }
+        round_timings.append(timing)
+        logger.info(f"Agent round timing: {timing}")
+
+        # Tools may be used by the next round even if retrieval didn't pick them
+        called_names = {tc["function"]["name"] for tc in tool_calls_made}
+        candidate_names = {tool["function"]["name"] for tool in candidate_tools}
+        candidate_tools = candidate_tools + [
+            tool
+            for tool in tool_retriever.tools
+            if tool["function"]["name"] in called_names - candidate_names
+        ]
+
+        if loop.time() >= deadline:
+            logger.warning("Agent loop hit the response deadline; answering now.")
+            break
+
+    if final_response_content is None and tool_results_count:
+        # Round or time budget exhausted: answer from what has been gathered
+        logger.info("Sending tool results back to LLM for final response.")
+        final_started = loop.time()
+        llm_messages, _ = context_builder.build(current_messages)
+        final_llm_response = await asyncio.to_thread(
+            llm.routedCompletion,
+            "synthesis" if tool_results_count > 1 else "simple_render",
+            messages=llm_messages,
+            use_cache=use_cache,
+        )
+        final_response_content = final_llm_response.choices[0].message.content
+        round_timings.append(
+            {
+                "round": "final",
+                "llm_ms": round((loop.time() - final_started) * 1000, 1),
+                "tool_calls": 0,
+            }
+        )
+
+    if not final_response_content:
+        logger.info("No answer or tool calls produced by LLM. Using fallback response.")
+        final_response_content = "I received your request, but I don't have a specific action to take or information to provide based on it. Could you please provide more details or ask a different question?"
+    else:
+        logger.info(
+            f"Final LLM response generated. Length: {len(final_response_content)}"
+        )
+
+    final_message = {"role": "assistant", "content": final_response_content}
+    turn_messages = current_messages[turn_start:] + [final_message]
+    return final_response_content, turn_messages, round_timings
+
+
 @chatRouter.post("/", response_model=ChatResponse)
 async def chat(chat_request: ChatRequest):
     try:
         logger.info(
-            f"Received chat request: {chat_request.model_dump(exclude_none=True)}"
+            f"Received chat request with {len(chat_request.messages)} messages for vendor {chat_request.data_vendor.name}."
         )
         current_messages = [
             msg.model_dump(exclude_none=True) for msg in chat_request.messages
         ]
-        user_query = current_messages[-1].get("content")
-        if not user_query:
-            raise HTTPException(
-                status_code=400, detail="Last message must contain user query content."
-            )
-
-        data_vendor_name = chat_request.data_vendor.name
-        data_vendor_api_key = chat_request.data_vendor.api_key
-
-        system_prompt_date = {
-            "role": "system",
-            "content": f"Today's date is {datetime.today().strftime('%Y-%m-%d')}. Use this for any date calculations if the user doesn't specify a range.",
-        }
-        if not any(
-            msg.get("role") == "system" and "Today" in msg.get("content", "")
-            for msg in current_messages
-        ):
-            current_messages.insert(0, system_prompt_date)
+        final_response_content, _, round_timings = await run_chat(
+            current_messages,
+            chat_request.data_vendor.name,
+            chat_request.data_vendor.api_key,
+            use_cache=chat_request.use_cache,
+        )
+        return ChatResponse(response=final_response_content, rounds=round_timings)
 
-        first_llm_response = llm.chatCompletion(
-            model="llama3-groq-70b-8192-tool-use-preview",
-            messages=current_messages,
-            tools=functionTool.AVAILABLE_TOOLS,
-            tool_choice="auto",
+    except HTTPException as http_exc:
+        logger.error(f"HTTP Exception in chat endpoint: {http_exc.detail}")
+        raise http_exc
+    except Exception as e:
+        logger.exception(f"Unexpected error in chat endpoint: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"An unexpected error occurred: {str(e)}"
         )
 
-        response_message = first_llm_response.choices[0].message
-        current_messages.append(response_message.model_dump(exclude_none=True))
 
-        tool_calls_made = response_message.tool_calls
-        function_results_for_llm = []
+@chatRouter.post("/sessions", response_model=CreateSessionResponse)
+async def create_session(session_request: CreateSessionRequest):
+    session_id = SessionStoreFactory.get_store().create(
+        data_vendor=session_request.data_vendor.name
+    )
+    logger.info(f"Created chat session {session_id}.")
+    return CreateSessionResponse(session_id=session_id)
 
-        if tool_calls_made:
-            logger.info(
-                f"LLM requested tools: {[tc.function.name for tc in tool_calls_made]}"
-            )
-            for tool_call in tool_calls_made:
-                function_name = tool_call.function.name
-                tool_call_id = tool_call.id
-                try:
-                    function_args = json.loads(tool_call.function.arguments)
-                    logger.info(
-                        f"Attempting to call tool: {function_name} with args: {function_args}"
-                    )
-
-                    function_args["data_vendor"] = data_vendor_name
-                    if data_vendor_api_key:
-                        function_args["api_key"] = data_vendor_api_key
-
-                    if hasattr(functionTool, function_name):
-                        function_to_call = getattr(functionTool, function_name)
-                        try:
-                            function_result_data = function_to_call(**function_args)
-                            result_content = json.dumps(function_result_data)
-                            logger.info(
-                                f"Tool {function_name} executed successfully. Result chars: {len(result_content)}"
-                            )
-                        except Exception as func_exc:
-                            logger.exception(
-                                f"Error executing tool {function_name} function: {func_exc}"
-                            )
-                            result_content = json.dumps(
-                                {
-                                    "error": f"Error executing tool {function_name}: {str(func_exc)}"
-                                }
-                            )
-
-                        function_results_for_llm.append(
-                            {
-                                "role": "tool",
-                                "tool_call_id": tool_call_id,
-                                "name": function_name,
-                                "content": result_content,
-                            }
-                        )
-                    else:
-                        logger.warning(
-                            f"Function {function_name} not found in functionTool module."
-                        )
-                        function_results_for_llm.append(
-                            {
-                                "role": "tool",
-                                "tool_call_id": tool_call_id,
-                                "name": function_name,
-                                "content": json.dumps(
-                                    {
-                                        "error": f"Tool {function_name} is defined but not implemented."
-                                    }
-                                ),
-                            }
-                        )
-                except json.JSONDecodeError as json_err:
-                    logger.error(
-                        f"Failed to parse arguments for tool {function_name}: {tool_call.function.arguments}. Error: {json_err}"
-                    )
-                    function_results_for_llm.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": tool_call_id,
-                            "name": function_name,
-                            "content": json.dumps(
-                                {
-                                    "error": f"Invalid arguments format received for tool {function_name}."
-                                }
-                            ),
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(
-                        f"General error processing tool call {function_name}: {e}"
-                    )
-                    function_results_for_llm.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": tool_call_id,
-                            "name": function_name,
-                            "content": json.dumps(
-                                {
-                                    "error": f"Server error processing tool call for {function_name}."
-                                }
-                            ),
-                        }
-                    )
-
-            current_messages.extend(function_results_for_llm)
-
-            logger.info("Sending tool results back to LLM for final response.")
-            final_llm_response = llm.chatCompletion(
-                model="llama3-groq-70b-8192-tool-use-preview", messages=current_messages
+
+@chatRouter.post("/sessions/{session_id}/messages", response_model=ChatResponse)
+async def session_chat(session_id: str, message_request: SessionMessageRequest):
+    try:
+        store = SessionStoreFactory.get_store()
+        session = store.get(session_id)
+        history = store.get_messages(session_id) if session else None
+        if session is None or history is None:
+            raise HTTPException(
+                status_code=404, detail=f"Chat session {session_id} not found."
             )
-            final_response_content = final_llm_response.choices[0].message.content
-            logger.info(
-                f"Final LLM response generated. Length: {len(final_response_content)}"
+        if not message_request.content.strip():
+            raise HTTPException(
+                status_code=400, detail="Message content cannot be empty."
             )
 
-        else:
-            logger.info("No tools requested by LLM. Using initial response.")
-            final_response_content = (
-                response_message.content
-                if response_message.content
-                else "I received your request, but I don't have a specific action to take or information to provide based on it. Could you please provide more details or ask a different question?"
+        logger.info(
+            f"Received message for session {session_id} ({len(history)} stored messages)."
+        )
+        user_message = {"role": "user", "content": message_request.content}
+        final_response_content, turn_messages, round_timings = await run_chat(
+            history + [user_message],
+            session["data_vendor"],
+            message_request.api_key,
+            use_cache=message_request.use_cache,
+        )
+        if not store.append_messages(session_id, [user_message] + turn_messages):
+            # Expired or deleted mid-turn; the reply is still returned, but the
+            # next message on this session gets a 404
+            logger.warning(
+                f"Chat session {session_id} ended during the turn; the reply was not saved to its history."
             )
-
-        return ChatResponse(response=final_response_content)
+        return ChatResponse(
+            response=final_response_content,
+            session_id=session_id,
+            rounds=round_timings,
+        )
 
     except HTTPException as http_exc:
-        logger.error(f"HTTP Exception in chat endpoint: {http_exc.detail}")
+        logger.error(f"HTTP Exception in session chat endpoint: {http_exc.detail}")
         raise http_exc
     except Exception as e:
-        logger.exception(f"Unexpected error in chat endpoint: {e}")
+        logger.exception(f"Unexpected error in session chat endpoint: {e}")
         raise HTTPException(
             status_code=500, detail=f"An unexpected error occurred: {str(e)}"
         )
+
+
+@chatRouter.get("/sessions/{session_id}", response_model=SessionInfo)
+async def get_session(session_id: str, include_messages: bool = False):
+    store = SessionStoreFactory.get_store()
+    session = store.get(session_id)
+    if session is None:
+        raise HTTPException(
+            status_code=404, detail=f"Chat session {session_id} not found."
+        )
+    if include_messages:
+        session["messages"] = store.get_messages(session_id)
+    return SessionInfo(**session)
+
+
+@chatRouter.delete("/sessions/{session_id}")
+async def delete_session(session_id: str):
+    if not SessionStoreFactory.get_store().delete(session_id):
+        raise HTTPException(
+            status_code=404, detail=f"Chat session {session_id} not found."
+        )
+    return {"session_id": session_id, "deleted": True}
+
+
+@chatRouter.get("/metrics")
+async def chat_metrics():
+    return {
+        "intent_router": intent_router.stats(),
+        "tool_retrieval": tool_retriever.stats(),
+        "completion_cache": completion_cache.stats(),
+        "context_builder": context_builder.stats(),
+        "model_router": llm.router.stats(),
+        "vendor_cache": vendor_cache.stats(),
+        "indicator_state": indicator_store.stats(),
+        "historical_page_snapshots": snapshot_cache.stats(),
+        "response_cache": response_cache.stats(),
+        "quotes": quote_service.stats(),
+        "company_snapshots": company_snapshots.stats(),
+        "fundamentals_freshness": fundamentals_freshness.stats(),
+    }
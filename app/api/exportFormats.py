@@ -0,0 +1,184 @@
+import io
+import logging
+from typing import Iterable, Iterator, List, Optional
+
+import pandas as pd
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from ..constants.settings import EXPORT_CHUNK_ROWS
+from ..dataVendors import frameSerializer
+from .jsonResponse import dumps_bytes
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Streaming exports of a DataFrame, written chunk by chunk so the response
+# never holds more than EXPORT_CHUNK_ROWS rows of encoded output at once.
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+EXPORT_EXTENSIONS = {
+    "csv": "csv",
+    "ndjson": "ndjson",
+    "arrow": "arrows",
+    "parquet": "parquet",
+}
+# Accept values clients use besides the registered media types
+MEDIA_TYPE_ALIASES = {
+    "application/x-parquet": "parquet",
+    "application/jsonl": "ndjson",
+    "application/x-jsonlines": "ndjson",
+}
+
+
+def negotiate_format(accept: Optional[str]) -> Optional[str]:
+    # Highest-q export media type in the Accept header that can be produced;
+    # None means plain JSON (also for */* and application/json)
+    if not accept:
+        return None
+    by_media_type = {
+        media_type: export_format
+        for export_format, media_type in EXPORT_MEDIA_TYPES.items()
+    }
+    by_media_type.update(MEDIA_TYPE_ALIASES)
+    candidates = []
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = [token.strip() for token in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, position, media_type.lower()))
+    for _, _, media_type in sorted(candidates):
+        if media_type in ("application/json", "*/*", "application/*"):
+            return None
+        export_format = by_media_type.get(media_type)
+        if export_format:
+            return export_format
+    return None
+
+
+def _chunks(frame: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(frame), max(chunk_rows, 1)):
+        yield frame.iloc[start : start + chunk_rows]
+
+
+def _csv_chunks(
+    frame: pd.DataFrame, chunk_rows: int, int_columns: List[str]
+) -> Iterator[bytes]:
+    header = True
+    for chunk in _chunks(frame, chunk_rows):
+        chunk = chunk.set_axis(frameSerializer.labels(chunk.index), axis=0)
+        for column in int_columns:
+            if column in chunk:
+                chunk = chunk.assign(**{column: chunk[column].astype("Int64")})
+        yield chunk.to_csv(index_label="date", header=header).encode("utf-8")
+        header = False
+    if header:  # Empty frame: header row only
+        yield frame.iloc[:0].to_csv(index_label="date").encode("utf-8")
+
+
+def _ndjson_chunks(
+    frame: pd.DataFrame, chunk_rows: int, int_columns: List[str]
+) -> Iterator[bytes]:
+    for chunk in _chunks(frame, chunk_rows):
+        records = frameSerializer.frame_to_records(chunk, int_columns=int_columns)
+        yield b"".join(dumps_bytes(record) + b"\n" for record in records)
+
+
+class _ChunkSink(io.RawIOBase):
+    # Write-only buffer drained after every batch. tell() keeps counting the
+    # bytes already sent, which the Parquet writer needs for its footer.
+    def __init__(self):
+        super().__init__()
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _arrow_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    # Native timestamps (and timezone) kept; notebooks read them zero-copy
+    return frame.rename_axis("date").reset_index()
+
+
+def _arrow_chunks(
+    frame: pd.DataFrame, chunk_rows: int, export_format: str
+) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    schema = pa.Schema.from_pandas(_arrow_frame(frame.iloc[:0]), preserve_index=False)
+    if export_format == "parquet":
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+    else:
+        writer = pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema)
+    try:
+        for chunk in _chunks(frame, chunk_rows):
+            # One record batch (Parquet: one row group) per chunk
+            writer.write_batch(
+                pa.RecordBatch.from_pandas(
+                    _arrow_frame(chunk), schema=schema, preserve_index=False
+                )
+            )
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def export_response(
+    frame: pd.DataFrame,
+    export_format: str,
+    filename: str,
+    int_columns: Iterable[str] = (),
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> StreamingResponse:
+    # The frame's index is written as a leading "date" column
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported export format: {export_format}"
+        )
+    int_columns = list(int_columns)
+    if export_format == "csv":
+        body = _csv_chunks(frame, chunk_rows, int_columns)
+    elif export_format == "ndjson":
+        body = _ndjson_chunks(frame, chunk_rows, int_columns)
+    else:
+        body = _arrow_chunks(frame, chunk_rows, export_format)
+    logger.info(f"Streaming {len(frame)} rows as {export_format} ({filename}).")
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{EXPORT_EXTENSIONS[export_format]}"'
+        },
+    )
@@ -0,0 +1,119 @@
+import json
+import time
+import hashlib
+import secrets
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from ..constants.settings import HTTP_CACHE_MAX_AGES
+
+# Conditional GET for the direct data endpoints. ETags are derived from the
+# vendor cache version of the data behind a response, so a matching
+# If-None-Match is answered with a 304 before anything is fetched or
+# serialized. Cache versions restart with the process, hence PROCESS_TAG.
+
+PROCESS_TAG = secrets.token_hex(8)
+
+
+def cache_control(route: str) -> str:
+    return f"public, max-age={HTTP_CACHE_MAX_AGES.get(route, 0)}"
+
+
+def entry_version(info: Optional[Dict[str, Any]]) -> Optional[int]:
+    # Version of a live cache entry (VendorCache.entry_info); None otherwise
+    if info is None or info["expires_at"] <= time.time():
+        return None
+    return info["version"]
+
+
+def data_version(vendor: Any, method: str, **kwargs) -> Optional[int]:
+    # None when the vendor cache is disabled or holds no live entry yet
+    cache_info = getattr(vendor, "cache_info", None)
+    if cache_info is None:
+        return None
+    return entry_version(cache_info(method, **kwargs))
+
+
+def accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "")
+
+
+def make_etag(request: Request, versions: Iterable[Optional[int]]) -> Optional[str]:
+    # Strong validator for this exact query over these data versions
+    versions = list(versions)
+    if not versions or any(version is None for version in versions):
+        return None
+    raw = json.dumps(
+        [
+            PROCESS_TAG,
+            request.url.path,
+            sorted(request.query_params.multi_items()),
+            request.headers.get("accept", ""),
+            # GZipMiddleware leaves ETags alone, so the representation the
+            # client can receive (gzip or identity) is part of the tag
+            accepts_gzip(request),
+            versions,
+        ]
+    )
+    return f'"{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def vendor_versions(
+    vendor: Any, calls: Iterable[Tuple[str, Dict[str, Any]]]
+) -> List[Optional[int]]:
+    # Data versions of the cached vendor calls ((method, kwargs) pairs) a
+    # response is built from
+    return [data_version(vendor, method, **kwargs) for method, kwargs in calls]
+
+
+def vendor_etag(
+    request: Request, vendor: Any, calls: Iterable[Tuple[str, Dict[str, Any]]]
+) -> Optional[str]:
+    # None until all of the calls are cached
+    return make_etag(request, vendor_versions(vendor, calls))
+
+
+def _body_etag(request: Request, body: bytes) -> str:
+    digest = hashlib.sha256(body + (b"gzip" if accepts_gzip(request) else b""))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(
+    request: Request, etag: Optional[str], route: str
+) -> Optional[Response]:
+    if etag is None or not _matches(request.headers.get("if-none-match"), etag):
+        return None
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": cache_control(route)}
+    )
+
+
+def finalize(
+    request: Request, response: Response, route: str, etag: Optional[str] = None
+) -> Response:
+    # Without a data version (cache disabled, empty or computed results) the
+    # ETag is a hash of the encoded body; the 304 then only saves bandwidth
+    if etag is None and not isinstance(response, StreamingResponse):
+        etag = _body_etag(request, response.body)
+        unchanged = not_modified(request, etag, route)
+        if unchanged is not None:
+            return unchanged
+    if etag is not None:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control(route)
+    return response
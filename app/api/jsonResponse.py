@@ -0,0 +1,69 @@
+import math
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# orjson writes NaN/Infinity as null, so responses are always valid JSON
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    # Types neither encoder handles natively: numpy/pandas scalars and friends
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True)
+    if isinstance(value, np.generic):
+        value = value.item()
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if value is pd.NaT:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (pd.Series, pd.Index)):
+        return value.tolist()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_bytes(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+def dumps(content: Any) -> str:
+    # For tool messages sent to the LLM, which must be str
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS).decode()
+
+
+class FastJSONResponse(JSONResponse):
+    # App-wide default response class, encoded with orjson
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
+
+
+def model_response(content: Any, status_code: int = 200) -> FastJSONResponse:
+    # Serializes already-validated models once. Returning a Response skips
+    # FastAPI's response_model re-validation; response_model still drives the docs.
+    if isinstance(content, BaseModel):
+        content = content.model_dump(by_alias=True)
+    elif isinstance(content, list):
+        content = [
+            item.model_dump(by_alias=True) if isinstance(item, BaseModel) else item
+            for item in content
+        ]
+    return FastJSONResponse(content=content, status_code=status_code)
@@ -0,0 +1,83 @@
+import json
+import base64
+import hashlib
+import binascii
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+from fastapi import HTTPException
+
+from ..constants.settings import (
+    HISTORICAL_PAGE_SNAPSHOT_SECONDS,
+    HISTORICAL_PAGE_SNAPSHOT_ENTRIES,
+)
+from ..dataVendors.vendorCache import VendorCache
+
+# Keyset pagination over a date-indexed frame. The cursor carries the last
+# index value served, so pages stay stable and gap-free even if the range
+# is refetched between requests.
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Fetched ranges kept while a client walks its pages; later pages are sliced
+# from the snapshot instead of going upstream
+snapshot_cache = VendorCache(
+    max_entries=HISTORICAL_PAGE_SNAPSHOT_ENTRIES,
+    ttls={"get_prices": HISTORICAL_PAGE_SNAPSHOT_SECONDS},
+)
+
+
+def query_fingerprint(params: Dict[str, Any]) -> str:
+    # Ties a cursor to the query that produced it
+    encoded = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def encode_cursor(fingerprint: str, after: pd.Timestamp) -> str:
+    payload = json.dumps(
+        {"q": fingerprint, "after": after.isoformat()}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, fingerprint: str) -> pd.Timestamp:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        after = pd.Timestamp(payload["after"])
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+    if payload.get("q") != fingerprint:
+        raise HTTPException(
+            status_code=400,
+            detail="Pagination cursor does not match this query; send it with the original query parameters.",
+        )
+    return after
+
+
+def _align(after: pd.Timestamp, index: pd.DatetimeIndex) -> pd.Timestamp:
+    if index.tz is not None:
+        return (
+            after.tz_convert(index.tz)
+            if after.tz is not None
+            else after.tz_localize(index.tz)
+        )
+    return after.tz_localize(None) if after.tz is not None else after
+
+
+def page_frame(
+    frame: pd.DataFrame, limit: int, after: Optional[pd.Timestamp] = None
+) -> Tuple[pd.DataFrame, Optional[pd.Timestamp]]:
+    # Rows strictly after `after` in index order, plus the cursor position
+    # for the next page (None on the last page)
+    if not frame.index.is_monotonic_increasing:
+        frame = frame.sort_index(kind="stable")
+    start = 0
+    if after is not None and len(frame):
+        index = frame.index
+        if isinstance(index, pd.DatetimeIndex):
+            after = _align(after, index)
+        start = int(index.searchsorted(after, side="right"))
+    page = frame.iloc[start : start + limit]
+    has_more = start + limit < len(frame)
+    return page, page.index[-1] if has_more and len(page) else None
@@ -0,0 +1,221 @@
+import gzip
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from ..constants.settings import (
+    GZIP_COMPRESS_LEVEL,
+    GZIP_MINIMUM_SIZE,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_MAX_ENTRIES,
+)
+from ..dataVendors.vendorCache import vendor_cache
+from . import httpCaching
+
+logger = logging.getLogger(__name__)
+
+# Final encoded bodies of hot direct endpoints, keyed by route, resolved query
+# parameters and the vendor data versions they were built from. A hit skips
+# fetching, cleaning, model validation and JSON encoding. Bodies built from
+# data the vendor cache refreshes or invalidates are dropped right away.
+
+VendorCalls = List[Tuple[str, Dict[str, Any]]]
+
+
+class _CachedBody:
+    __slots__ = ("body", "gzip_body", "media_type", "vendor_name", "calls")
+
+    def __init__(
+        self, body: bytes, media_type: str, vendor_name: str, calls: VendorCalls
+    ):
+        self.body = body
+        self.gzip_body: Optional[bytes] = None
+        self.media_type = media_type
+        self.vendor_name = vendor_name
+        self.calls = calls
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gzip_body or b"")
+
+    def depends_on(self, event: str, info: Dict[str, Any]) -> bool:
+        vendor = info.get("vendor")
+        if vendor and vendor.lower() != self.vendor_name.lower():
+            return False
+        for method, kwargs in self.calls:
+            if info.get("method") and info["method"] != method:
+                continue
+            if event == "refresh":
+                refreshed = info.get("kwargs") or {}
+                if all(refreshed.get(name) == value for name, value in kwargs.items()):
+                    return True
+            elif info.get("ticker") is None or info["ticker"] == kwargs.get("ticker"):
+                return True
+        return False
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        enabled: bool = RESPONSE_CACHE_ENABLED,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, _CachedBody]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "gzip_encodes": 0,
+        }
+
+    @staticmethod
+    def make_key(route: str, params: Dict[str, Any], versions: List[int]) -> str:
+        return f"{route}:{json.dumps(params, sort_keys=True, default=str)}:{versions}"
+
+    def _get(self, key: str) -> Optional[_CachedBody]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry
+
+    def _put(self, key: str, entry: _CachedBody):
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._stats["stores"] += 1
+            self._evict()
+
+    def _evict(self):
+        # Caller holds the lock
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._stats["evictions"] += 1
+
+    def _gzip_body(self, key: str, entry: _CachedBody) -> bytes:
+        # Compressed on the first gzip-capable hit, then kept with the entry
+        if entry.gzip_body is not None:
+            return entry.gzip_body
+        compressed = gzip.compress(entry.body, compresslevel=GZIP_COMPRESS_LEVEL)
+        with self._lock:
+            if entry.gzip_body is None and self._entries.get(key) is entry:
+                entry.gzip_body = compressed
+                self._bytes += len(compressed)
+                self._stats["gzip_encodes"] += 1
+                self._evict()
+        return compressed
+
+    def _respond(
+        self,
+        request: Request,
+        route: str,
+        key: str,
+        entry: _CachedBody,
+        etag: Optional[str],
+    ) -> Response:
+        body, headers = entry.body, {}
+        if len(body) >= GZIP_MINIMUM_SIZE and httpCaching.accepts_gzip(request):
+            # Already encoded; GZipMiddleware passes it through unchanged
+            body = self._gzip_body(key, entry)
+            headers = {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        response = Response(content=body, media_type=entry.media_type, headers=headers)
+        return httpCaching.finalize(request, response, route, etag)
+
+    def serve(
+        self,
+        request: Request,
+        route: str,
+        params: Dict[str, Any],
+        vendor: Any,
+        calls: VendorCalls,
+        build: Callable[[], Response],
+    ) -> Response:
+        # Conditional GET, then a byte-cache lookup, and only then build();
+        # bodies are reused only while every vendor call they read is cached
+        versions = httpCaching.vendor_versions(vendor, calls)
+        etag = httpCaching.make_etag(request, versions)
+        unchanged = httpCaching.not_modified(request, etag, route)
+        if unchanged is not None:
+            return unchanged
+        if self.enabled and etag is not None:
+            key = self.make_key(route, params, versions)
+            entry = self._get(key)
+            if entry is not None:
+                return self._respond(request, route, key, entry, etag)
+
+        response = build()
+        versions = httpCaching.vendor_versions(vendor, calls)
+        etag = httpCaching.make_etag(request, versions)
+        if (
+            self.enabled
+            and etag is not None
+            and response.status_code == 200
+            and not isinstance(response, StreamingResponse)
+        ):
+            self._put(
+                self.make_key(route, params, versions),
+                _CachedBody(
+                    bytes(response.body), response.media_type, vendor.vendor_name, calls
+                ),
+            )
+        return httpCaching.finalize(request, response, route, etag)
+
+    def on_vendor_event(self, event: str, info: Dict[str, Any]):
+        # Vendor cache listener: drop bodies built from refreshed or
+        # invalidated data
+        with self._lock:
+            removed = [
+                key
+                for key, entry in self._entries.items()
+                if entry.depends_on(event, info)
+            ]
+            for key in removed:
+                self._bytes -= self._entries.pop(key).size
+            self._stats["invalidations"] += len(removed)
+        if removed:
+            logger.info(
+                f"Dropped {len(removed)} cached responses after vendor {event} of {info.get('method')} ({info.get('ticker')})."
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+response_cache = ResponseCache()
+vendor_cache.add_listener(response_cache.on_vendor_event)
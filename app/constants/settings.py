@@ -0,0 +1,175 @@
+import os
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+# --- Intent Router ---
+INTENT_ROUTER_ENABLED = _env_flag("INTENT_ROUTER_ENABLED", "true")
+INTENT_ROUTER_MIN_CONFIDENCE = float(os.getenv("INTENT_ROUTER_MIN_CONFIDENCE", "0.85"))
+INTENT_ROUTER_MAX_WORDS = int(os.getenv("INTENT_ROUTER_MAX_WORDS", "12"))
+
+# --- Tool Retrieval (schema pruning) ---
+TOOL_RETRIEVAL_ENABLED = _env_flag("TOOL_RETRIEVAL_ENABLED", "true")
+TOOL_RETRIEVAL_TOP_K = int(os.getenv("TOOL_RETRIEVAL_TOP_K", "3"))
+TOOL_RETRIEVAL_MIN_SCORE = float(os.getenv("TOOL_RETRIEVAL_MIN_SCORE", "1.0"))
+
+# --- LLM Completion Cache ---
+COMPLETION_CACHE_ENABLED = _env_flag("COMPLETION_CACHE_ENABLED", "true")
+COMPLETION_CACHE_MAX_ENTRIES = int(os.getenv("COMPLETION_CACHE_MAX_ENTRIES", "2048"))
+# Used for completions without embedded tool results (e.g. tool selection)
+COMPLETION_CACHE_DEFAULT_TTL = int(os.getenv("COMPLETION_CACHE_DEFAULT_TTL", "300"))
+
+# --- Chat Sessions ---
+SESSION_STORE = os.getenv("SESSION_STORE", "memory")  # "memory" or "sqlite"
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "1000"))
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "86400"))
+SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", "data/sessions.db")
+
+# --- Context Assembly ---
+# Prompt tokens available per LLM call: model context (8192) minus the
+# completion reserve (max_tokens=4096). Tool schemas are subtracted per call.
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "4096"))
+CONTEXT_KEEP_RECENT_TURNS = int(os.getenv("CONTEXT_KEEP_RECENT_TURNS", "2"))
+CONTEXT_SUMMARY_MAX_ITEMS = int(os.getenv("CONTEXT_SUMMARY_MAX_ITEMS", "3"))
+CONTEXT_SUMMARY_MAX_CHARS = int(os.getenv("CONTEXT_SUMMARY_MAX_CHARS", "160"))
+
+# --- LLM Model Routing ---
+LLM_LARGE_MODEL = os.getenv("LLM_LARGE_MODEL", "llama3-groq-70b-8192-tool-use-preview")
+LLM_SMALL_MODEL = os.getenv("LLM_SMALL_MODEL", "llama-3.1-8b-instant")
+# Stage -> model. tool_selection: choosing tools and arguments; simple_render:
+# answering from a single tool result; synthesis: combining several results.
+MODEL_ROUTES = {
+    "tool_selection": os.getenv("LLM_MODEL_TOOL_SELECTION", LLM_SMALL_MODEL),
+    "simple_render": os.getenv("LLM_MODEL_SIMPLE_RENDER", LLM_SMALL_MODEL),
+    "synthesis": os.getenv("LLM_MODEL_SYNTHESIS", LLM_LARGE_MODEL),
+}
+# Model used when the routed model fails or emits malformed tool calls
+LLM_ESCALATION_MODEL = os.getenv("LLM_ESCALATION_MODEL", LLM_LARGE_MODEL)
+
+# --- Agent Loop ---
+CHAT_MAX_TOOL_ROUNDS = int(os.getenv("CHAT_MAX_TOOL_ROUNDS", "3"))
+# Wall-clock budget for tool rounds in one /chat request; the final answer
+# is produced from whatever has been gathered when it runs out.
+CHAT_DEADLINE_SECONDS = float(os.getenv("CHAT_DEADLINE_SECONDS", "25"))
+
+# --- Vendor Data Cache ---
+VENDOR_CACHE_ENABLED = _env_flag("VENDOR_CACHE_ENABLED", "true")
+VENDOR_CACHE_MAX_ENTRIES = int(os.getenv("VENDOR_CACHE_MAX_ENTRIES", "1024"))
+# Seconds each vendor method's data stays fresh; 0 disables caching for it.
+VENDOR_CACHE_TTLS = {
+    "get_prices": 60,
+    "get_company_info": 3600,
+    "get_financial_statements": 6 * 3600,
+    "get_institutional_holders": 6 * 3600,
+    "get_sec_filings": 3600,
+    "get_news": 300,
+    "get_earnings_history": 6 * 3600,
+    "get_earnings_calendar": 24 * 3600,
+}
+# Upper bound on tools executed by one /chat/execute-tools request
+BATCH_TOOL_MAX_CALLS = int(os.getenv("BATCH_TOOL_MAX_CALLS", "16"))
+BATCH_TOOL_TIMEOUT_SECONDS = float(os.getenv("BATCH_TOOL_TIMEOUT_SECONDS", "30"))
+
+# --- Multi-ticker Analytics ---
+SCREEN_MAX_TICKERS = int(os.getenv("SCREEN_MAX_TICKERS", "300"))
+SCREEN_FETCH_CONCURRENCY = int(os.getenv("SCREEN_FETCH_CONCURRENCY", "8"))
+# /bulk/* endpoints: symbols per request and per-request fetch concurrency
+BULK_MAX_TICKERS = int(os.getenv("BULK_MAX_TICKERS", "100"))
+BULK_FETCH_CONCURRENCY = int(os.getenv("BULK_FETCH_CONCURRENCY", "8"))
+
+# --- Price Exports ---
+# Rows per chunk when streaming CSV/NDJSON/Arrow/Parquet exports
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "10000"))
+# Cursor pagination of /historical_prices: largest page, and how long the
+# fetched range is kept so later pages are sliced from it, not refetched
+HISTORICAL_PAGE_MAX_ROWS = int(os.getenv("HISTORICAL_PAGE_MAX_ROWS", "5000"))
+HISTORICAL_PAGE_SNAPSHOT_SECONDS = int(
+    os.getenv("HISTORICAL_PAGE_SNAPSHOT_SECONDS", "900")
+)
+HISTORICAL_PAGE_SNAPSHOT_ENTRIES = int(
+    os.getenv("HISTORICAL_PAGE_SNAPSHOT_ENTRIES", "64")
+)
+
+# --- HTTP Caching (direct data endpoints) ---
+# Responses smaller than this are sent uncompressed
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+GZIP_COMPRESS_LEVEL = int(os.getenv("GZIP_COMPRESS_LEVEL", "6"))
+# Cache-Control max-age per endpoint, in line with how often its data changes
+HTTP_CACHE_MAX_AGES = {
+    "company_info": 3600,
+    "key_metrics": 3600,
+    "company_snapshot": 3600,
+    "earnings": 6 * 3600,
+    "financial_statements": 6 * 3600,
+    "institutional_holders": 6 * 3600,
+    "sec_filings": 3600,
+    "news": 300,
+    "historical_prices": 60,
+    # Ranges that ended before today no longer change
+    "historical_prices_closed": 24 * 3600,
+    "analysis": 60,
+}
+
+# --- Response Byte Cache (hot direct endpoints) ---
+RESPONSE_CACHE_ENABLED = _env_flag("RESPONSE_CACHE_ENABLED", "true")
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+# Encoded and gzipped bodies together
+RESPONSE_CACHE_MAX_BYTES = int(
+    os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+# --- Fundamentals Freshness (event-driven invalidation) ---
+# With the controller on, statements and earnings history are kept until a
+# new filing or earnings date makes them stale, not for a fixed TTL
+FUNDAMENTALS_FRESHNESS_ENABLED = _env_flag("FUNDAMENTALS_FRESHNESS_ENABLED", "true")
+FUNDAMENTALS_TTL_SECONDS = int(
+    os.getenv("FUNDAMENTALS_TTL_SECONDS", str(30 * 24 * 3600))
+)
+# How often tracked tickers' filings and earnings calendars are checked
+FUNDAMENTALS_CHECK_INTERVAL_SECONDS = float(
+    os.getenv("FUNDAMENTALS_CHECK_INTERVAL_SECONDS", "3600")
+)
+FUNDAMENTALS_CHECK_CONCURRENCY = int(os.getenv("FUNDAMENTALS_CHECK_CONCURRENCY", "4"))
+# After an event vendors can lag (statements post days after the release), so
+# entries refetched within this window only live FUNDAMENTALS_SETTLE_TTL_SECONDS
+FUNDAMENTALS_SETTLE_SECONDS = int(
+    os.getenv("FUNDAMENTALS_SETTLE_SECONDS", str(3 * 24 * 3600))
+)
+FUNDAMENTALS_SETTLE_TTL_SECONDS = int(
+    os.getenv("FUNDAMENTALS_SETTLE_TTL_SECONDS", "3600")
+)
+FUNDAMENTALS_MAX_TICKERS = int(os.getenv("FUNDAMENTALS_MAX_TICKERS", "500"))
+
+# --- Trading Calendar (daily fetch windows) ---
+# Default windows of the history and statistics/returns tools, in sessions
+HISTORY_DEFAULT_BARS = int(os.getenv("HISTORY_DEFAULT_BARS", "21"))
+STATISTICS_DEFAULT_BARS = int(os.getenv("STATISTICS_DEFAULT_BARS", "252"))
+# Extra sessions fetched for fixed-length lookbacks (SMAs, indicator warmup),
+# covering unscheduled closures the calendar does not know about
+TRADING_WINDOW_SLACK_BARS = int(os.getenv("TRADING_WINDOW_SLACK_BARS", "2"))
+
+# --- Company Snapshots (cleaned info shared by company endpoints and tools) ---
+COMPANY_SNAPSHOT_MAX_ENTRIES = int(os.getenv("COMPANY_SNAPSHOT_MAX_ENTRIES", "1024"))
+
+# --- Live Quotes ---
+QUOTE_POLL_INTERVAL_SECONDS = float(os.getenv("QUOTE_POLL_INTERVAL_SECONDS", "15"))
+QUOTE_POLL_CONCURRENCY = int(os.getenv("QUOTE_POLL_CONCURRENCY", "8"))
+# Tickers read by tools stay in the poll set this long after the last read
+QUOTE_IDLE_SECONDS = int(os.getenv("QUOTE_IDLE_SECONDS", "300"))
+QUOTE_MAX_TICKERS_PER_CONNECTION = int(
+    os.getenv("QUOTE_MAX_TICKERS_PER_CONNECTION", "100")
+)
+# Pending updates per WebSocket client; the oldest are dropped beyond this
+QUOTE_QUEUE_SIZE = int(os.getenv("QUOTE_QUEUE_SIZE", "256"))
+
+# --- Incremental Indicator State ---
+INDICATOR_STATE_ENABLED = _env_flag("INDICATOR_STATE_ENABLED", "true")
+# Longest SMA window kept incrementally (the /trend endpoint allows up to 300)
+INDICATOR_MAX_WINDOW = int(os.getenv("INDICATOR_MAX_WINDOW", "300"))
+INDICATOR_DEFAULT_WINDOWS = (50, 200)
+INDICATOR_STATE_DB_PATH = os.getenv("INDICATOR_STATE_DB_PATH", "data/indicators.db")
+INDICATOR_PERSIST_INTERVAL_SECONDS = int(
+    os.getenv("INDICATOR_PERSIST_INTERVAL_SECONDS", "30")
+)
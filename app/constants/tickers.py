@@ -0,0 +1,103 @@
+# Ticker -> common company names used in user queries (lowercase).
+# Used by the local intent router to resolve tickers without an LLM call.
+TICKER_ALIASES = {
+    "AAPL": ["apple"],
+    "MSFT": ["microsoft"],
+    "GOOGL": ["google", "alphabet"],
+    "GOOG": [],
+    "AMZN": ["amazon"],
+    "META": ["meta", "facebook", "meta platforms"],
+    "NVDA": ["nvidia"],
+    "TSLA": ["tesla"],
+    "BRK-B": ["berkshire", "berkshire hathaway"],
+    "AVGO": ["broadcom"],
+    "ORCL": ["oracle"],
+    "AMD": ["advanced micro devices"],
+    "INTC": ["intel"],
+    "QCOM": ["qualcomm"],
+    "TXN": ["texas instruments"],
+    "MU": ["micron"],
+    "ARM": [],
+    "TSM": ["tsmc", "taiwan semiconductor"],
+    "ASML": ["asml"],
+    "ADBE": ["adobe"],
+    "CRM": ["salesforce"],
+    "NOW": ["servicenow"],
+    "SNOW": ["snowflake"],
+    "PLTR": ["palantir"],
+    "SHOP": ["shopify"],
+    "UBER": ["uber"],
+    "ABNB": ["airbnb"],
+    "NFLX": ["netflix"],
+    "DIS": ["disney", "walt disney"],
+    "CSCO": ["cisco"],
+    "IBM": ["ibm"],
+    "PYPL": ["paypal"],
+    "SQ": ["block inc"],
+    "COIN": ["coinbase"],
+    "V": ["visa"],
+    "MA": ["mastercard"],
+    "JPM": ["jpmorgan", "jp morgan", "jpmorgan chase"],
+    "BAC": ["bank of america"],
+    "WFC": ["wells fargo"],
+    "C": ["citigroup", "citi"],
+    "GS": ["goldman sachs", "goldman"],
+    "MS": ["morgan stanley"],
+    "BLK": ["blackrock"],
+    "SCHW": ["charles schwab", "schwab"],
+    "AXP": ["american express", "amex"],
+    "WMT": ["walmart"],
+    "COST": ["costco"],
+    "TGT": ["target corp", "target corporation"],
+    "HD": ["home depot"],
+    "LOW": ["lowe's", "lowes"],
+    "NKE": ["nike"],
+    "SBUX": ["starbucks"],
+    "MCD": ["mcdonald's", "mcdonalds"],
+    "KO": ["coca-cola", "coca cola", "coke"],
+    "PEP": ["pepsico", "pepsi"],
+    "PG": ["procter & gamble", "procter and gamble"],
+    "JNJ": ["johnson & johnson", "johnson and johnson"],
+    "PFE": ["pfizer"],
+    "MRK": ["merck"],
+    "LLY": ["eli lilly", "lilly"],
+    "ABBV": ["abbvie"],
+    "UNH": ["unitedhealth", "united health"],
+    "CVS": ["cvs"],
+    "XOM": ["exxon", "exxonmobil", "exxon mobil"],
+    "CVX": ["chevron"],
+    "BA": ["boeing"],
+    "CAT": ["caterpillar"],
+    "GE": ["general electric"],
+    "F": ["ford"],
+    "GM": ["general motors"],
+    "RIVN": ["rivian"],
+    "T": ["at&t"],
+    "VZ": ["verizon"],
+    "TMUS": ["t-mobile", "tmobile"],
+    "SPY": [],
+    "QQQ": [],
+    "DIA": [],
+    "IWM": [],
+}
+
+# Upper-case words that look like tickers but almost never mean one in a query.
+TICKER_STOPWORDS = {
+    "A",
+    "I",
+    "CEO",
+    "CFO",
+    "SEC",
+    "PE",
+    "EPS",
+    "SMA",
+    "EMA",
+    "ETF",
+    "USD",
+    "IPO",
+    "YTD",
+    "TTM",
+    "AI",
+    "US",
+    "OK",
+}
@@ -1,10 +1,37 @@
+import math
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict, Iterable
 import pandas as pd
 
+QUOTE_FIELDS = (
+    "price",
+    "previous_close",
+    "volume",
+    "year_high",
+    "year_low",
+    "market_cap",
+)
+# Need a year of daily bars instead of a few days
+YEAR_RANGE_FIELDS = ("year_high", "year_low")
+
+
+def _finite(value: Any) -> Optional[float]:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
 
 class BaseDataVendor(ABC):
 
+    def credential_scope(self) -> str:
+        # Shared cache entries are only served to callers with the same
+        # credential; hashed so the key never appears in cache keys or logs
+        api_key = getattr(self, "api_key", None)
+        return hashlib.sha256(api_key.encode()).hexdigest()[:16] if api_key else ""
+
     @abstractmethod
     def get_prices(
         self,
@@ -37,3 +64,45 @@ class BaseDataVendor(ABC):
     @abstractmethod
     def get_news(self, ticker: str) -> List[Dict]:
         pass
+
+    def get_earnings_calendar(self, ticker: str) -> Dict[str, Any]:
+        # Upcoming events, at least {"earnings_dates": ["YYYY-MM-DD", ...]};
+        # empty when the vendor has no calendar
+        return {}
+
+    def get_quote(
+        self, ticker: str, fields: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        # Lightweight quote ({"ticker", "as_of", <field>: value}) from a single
+        # daily price request: five days cover price, previous close and
+        # volume, a year the 52-week range. Vendors that can do better (e.g. a
+        # market cap without the full company profile) override this.
+        fields = list(QUOTE_FIELDS if fields is None else fields)
+        period = "1y" if set(fields) & set(YEAR_RANGE_FIELDS) else "5d"
+        bars = self.get_prices(ticker, interval="day", period=period)
+        if bars is None or bars.empty or "Close" not in bars:
+            return None
+        closes = bars["Close"].dropna()
+        if closes.empty:
+            return None
+        last_bar = closes.index[-1]
+        values = {
+            "price": closes.iloc[-1],
+            "previous_close": closes.iloc[-2] if len(closes) > 1 else None,
+            "volume": bars["Volume"].get(last_bar) if "Volume" in bars else None,
+            "year_high": bars["High"].max() if "High" in bars else None,
+            "year_low": bars["Low"].min() if "Low" in bars else None,
+        }
+        quote = {
+            "ticker": ticker.upper(),
+            "as_of": (
+                last_bar.date().isoformat()
+                if isinstance(last_bar, pd.Timestamp)
+                else str(last_bar)
+            ),
+        }
+        for field in fields:
+            quote[field] = _finite(values.get(field))
+        if quote.get("volume") is not None:
+            quote["volume"] = int(quote["volume"])
+        return quote
@@ -0,0 +1,230 @@
+import math
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from ..constants.settings import COMPANY_SNAPSHOT_MAX_ENTRIES
+from . import frameSerializer
+from .vendorCache import vendor_cache
+
+logger = logging.getLogger(__name__)
+
+# One cleaned view of a company's info blob: profile fields, officers and
+# formatted key metrics. It is built once per cached info version and shared
+# by /company_info, /key_metrics, /company_snapshot and the get_company_info
+# tool, so the blob is fetched and cleaned once however many of them a page or
+# chat turn uses.
+
+SNAPSHOT_SECTIONS = ("profile", "officers", "key_metrics")
+
+KEY_METRICS = {
+    "Market Cap": "marketCap",
+    "PE Ratio (TTM)": "trailingPE",
+    "Forward PE": "forwardPE",
+    "Dividend Yield": "dividendYield",
+    "Beta": "beta",
+    "52 Week High": "fiftyTwoWeekHigh",
+    "52 Week Low": "fiftyTwoWeekLow",
+    "Price to Book": "priceToBook",
+    "Profit Margin": "profitMargins",
+    "Revenue Growth (YoY)": "revenueGrowth",  # Note: yfinance might call this 'revenueQuarterlyGrowth' sometimes
+    "Earnings Growth (YoY)": "earningsGrowth",  # Note: yfinance might call this 'earningsQuarterlyGrowth'
+    "Return on Equity (ROE)": "returnOnEquity",
+    "Debt to Equity": "debtToEquity",
+}
+PERCENT_METRICS = (
+    "dividendYield",
+    "profitMargins",
+    "revenueGrowth",
+    "earningsGrowth",
+    "returnOnEquity",
+)
+
+OFFICER_INT_FIELDS = ("maxAge", "age", "yearBorn", "fiscalYear")
+OFFICER_FLOAT_FIELDS = ("totalPay", "exercisedValue", "unexercisedValue")
+OFFICER_STR_FIELDS = ("name", "title")
+
+
+def format_metric(key: str, raw_value: Any) -> Optional[str]:
+    if raw_value is None or pd.isna(raw_value):
+        return None
+    if not isinstance(raw_value, (float, int)):
+        return str(raw_value)
+    # Format percentages nicely
+    if key in PERCENT_METRICS:
+        return f"{raw_value * 100:.2f}%"
+    # Format large numbers (Market Cap)
+    if key == "marketCap":
+        if raw_value > 1_000_000_000_000:
+            return f"${raw_value / 1_000_000_000_000:.2f}T"
+        if raw_value > 1_000_000_000:
+            return f"${raw_value / 1_000_000_000:.2f}B"
+        if raw_value > 1_000_000:
+            return f"${raw_value / 1_000_000:.2f}M"
+        return f"${raw_value:,.2f}"
+    return f"{raw_value:,.2f}" if isinstance(raw_value, float) else f"{raw_value:,}"
+
+
+def _number(value: Any, integer: bool) -> Optional[float]:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(value):
+        return None
+    if integer:
+        return int(value) if value.is_integer() else None
+    return value
+
+
+def clean_officers(raw_officers: Any, ticker: str) -> List[Dict[str, Any]]:
+    # Known fields only, coerced to their types; unusable values dropped
+    if not isinstance(raw_officers, list):
+        return []
+    officers = []
+    for officer_data in raw_officers:
+        if not isinstance(officer_data, dict):
+            logger.warning(
+                f"Skipping invalid officer data structure for {ticker}: {officer_data}"
+            )
+            continue
+        officer = {}
+        for field in OFFICER_STR_FIELDS:
+            if officer_data.get(field) is not None:
+                officer[field] = str(officer_data[field])
+        for fields, integer in (
+            (OFFICER_INT_FIELDS, True),
+            (OFFICER_FLOAT_FIELDS, False),
+        ):
+            for field in fields:
+                value = _number(officer_data.get(field), integer)
+                if value is not None:
+                    officer[field] = value
+        officers.append(officer)
+    return officers
+
+
+def build_snapshot(ticker: str, info: Dict[str, Any]) -> Dict[str, Any]:
+    profile = frameSerializer.clean_mapping(info)
+    officers = clean_officers(profile.pop("companyOfficers", None), ticker)
+    if not profile.get("symbol"):
+        profile["symbol"] = ticker
+    return {
+        "ticker": ticker,
+        "profile": profile,
+        "officers": officers,
+        "key_metrics": [
+            {"metric_name": name, "value": format_metric(key, profile.get(key))}
+            for name, key in KEY_METRICS.items()
+        ],
+    }
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    # "profile,key_metrics" or single profile fields ("longName,sector");
+    # None means the whole snapshot
+    if not fields:
+        return None
+    parsed = {field.strip() for field in fields.split(",") if field.strip()}
+    return tuple(sorted(parsed)) or None
+
+
+def project(
+    snapshot: Dict[str, Any], fields: Optional[Iterable[str]]
+) -> Dict[str, Any]:
+    # Whole sections by name; any other name picks that field of the profile
+    if fields is None:
+        return dict(snapshot)
+    result = {"ticker": snapshot["ticker"]}
+    profile_fields = []
+    for field in fields:
+        if field in SNAPSHOT_SECTIONS:
+            result[field] = snapshot[field]
+        else:
+            profile_fields.append(field)
+    if profile_fields and "profile" not in result:
+        profile = snapshot["profile"]
+        result["profile"] = {
+            field: profile[field] for field in profile_fields if field in profile
+        }
+    return result
+
+
+class CompanySnapshotStore:
+    def __init__(self, max_entries: int = COMPANY_SNAPSHOT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # (vendor, ticker) -> (info cache version, snapshot); tickers as the vendor
+        # cache keys them
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[int, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._stats = {"reads": 0, "hits": 0, "builds": 0, "invalidations": 0}
+
+    @staticmethod
+    def _info_version(vendor: Any, ticker: str) -> Optional[int]:
+        cache_info = getattr(vendor, "cache_info", None)
+        entry = cache_info("get_company_info", ticker=ticker) if cache_info else None
+        return entry["version"] if entry else None
+
+    def get(
+        self, vendor: Any, ticker: str, fields: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        # None when the vendor has no usable info for the ticker. Snapshots
+        # are shared; callers must not mutate them.
+        before = self._info_version(vendor, ticker)
+        info = vendor.get_company_info(ticker=ticker)
+        info = info.to_dict() if info is not None else None
+        if not info or not info.get("symbol"):
+            return None
+        vendor_name = getattr(vendor, "vendor_name", type(vendor).__name__)
+        key = (vendor_name.lower(), ticker)
+        version = self._info_version(vendor, ticker)
+        if before is not None and before != version:
+            version = None  # Refreshed mid-read; don't pin what we got to it
+        with self._lock:
+            self._stats["reads"] += 1
+            cached = self._entries.get(key)
+            if version is not None and cached is not None and cached[0] == version:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return project(cached[1], fields)
+        snapshot = build_snapshot(ticker, info)
+        with self._lock:
+            self._stats["builds"] += 1
+            if version is not None:
+                self._entries[key] = (version, snapshot)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return project(snapshot, fields)
+
+    def on_vendor_event(self, event: str, info: Dict[str, Any]):
+        # Refreshed or invalidated info makes the snapshot built from it stale
+        if info.get("method") not in (None, "get_company_info"):
+            return
+        vendor = (info.get("vendor") or "").lower()
+        ticker = info.get("ticker")
+        with self._lock:
+            removed = [
+                key
+                for key in self._entries
+                if (not vendor or key[0] == vendor) and (not ticker or key[1] == ticker)
+            ]
+            for key in removed:
+                del self._entries[key]
+            self._stats["invalidations"] += len(removed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        stats["hit_rate"] = stats["hits"] / stats["reads"] if stats["reads"] else 0.0
+        return stats
+
+
+company_snapshots = CompanySnapshotStore()
+vendor_cache.add_listener(company_snapshots.on_vendor_event)
@@ -4,6 +4,8 @@ import logging
 from .baseDataVendor import BaseDataVendor
 from .financialDatasetsAI.vendor import FinancialDatasetsAI
 from .yfinance.vendor import YahooFinance
+from .vendorCache import CachedDataVendor, vendor_cache
+from ..constants.settings import VENDOR_CACHE_ENABLED
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +27,12 @@ class DataVendorFactory:
 
         try:
             logger.info(f"Creating instance of vendor: {vendor_name}")
-            return vendor_class(api_key=api_key)
+            vendor = vendor_class(api_key=api_key)
         except Exception as e:
             logger.error(f"Failed to instantiate vendor {vendor_name}: {e}")
             raise ValueError(f"Failed to initialize vendor {vendor_name}: {str(e)}")
+
+        if not VENDOR_CACHE_ENABLED:
+            return vendor
+        # All tools and endpoints share one process-wide data cache per vendor
+        return CachedDataVendor(vendor, vendor_name, vendor_cache)
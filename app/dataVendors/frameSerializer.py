@@ -0,0 +1,191 @@
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# Whole-column conversion of vendor DataFrames/Series into JSON-ready Python
+# values. Missing data (NaN, NaT, None, +/-inf) becomes None through NumPy
+# masks and dates are formatted per column, so no Python code runs per cell.
+
+DATE_FORMAT = "%Y-%m-%d"
+NUMERIC_KINDS = ("integer", "floating", "mixed-integer-float", "decimal")
+
+ArrayLike = Union[pd.Series, pd.Index, np.ndarray, List[Any]]
+
+
+def _datetime_values(values: ArrayLike) -> Optional[pd.DatetimeIndex]:
+    # Datetime columns, including object columns that only hold timestamps
+    if isinstance(values, pd.DatetimeIndex):
+        return values
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None and pd.api.types.is_datetime64_any_dtype(dtype):
+        return pd.DatetimeIndex(values)
+    if dtype == object and pd.api.types.infer_dtype(values, skipna=True) in (
+        "datetime",
+        "datetime64",
+    ):
+        try:
+            return pd.DatetimeIndex(pd.to_datetime(np.asarray(values), utc=False))
+        except (ValueError, TypeError):
+            return None
+    return None
+
+
+def _format_dates(dates: pd.DatetimeIndex, date_format: str) -> np.ndarray:
+    # Local wall-clock dates as an object array of str; NaT entries are left
+    # for the caller to mask
+    if date_format == DATE_FORMAT:
+        # NumPy's ISO formatting runs in C, far faster than strftime
+        naive = dates.tz_localize(None) if dates.tz is not None else dates
+        return np.datetime_as_string(
+            naive.to_numpy(dtype="datetime64[D]"), unit="D"
+        ).astype(object)
+    return dates.strftime(date_format).to_numpy(dtype=object)
+
+
+def column_values(
+    values: ArrayLike, as_int: bool = False, date_format: str = DATE_FORMAT
+) -> List[Any]:
+    dates = _datetime_values(values)
+    if dates is not None:
+        return np.where(dates.isna(), None, _format_dates(dates, date_format)).tolist()
+
+    array = values.to_numpy() if hasattr(values, "to_numpy") else np.asarray(values)
+    if array.dtype == bool:
+        return array.tolist()
+    if np.issubdtype(array.dtype, np.number):
+        numbers = array.astype(np.float64, copy=False)
+        valid = np.isfinite(numbers)
+        if as_int:
+            numbers = np.where(valid, numbers, 0).astype(np.int64)
+        return np.where(valid, numbers, None).tolist()
+
+    # Object columns: numeric-only ones (numpy scalars, Decimal) become floats,
+    # anything else keeps its values with missing ones masked
+    array = array.astype(object, copy=False)
+    if pd.api.types.infer_dtype(array, skipna=True) in NUMERIC_KINDS:
+        numbers = pd.to_numeric(pd.Series(array), errors="coerce").to_numpy(
+            dtype=np.float64
+        )
+        valid = np.isfinite(numbers)
+        if as_int:
+            numbers = np.where(valid, numbers, 0).astype(np.int64)
+        return np.where(valid, numbers, None).tolist()
+    return np.where(pd.isna(array), None, array).tolist()
+
+
+def labels(index: Iterable[Any], date_format: str = DATE_FORMAT) -> List[str]:
+    # Index/column labels as JSON object keys; timestamps use date_format
+    dates = _datetime_values(index if isinstance(index, pd.Index) else pd.Index(index))
+    if dates is not None:
+        return np.where(dates.isna(), "", _format_dates(dates, date_format)).tolist()
+    return [str(label) for label in index]
+
+
+def percent_strings(values: ArrayLike, decimals: int = 2) -> List[Optional[str]]:
+    # Fractions -> "12.34%" strings; missing or non-numeric values -> None
+    numbers = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(
+        dtype=np.float64
+    )
+    valid = np.isfinite(numbers)
+    text = np.char.mod(f"%.{decimals}f%%", np.where(valid, numbers * 100, 0.0))
+    return np.where(valid, text.astype(object), None).tolist()
+
+
+def clean_mapping(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    # Vendor dicts (e.g. yfinance info): non-finite floats -> None, the rest
+    # unchanged. The float values are checked together in one array.
+    keys = [key for key, value in mapping.items() if isinstance(value, float)]
+    result = dict(mapping)
+    if keys:
+        values = np.fromiter((mapping[key] for key in keys), np.float64, len(keys))
+        for key, finite in zip(keys, np.isfinite(values).tolist()):
+            if not finite:
+                result[key] = None
+    return result
+
+
+def series_to_dict(
+    series: pd.Series, drop_none: bool = False, date_format: str = DATE_FORMAT
+) -> Dict[str, Any]:
+    result = dict(zip(labels(series.index, date_format), column_values(series)))
+    if drop_none:
+        return {key: value for key, value in result.items() if value is not None}
+    return result
+
+
+def frame_to_columns(
+    frame: pd.DataFrame,
+    columns: Optional[Dict[str, str]] = None,
+    index_key: Optional[str] = "date",
+    int_columns: Iterable[str] = (),
+    date_format: str = DATE_FORMAT,
+) -> Dict[str, List[Any]]:
+    # {output name: list} per column; `columns` maps frame column -> output
+    # name and selects columns (missing ones become all-None)
+    int_columns = set(int_columns)
+    mapping = columns or {str(column): str(column) for column in frame.columns}
+    result: Dict[str, List[Any]] = {}
+    if index_key:
+        result[index_key] = labels(frame.index, date_format)
+    for column, name in mapping.items():
+        if column in frame.columns:
+            result[name] = column_values(
+                frame[column], as_int=column in int_columns, date_format=date_format
+            )
+        else:
+            result[name] = [None] * len(frame)
+    return result
+
+
+def columns_to_records(
+    columns: Dict[str, List[Any]], drop_none: bool = False
+) -> List[Dict[str, Any]]:
+    keys = list(columns)
+    if drop_none:
+        return [
+            {key: value for key, value in zip(keys, row) if value is not None}
+            for row in zip(*columns.values())
+        ]
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def frame_to_records(
+    frame: pd.DataFrame,
+    columns: Optional[Dict[str, str]] = None,
+    index_key: Optional[str] = "date",
+    int_columns: Iterable[str] = (),
+    drop_none: bool = False,
+    date_format: str = DATE_FORMAT,
+) -> List[Dict[str, Any]]:
+    return columns_to_records(
+        frame_to_columns(frame, columns, index_key, int_columns, date_format),
+        drop_none=drop_none,
+    )
+
+
+def frame_to_nested(
+    frame: pd.DataFrame, date_format: str = DATE_FORMAT
+) -> Dict[str, Dict[str, Any]]:
+    # {column label: {row label: value}}, the shape of financial statements
+    # (report dates as columns, line items as rows)
+    row_labels = labels(frame.index, date_format)
+    try:
+        numbers = frame.to_numpy(dtype=np.float64)
+    except (TypeError, ValueError):
+        numbers = None
+    if numbers is not None:
+        # One mask for the whole frame, then one tolist per column
+        table = np.where(np.isfinite(numbers), numbers, None)
+        column_lists = [
+            table[:, position].tolist() for position in range(table.shape[1])
+        ]
+    else:
+        column_lists = [
+            column_values(frame.iloc[:, position], date_format=date_format)
+            for position in range(frame.shape[1])
+        ]
+    return {
+        column: dict(zip(row_labels, values))
+        for column, values in zip(labels(frame.columns, date_format), column_lists)
+    }
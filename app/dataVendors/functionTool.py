@@ -3,9 +3,22 @@ import pandas as pd
 import numpy as np
 import json
 import logging
+import warnings
 from .dataVendorFactory import DataVendorFactory
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from .functionToolSchema import AVAILABLE_TOOLS
+from ..constants.settings import (
+    SCREEN_MAX_TICKERS,
+    SCREEN_FETCH_CONCURRENCY,
+    HISTORY_DEFAULT_BARS,
+    STATISTICS_DEFAULT_BARS,
+    TRADING_WINDOW_SLACK_BARS,
+)
+from . import frameSerializer, priceAnalytics, technicalIndicators, tradingCalendar
+from .indicatorState import indicator_store
+from .quoteService import quote_service
+from .companySnapshot import company_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +48,9 @@ def get_ticker_price(
     api_key: Optional[str] = None,
 ) -> Dict[str, Any]:
     try:
-        vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
-        price_df = vendor.get_prices(
-            ticker, interval="day", period="5d"
-        )  # Fetch last 5 days for change calc
-        if price_df.empty or len(price_df) < 1:
+        # Shared live quote: upstream is hit once per ticker and poll interval
+        quote = quote_service.get_quote(data_vendor, ticker, api_key=api_key)
+        if quote is None or quote["price"] is None:
             logger.warning(
                 f"Unable to retrieve sufficient price data for {ticker} using {data_vendor}."
             )
@@ -47,27 +58,11 @@ def get_ticker_price(
                 "error": f"Unable to retrieve price for {ticker} using {data_vendor}."
             }
 
-        latest_close = safe_float(price_df["Close"].iloc[-1])
-        previous_close = (
-            safe_float(price_df["Close"].iloc[-2]) if len(price_df) > 1 else None
-        )
-
-        change = None
-        change_percent = None
-        if latest_close is not None and previous_close is not None:
-            change = safe_float(latest_close - previous_close)
-            if previous_close != 0:
-                change_percent = (
-                    safe_float((change / previous_close) * 100)
-                    if change is not None
-                    else None
-                )
-
         result = {
             "ticker": ticker,
-            "price": latest_close,
-            "change": change,
-            "change_percent": change_percent,
+            "price": safe_float(quote["price"]),
+            "change": safe_float(quote["change"]),
+            "change_percent": safe_float(quote["change_percent"]),
         }
         logger.info(f"Price fetched for {ticker}: {result}")
         return result
@@ -87,16 +82,19 @@ def get_ticker_history(
     try:
         vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
 
-        # Default date range if none provided (e.g., last 1 month)
+        # Default date range if none provided (last trading month)
         if not start_date or not end_date:
-            today = datetime.today()
-            end_date_dt = today
-            start_date_dt = today - timedelta(days=30)
-            end_date = end_date_dt.strftime("%Y-%m-%d")
-            start_date = start_date_dt.strftime("%Y-%m-%d")
+            start_date, end_date = tradingCalendar.bars_window(
+                ticker, HISTORY_DEFAULT_BARS, fallback_days=30
+            )
             logger.info(
                 f"Defaulting date range for {ticker} history to: {start_date} - {end_date}"
             )
+        elif interval == "day":
+            # Session-aligned dates, so equivalent ranges share a cache entry
+            start_date, end_date = tradingCalendar.align_range(
+                ticker, start_date, end_date
+            )
 
         history_df = vendor.get_prices(
             ticker=ticker, start_date=start_date, end_date=end_date, interval=interval
@@ -178,14 +176,6 @@ def get_company_info(
 ) -> Dict[str, Any]:
     try:
         vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
-        company_info_series = vendor.get_company_info(ticker=ticker)
-
-        if company_info_series is None or company_info_series.empty:
-            logger.warning(f"No company information returned by vendor for {ticker}.")
-            return {"error": f"No company information found for {ticker}."}
-
-        info_dict = company_info_series.to_dict()
-        cleaned_info = {}
         keys_to_include = [
             "longName",
             "symbol",
@@ -203,15 +193,23 @@ def get_company_info(
             "fiftyTwoWeekHigh",
             "fiftyTwoWeekLow",
         ]
-        for key in keys_to_include:
-            if key in info_dict and pd.notna(info_dict[key]):
-                value = info_dict[key]
-                # Use safe_float for numbers, otherwise convert to string
-                cleaned_info[key] = (
-                    safe_float(value)
-                    if isinstance(value, (int, float, np.number))
-                    else str(value)
-                )
+        # Same cleaned snapshot the company endpoints serve
+        snapshot = company_snapshots.get(vendor, ticker, keys_to_include)
+
+        if snapshot is None:
+            logger.warning(f"No company information returned by vendor for {ticker}.")
+            return {"error": f"No company information found for {ticker}."}
+
+        # Numbers as floats, everything else as strings; missing values dropped
+        cleaned_info = {
+            key: (
+                float(value)
+                if isinstance(value, (int, float, np.number))
+                else str(value)
+            )
+            for key, value in snapshot["profile"].items()
+            if value is not None
+        }
 
         if not cleaned_info.get("longName") and not cleaned_info.get("symbol"):
             logger.warning(
@@ -242,31 +240,20 @@ def get_institutional_investors(
             return {"error": f"No institutional investors data found for {ticker}."}
 
         institutional_investors_df = institutional_investors_df.head(limit)
-        institutional_investors_records = institutional_investors_df.to_dict(
-            orient="records"
+        # Whole columns at once: dates formatted, numbers as floats, NaN -> None
+        columns = frameSerializer.frame_to_columns(
+            institutional_investors_df, index_key=None
         )
-
-        cleaned_investors = []
-        for investor in institutional_investors_records:
-            cleaned_record = {}
-            for k, v in investor.items():
-                if pd.notna(v):
-                    # Format 'Date Reported' if it's a timestamp
-                    if k == "Date Reported" and isinstance(v, pd.Timestamp):
-                        cleaned_record[k] = v.strftime("%Y-%m-%d")
-                    # Format '% Out' as percentage string
-                    elif k == "% Out" and isinstance(v, (float, np.number)):
-                        cleaned_record[k] = (
-                            f"{safe_float(v * 100):.2f}%" if v is not None else None
-                        )
-                    # Use safe_float for other numbers, else string
-                    elif isinstance(v, (int, float, np.number)):
-                        cleaned_record[k] = safe_float(v)
-                    else:
-                        cleaned_record[k] = str(v)
-            # Filter out records that became empty after cleaning NaNs
-            if cleaned_record:
-                cleaned_investors.append(cleaned_record)
+        if "% Out" in columns:
+            columns["% Out"] = frameSerializer.percent_strings(
+                institutional_investors_df["% Out"]
+            )
+        # Missing values are dropped, then records left empty
+        cleaned_investors = [
+            record
+            for record in frameSerializer.columns_to_records(columns, drop_none=True)
+            if record
+        ]
 
         if not cleaned_investors:
             logger.warning(
@@ -451,18 +438,8 @@ def get_financial_statements(
 
         key_data_subset_df = summary_data_df.loc[relevant_rows]
 
-        # Convert to dictionary, handling NaN/NaT and formatting
-        key_data_dict = {}
-        for col in key_data_subset_df.columns:
-            col_date_str = (
-                str(col.date()) if isinstance(col, pd.Timestamp) else str(col)
-            )
-            metrics = {}
-            for idx, value in key_data_subset_df[col].items():
-                metrics[idx] = (
-                    safe_float(value) if pd.notna(value) else None
-                )  # Use safe_float for numbers, None for NaN
-            key_data_dict[col_date_str] = metrics
+        # {period date: {metric: value}}, NaN -> None
+        key_data_dict = frameSerializer.frame_to_nested(key_data_subset_df)
 
         logger.info(
             f"Financial statement summary created for {ticker}, type: {statement_type}, period: {period}."
@@ -539,6 +516,34 @@ def get_financial_news(
         return {"error": f"Error fetching news for {ticker}: {str(e)}"}
 
 
+def _price_trend_result(
+    ticker: str,
+    current_price: Optional[float],
+    sma_short: Optional[float],
+    sma_long: Optional[float],
+    window1: int,
+    window2: int,
+) -> Dict[str, Any]:
+    trend_signal = str(
+        priceAnalytics.trend_signals(
+            np.array([current_price], dtype=np.float64),
+            np.array([sma_short], dtype=np.float64),
+            np.array([sma_long], dtype=np.float64),
+            window1,
+            window2,
+        )[0]
+    )
+    logger.info(f"Trend calculated for {ticker}: {trend_signal}")
+    return {
+        "ticker": ticker,
+        "current_price": current_price,
+        f"sma_{window1}_day": sma_short,
+        f"sma_{window2}_day": sma_long,
+        "trend_signal": trend_signal,
+        "message": f"Trend analysis based on {window1}-day and {window2}-day SMAs calculated.",
+    }
+
+
 def calculate_price_trend(
     ticker: str,
     data_vendor: str = "yfinance",
@@ -547,18 +552,24 @@ def calculate_price_trend(
     window2: int = 200,
 ) -> Dict[str, Any]:
     try:
-        vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
+        snapshot = indicator_store.sma_snapshot(data_vendor, ticker, (window1, window2))
+        if snapshot is not None:
+            # Constant-time read from the incrementally maintained SMA state
+            current_price, smas, _ = snapshot
+            return _price_trend_result(
+                ticker, current_price, smas[window1], smas[window2], window1, window2
+            )
 
-        # Fetch significantly more data to account for non-trading days
-        # Roughly 1.5 years should be safe for a 200-day SMA (200 trading days ~ 280 calendar days)
-        # Let's fetch around 400 calendar days as a buffer.
-        days_to_fetch = max(window1, window2) + 200  # Increased buffer substantially
-        end_date_dt = datetime.today()
-        # Ensure start_date is calculated correctly
-        start_date_dt = end_date_dt - timedelta(days=days_to_fetch)
+        vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
 
-        end_date = end_date_dt.strftime("%Y-%m-%d")
-        start_date = start_date_dt.strftime("%Y-%m-%d")
+        # Exactly the sessions the long SMA needs (plus a little slack for
+        # unscheduled closures) instead of a calendar-day buffer
+        required_points = max(window1, window2)
+        start_date, end_date = tradingCalendar.bars_window(
+            ticker,
+            required_points + TRADING_WINDOW_SLACK_BARS,
+            fallback_days=required_points + 200,
+        )
         logger.info(
             f"Fetching data for trend calculation ({ticker}) from {start_date} to {end_date}"
         )
@@ -568,10 +579,9 @@ def calculate_price_trend(
         )
 
         # Check *after* fetching if we have enough data points
-        required_points = max(window1, window2)
         if history_df.empty or len(history_df) < required_points:
             logger.warning(
-                f"Insufficient historical data points ({len(history_df)}) fetched for {ticker} to calculate {required_points}-day trend, even after requesting {days_to_fetch} calendar days."
+                f"Insufficient historical data points ({len(history_df)}) fetched for {ticker} to calculate {required_points}-day trend from {start_date} to {end_date}."
             )
             # Provide a more informative error
             return {
@@ -583,17 +593,10 @@ def calculate_price_trend(
             logger.error(f"'Close' column not found in history data for {ticker}.")
             return {"error": f"Price data format error for {ticker}."}
 
-        history_df[f"SMA{window1}"] = (
-            history_df["Close"].rolling(window=window1, min_periods=window1).mean()
-        )  # Ensure full window for SMA
-        history_df[f"SMA{window2}"] = (
-            history_df["Close"].rolling(window=window2, min_periods=window2).mean()
-        )  # Ensure full window for SMA
-
-        # Drop rows with NaN SMAs before getting the latest valid data
-        valid_trend_data = history_df.dropna(subset=[f"SMA{window1}", f"SMA{window2}"])
-
-        if valid_trend_data.empty:
+        trend = priceAnalytics.compute_trends(
+            history_df[["Close"]].to_numpy(dtype=np.float64), window1, window2
+        )
+        if trend["row"][0] == priceAnalytics.NO_INDEX:
             logger.warning(
                 f"Could not calculate SMAs for {ticker}, possibly due to gaps in data near the end."
             )
@@ -601,49 +604,12 @@ def calculate_price_trend(
                 "error": f"Could not calculate trend for {ticker}, possibly due to recent data gaps."
             }
 
-        latest_data = valid_trend_data.iloc[-1]  # Use last row with valid SMAs
-        current_price = safe_float(latest_data["Close"])
-        sma_short = safe_float(latest_data[f"SMA{window1}"])
-        sma_long = safe_float(latest_data[f"SMA{window2}"])
-        # --- End calculation logic ---
-
-        trend_signal = "Indeterminate"
-        if current_price is not None and sma_short is not None and sma_long is not None:
-            # Trend logic remains the same
-            if current_price > sma_short > sma_long:
-                trend_signal = f"Strong Uptrend (Price > SMA{window1} > SMA{window2})"
-            elif sma_short > current_price > sma_long:
-                trend_signal = f"Potential Uptrend/Correction Below SMA{window1} (SMA{window1} > Price > SMA{window2})"
-            elif sma_long > current_price > sma_short:
-                trend_signal = f"Potential Downtrend/Rally Below SMA{window2} (SMA{window2} > Price > SMA{window1})"
-            elif sma_short > sma_long > current_price:
-                trend_signal = f"Strong Downtrend (Price < SMA{window2} < SMA{window1})"
-            elif sma_long > sma_short > current_price:
-                trend_signal = f"Strong Downtrend (Price < SMA{window1} < SMA{window2})"
-            elif current_price > sma_long > sma_short:
-                trend_signal = f"Potential Uptrend/Consolidation Above SMA{window2} (Price > SMA{window2} > SMA{window1})"
-            elif (
-                abs(current_price - sma_short) < 0.005 * current_price
-                or abs(current_price - sma_long) < 0.005 * current_price
-            ):  # Check if price is very close to SMA
-                trend_signal = f"Price Testing SMA(s)"
-            else:
-                trend_signal = "Neutral / Sideways"
-        else:
-            logger.warning(
-                f"Could not determine trend for {ticker} due to missing price/SMA values in final calculation."
-            )
-
-        result = {
-            "ticker": ticker,
-            "current_price": current_price,
-            f"sma_{window1}_day": sma_short,
-            f"sma_{window2}_day": sma_long,
-            "trend_signal": trend_signal,
-            "message": f"Trend analysis based on {window1}-day and {window2}-day SMAs calculated.",
-        }
-        logger.info(f"Trend calculated for {ticker}: {trend_signal}")
-        return result
+        current_price, sma_short, sma_long = priceAnalytics.to_optional_floats(
+            [trend["current_price"][0], trend["sma_short"][0], trend["sma_long"][0]]
+        )
+        return _price_trend_result(
+            ticker, current_price, sma_short, sma_long, window1, window2
+        )
 
     except Exception as e:
         logger.exception(f"Error calculating trend for {ticker}: {e}")
@@ -662,19 +628,22 @@ def calculate_period_statistics(
         vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
 
         if not start_date or not end_date:
-            today = datetime.today()
-            end_date_dt = today
-            start_date_dt = today - timedelta(days=365)  # Default to 1 year
-            end_date = end_date_dt.strftime("%Y-%m-%d")
-            start_date = start_date_dt.strftime("%Y-%m-%d")
+            # Default to the last trading year
+            start_date, end_date = tradingCalendar.bars_window(
+                ticker, STATISTICS_DEFAULT_BARS, fallback_days=365
+            )
             logger.info(
                 f"Defaulting statistics period for {ticker} to: {start_date} - {end_date}"
             )
+        # Session-aligned fetch dates, so equivalent ranges share a cache entry
+        fetch_start, fetch_end = tradingCalendar.align_range(
+            ticker, start_date, end_date
+        )
 
         history_df = vendor.get_prices(
             ticker=ticker,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=fetch_start,
+            end_date=fetch_end,
             interval="day",  # Use daily interval for stats
         )
 
@@ -686,9 +655,14 @@ def calculate_period_statistics(
                 "error": f"No historical data found for {ticker} between {start_date} and {end_date}."
             }
 
-        close_prices = history_df["Close"].dropna()
+        if "Close" not in history_df.columns:
+            logger.error(f"'Close' column not found in history data for {ticker}.")
+            return {"error": f"Price data format error for {ticker}."}
 
-        if close_prices.empty:
+        stats = priceAnalytics.compute_statistics(
+            history_df[["Close"]].to_numpy(dtype=np.float64)
+        )
+        if stats["count"][0] == 0:
             logger.warning(
                 f"No valid closing prices found for {ticker} in the period {start_date}-{end_date}."
             )
@@ -696,16 +670,26 @@ def calculate_period_statistics(
                 "error": f"No valid closing prices found for {ticker} in the period."
             }
 
-        mean_price = safe_float(close_prices.mean())
-        median_price = safe_float(close_prices.median())
-        std_dev = safe_float(close_prices.std())
-
-        volatility_percent = None
-        if mean_price is not None and mean_price != 0 and std_dev is not None:
-            volatility_percent = safe_float((std_dev / mean_price) * 100)
-
-        min_price = safe_float(close_prices.min())
-        max_price = safe_float(close_prices.max())
+        (
+            mean_price,
+            median_price,
+            std_dev,
+            volatility_percent,
+            min_price,
+            max_price,
+        ) = priceAnalytics.to_optional_floats(
+            [
+                stats[name][0]
+                for name in (
+                    "mean",
+                    "median",
+                    "std",
+                    "volatility_percent",
+                    "min",
+                    "max",
+                )
+            ]
+        )
 
         result = {
             "ticker": ticker,
@@ -739,19 +723,21 @@ def calculate_returns(
         vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
 
         if not start_date or not end_date:
-            today = datetime.today()
-            end_date_dt = today
-            start_date_dt = today - timedelta(days=365)  # Default to 1 year
-            end_date = end_date_dt.strftime("%Y-%m-%d")
-            start_date = start_date_dt.strftime("%Y-%m-%d")
+            # Default to the last trading year
+            start_date, end_date = tradingCalendar.bars_window(
+                ticker, STATISTICS_DEFAULT_BARS, fallback_days=365
+            )
             logger.info(
                 f"Defaulting returns period for {ticker} to: {start_date} - {end_date}"
             )
+        fetch_start, fetch_end = tradingCalendar.align_range(
+            ticker, start_date, end_date
+        )
 
         # Fetch only start and end points if possible, else full history
         # Optimization: Fetch minimal data if vendor supports it. yfinance needs range.
         history_df = vendor.get_prices(
-            ticker=ticker, start_date=start_date, end_date=end_date, interval="day"
+            ticker=ticker, start_date=fetch_start, end_date=fetch_end, interval="day"
         )
 
         if history_df.empty or len(history_df) < 2:
@@ -762,20 +748,29 @@ def calculate_returns(
                 "error": f"Insufficient historical data for {ticker} between {start_date} and {end_date} to calculate returns."
             }
 
-        # Find first and last valid closing prices in the *returned* data range
-        close_prices = history_df["Close"].dropna()
-        if len(close_prices) < 2:
+        if "Close" not in history_df.columns:
+            logger.error(f"'Close' column not found in history data for {ticker}.")
+            return {"error": f"Price data format error for {ticker}."}
+
+        # First and last valid closing prices in the *returned* data range
+        close_matrix = history_df[["Close"]].to_numpy(dtype=np.float64)
+        valid_closes = int(np.isfinite(close_matrix).sum())
+        if valid_closes < 2:
             logger.warning(
-                f"Not enough valid closing prices ({len(close_prices)}) found for return calculation for {ticker}."
+                f"Not enough valid closing prices ({valid_closes}) found for return calculation for {ticker}."
             )
             return {
                 "error": f"Could not find at least two valid closing prices for {ticker} in the period."
             }
 
-        period_start_price = safe_float(close_prices.iloc[0])
-        period_end_price = safe_float(close_prices.iloc[-1])
-        actual_start_date = close_prices.index[0].strftime("%Y-%m-%d")
-        actual_end_date = close_prices.index[-1].strftime("%Y-%m-%d")
+        returns = priceAnalytics.compute_returns(close_matrix, history_df.index)
+        period_start_price, period_end_price = priceAnalytics.to_optional_floats(
+            [returns["start_price"][0], returns["end_price"][0]]
+        )
+        actual_start_date = history_df.index[returns["start_row"][0]].strftime(
+            "%Y-%m-%d"
+        )
+        actual_end_date = history_df.index[returns["end_row"][0]].strftime("%Y-%m-%d")
 
         if period_start_price is None or period_start_price == 0:
             logger.error(
@@ -784,41 +779,23 @@ def calculate_returns(
             return {
                 "error": f"Invalid starting price ({period_start_price}) on {actual_start_date} for return calculation."
             }
-        if period_end_price is None:
-            logger.error(
-                f"Invalid ending price ({period_end_price}) for return calculation for {ticker} on {actual_end_date}."
-            )
-            return {
-                "error": f"Invalid ending price ({period_end_price}) on {actual_end_date} for return calculation."
-            }
 
-        total_return_percent = safe_float(
-            ((period_end_price - period_start_price) / period_start_price) * 100
+        total_return_percent, annualized_return_percent = (
+            priceAnalytics.to_optional_floats(
+                [
+                    returns["total_return_percent"][0],
+                    returns["annualized_return_percent"][0],
+                ]
+            )
         )
-
-        annualized_return_percent = None
-        try:
-            start_dt = pd.to_datetime(actual_start_date)
-            end_dt = pd.to_datetime(actual_end_date)
-            days_in_period = (end_dt - start_dt).days
-            # Avoid division by zero or calculating for same day
-            if days_in_period > 0:
-                years_in_period = days_in_period / 365.25
-                if total_return_percent is not None:
-                    # Ensure base for exponentiation is non-negative
-                    base = 1 + (total_return_percent / 100)
-                    if base >= 0:
-                        annualized_return_percent = safe_float(
-                            ((base) ** (1 / years_in_period) - 1) * 100
-                        )
-                    else:
-                        logger.warning(
-                            f"Cannot calculate annualized return for {ticker} due to negative base ({base}). Total return was {total_return_percent}%."
-                        )
-
-        except Exception as calc_e:
-            logger.error(f"Error calculating annualized return for {ticker}: {calc_e}")
-            annualized_return_percent = None  # Ensure it's None on error
+        if (
+            annualized_return_percent is None
+            and total_return_percent is not None
+            and returns["days"][0] > 0
+        ):
+            logger.warning(
+                f"Cannot calculate annualized return for {ticker} due to negative base. Total return was {total_return_percent}%."
+            )
 
         result = {
             "ticker": ticker,
@@ -838,3 +815,430 @@ def calculate_returns(
     except Exception as e:
         logger.exception(f"Error calculating returns for {ticker}: {e}")
         return {"error": f"Error calculating returns for {ticker}: {str(e)}"}
+
+
+def screen_price_trends(
+    tickers: List[str],
+    data_vendor: str = "yfinance",
+    api_key: Optional[str] = None,
+    window1: int = 50,
+    window2: int = 200,
+) -> Dict[str, Any]:
+    try:
+        symbols = list(dict.fromkeys(t.strip().upper() for t in tickers if t.strip()))
+        if not symbols:
+            return {"error": "No tickers provided for the trend screen."}
+        if len(symbols) > SCREEN_MAX_TICKERS:
+            return {
+                "error": f"Too many tickers ({len(symbols)}); at most {SCREEN_MAX_TICKERS} can be screened at once."
+            }
+
+        vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
+        # Same window as calculate_price_trend, so the two share cached frames
+        required_points = max(window1, window2)
+
+        def fetch(symbol):
+            start_date, end_date = tradingCalendar.bars_window(
+                symbol,
+                required_points + TRADING_WINDOW_SLACK_BARS,
+                fallback_days=required_points + 200,
+            )
+            return vendor.get_prices(
+                ticker=symbol, start_date=start_date, end_date=end_date, interval="day"
+            )
+
+        with ThreadPoolExecutor(max_workers=SCREEN_FETCH_CONCURRENCY) as executor:
+            frames = dict(zip(symbols, executor.map(fetch, symbols)))
+
+        matrix, _, screened = priceAnalytics.price_matrix(frames)
+        errors = {
+            symbol: "No price data returned."
+            for symbol in symbols
+            if symbol not in screened
+        }
+        if not screened:
+            return {"error": "No price data returned for any requested ticker."}
+
+        # One vectorized pass over every ticker
+        trend = priceAnalytics.compute_trends(matrix, window1, window2)
+        prices = priceAnalytics.to_optional_floats(trend["current_price"])
+        sma_short = priceAnalytics.to_optional_floats(trend["sma_short"])
+        sma_long = priceAnalytics.to_optional_floats(trend["sma_long"])
+        signals = trend["trend_signal"].tolist()
+
+        results = []
+        for index, symbol in enumerate(screened):
+            if trend["row"][index] == priceAnalytics.NO_INDEX:
+                errors[symbol] = (
+                    f"Insufficient history for a {max(window1, window2)}-day SMA."
+                )
+                continue
+            results.append(
+                {
+                    "ticker": symbol,
+                    "current_price": prices[index],
+                    f"sma_{window1}_day": sma_short[index],
+                    f"sma_{window2}_day": sma_long[index],
+                    "trend_signal": signals[index],
+                }
+            )
+
+        valid = trend["row"] != priceAnalytics.NO_INDEX
+        screened_array = np.array(screened)
+        result = {
+            "window1": window1,
+            "window2": window2,
+            f"above_sma_{window2}_day": screened_array[
+                valid & trend["above_sma_long"]
+            ].tolist(),
+            f"below_sma_{window2}_day": screened_array[
+                valid & ~trend["above_sma_long"]
+            ].tolist(),
+            "results": results,
+            "errors": errors,
+            "message": f"Trend screen of {len(results)} tickers based on {window1}-day and {window2}-day SMAs.",
+        }
+        logger.info(
+            f"Trend screen calculated for {len(results)} tickers ({len(errors)} without data)."
+        )
+        return result
+
+    except Exception as e:
+        logger.exception(f"Error screening trends for {tickers}: {e}")
+        return {"error": f"Error screening trends: {str(e)}"}
+
+
+def calculate_technical_indicators(
+    ticker: str,
+    data_vendor: str = "yfinance",
+    api_key: Optional[str] = None,
+    indicators: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    ema_span: Optional[int] = None,
+    rsi_window: Optional[int] = None,
+    bollinger_window: Optional[int] = None,
+    atr_window: Optional[int] = None,
+    volatility_window: Optional[int] = None,
+    include_series: bool = False,
+) -> Dict[str, Any]:
+    try:
+        requested = [
+            name.lower() for name in (indicators or technicalIndicators.INDICATORS)
+        ]
+        unknown = [
+            name for name in requested if name not in technicalIndicators.INDICATORS
+        ]
+        if unknown:
+            return {
+                "error": f"Unknown indicator(s): {', '.join(unknown)}. Supported: {', '.join(technicalIndicators.INDICATORS)}."
+            }
+        params = {
+            **technicalIndicators.DEFAULT_PARAMS,
+            **{
+                key: value
+                for key, value in {
+                    "ema_span": ema_span,
+                    "rsi_window": rsi_window,
+                    "bollinger_window": bollinger_window,
+                    "atr_window": atr_window,
+                    "volatility_window": volatility_window,
+                }.items()
+                if value
+            },
+        }
+
+        if not end_date:
+            end_date = datetime.today().strftime("%Y-%m-%d")
+        if not start_date:
+            start_date = (
+                datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=365)
+            ).strftime("%Y-%m-%d")
+        # Fetch extra history so the first reported values are fully formed
+        warmup_bars = technicalIndicators.warmup_bars(requested, params)
+        fetch_start, _ = tradingCalendar.bars_window(
+            ticker,
+            warmup_bars + TRADING_WINDOW_SLACK_BARS,
+            fallback_days=int(warmup_bars * 1.5) + 10,
+            end=start_date,
+        )
+
+        vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
+        history_df = vendor.get_prices(
+            ticker=ticker, start_date=fetch_start, end_date=end_date, interval="day"
+        )
+        if history_df.empty or "Close" not in history_df.columns:
+            logger.warning(
+                f"No price data for {ticker} to calculate indicators between {fetch_start} and {end_date}."
+            )
+            return {
+                "error": f"No historical data found for {ticker} between {start_date} and {end_date}."
+            }
+
+        # One pass over the shared frame for every requested indicator
+        columns = technicalIndicators.compute_indicators(history_df, requested, params)
+
+        dates = pd.DatetimeIndex(history_df.index)
+        naive_dates = dates.tz_localize(None) if dates.tz is not None else dates
+        in_range = naive_dates >= pd.Timestamp(start_date)
+        if not in_range.any():
+            return {
+                "error": f"No trading days for {ticker} between {start_date} and {end_date}."
+            }
+        close = history_df["Close"].to_numpy(dtype=np.float64)
+        latest = {
+            name: value
+            for name, value in zip(
+                columns,
+                priceAnalytics.to_optional_floats(
+                    [values[-1] for values in columns.values()]
+                ),
+            )
+        }
+        current_price = priceAnalytics.to_optional_floats(close[-1:])[0]
+
+        result = {
+            "ticker": ticker,
+            "as_of": dates[-1].strftime("%Y-%m-%d"),
+            "current_price": current_price,
+            "indicators": latest,
+            "signals": technicalIndicators.interpret(latest, current_price),
+            "parameters": {
+                key: value
+                for key, value in params.items()
+                if key.split("_")[0] in requested
+            },
+            "message": f"Technical indicators ({', '.join(requested)}) calculated for {ticker}.",
+        }
+        if include_series:
+            result["start_date"] = start_date
+            result["end_date"] = end_date
+            result["series"] = {
+                "date": dates[in_range].strftime("%Y-%m-%d").tolist(),
+                "close": priceAnalytics.to_optional_floats(close[in_range]),
+                **{
+                    name: priceAnalytics.to_optional_floats(values[in_range])
+                    for name, values in columns.items()
+                },
+            }
+        logger.info(f"Technical indicators calculated for {ticker}: {requested}")
+        return result
+
+    except ValueError as e:
+        logger.warning(f"Invalid indicator request for {ticker}: {e}")
+        return {"error": f"Could not calculate indicators for {ticker}: {str(e)}"}
+    except Exception as e:
+        logger.exception(f"Error calculating technical indicators for {ticker}: {e}")
+        return {"error": f"Error calculating indicators for {ticker}: {str(e)}"}
+
+
+PRICE_ANALYTICS_GROUPS = ("summary", "statistics", "returns", "trend")
+
+
+def calculate_price_analytics(
+    ticker: str,
+    data_vendor: str = "yfinance",
+    api_key: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    include: Optional[List[str]] = None,
+    window1: int = 50,
+    window2: int = 200,
+) -> Dict[str, Any]:
+    try:
+        groups = [name.lower() for name in (include or PRICE_ANALYTICS_GROUPS)]
+        unknown = [name for name in groups if name not in PRICE_ANALYTICS_GROUPS]
+        if unknown:
+            return {
+                "error": f"Unknown analytics group(s): {', '.join(unknown)}. Supported: {', '.join(PRICE_ANALYTICS_GROUPS)}."
+            }
+
+        if not start_date and not end_date:
+            # Default to the last trading year, like the statistics and returns tools
+            start_date, end_date = tradingCalendar.bars_window(
+                ticker, STATISTICS_DEFAULT_BARS, fallback_days=365
+            )
+        if not end_date:
+            end_date = datetime.today().strftime("%Y-%m-%d")
+        if not start_date:
+            start_date = (
+                datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=365)
+            ).strftime("%Y-%m-%d")
+        # Session-aligned fetch dates, so equivalent ranges share a cache entry
+        fetch_start, fetch_end = tradingCalendar.align_range(
+            ticker, start_date, end_date
+        )
+        if "trend" in groups:
+            # Same SMA window as calculate_price_trend, anchored at the range end
+            required_points = max(window1, window2)
+            trend_start, _ = tradingCalendar.bars_window(
+                ticker,
+                required_points + TRADING_WINDOW_SLACK_BARS,
+                fallback_days=required_points + 200,
+                end=fetch_end,
+            )
+            fetch_start = min(fetch_start, trend_start)
+
+        # One fetch serves every group
+        vendor = DataVendorFactory.get_vendor(vendor_name=data_vendor, api_key=api_key)
+        history_df = vendor.get_prices(
+            ticker=ticker, start_date=fetch_start, end_date=fetch_end, interval="day"
+        )
+        if history_df.empty or "Close" not in history_df.columns:
+            logger.warning(
+                f"No historical data found for {ticker} between {fetch_start} and {fetch_end}."
+            )
+            return {
+                "error": f"No historical data found for {ticker} between {start_date} and {end_date}."
+            }
+
+        dates = pd.DatetimeIndex(history_df.index)
+        naive_dates = dates.tz_localize(None) if dates.tz is not None else dates
+        in_range = np.asarray(naive_dates >= pd.Timestamp(start_date))
+        period_df = history_df[in_range]
+        close = period_df[["Close"]].to_numpy(dtype=np.float64)
+        if period_df.empty or not np.isfinite(close).any():
+            return {
+                "error": f"No valid closing prices found for {ticker} between {start_date} and {end_date}."
+            }
+
+        # Shared aggregates: first/last valid close and the close distribution
+        stats = priceAnalytics.compute_statistics(close)
+        returns = priceAnalytics.compute_returns(close, period_df.index)
+        start_price, end_price = priceAnalytics.to_optional_floats(
+            [returns["start_price"][0], returns["end_price"][0]]
+        )
+        start_used = period_df.index[returns["start_row"][0]].strftime("%Y-%m-%d")
+        end_used = period_df.index[returns["end_row"][0]].strftime("%Y-%m-%d")
+
+        result: Dict[str, Any] = {
+            "ticker": ticker,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        if "summary" in groups:
+            high = (
+                period_df["High"].to_numpy(dtype=np.float64)
+                if "High" in period_df
+                else close[:, 0]
+            )
+            low = (
+                period_df["Low"].to_numpy(dtype=np.float64)
+                if "Low" in period_df
+                else close[:, 0]
+            )
+            volume = (
+                period_df["Volume"].to_numpy(dtype=np.float64)
+                if "Volume" in period_df
+                else np.array([np.nan])
+            )
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                period_high, period_low, average_volume = (
+                    priceAnalytics.to_optional_floats(
+                        [np.nanmax(high), np.nanmin(low), np.nanmean(volume)]
+                    )
+                )
+            price_change = (
+                end_price - start_price
+                if start_price is not None and end_price is not None
+                else None
+            )
+            result["summary"] = {
+                "period_start_date": start_used,
+                "period_end_date": end_used,
+                "start_price": start_price,
+                "end_price": end_price,
+                "period_high": period_high,
+                "period_low": period_low,
+                "average_closing_price": priceAnalytics.to_optional_floats(
+                    stats["mean"]
+                )[0],
+                "average_volume": average_volume,
+                "total_volume": (
+                    int(np.nansum(volume)) if np.isfinite(volume).any() else None
+                ),
+                "price_change": price_change,
+                "price_change_percent": (
+                    price_change / start_price * 100
+                    if price_change is not None and start_price
+                    else None
+                ),
+                "data_points": len(period_df),
+            }
+        if "statistics" in groups:
+            (
+                mean_price,
+                median_price,
+                std_dev,
+                volatility_percent,
+                min_price,
+                max_price,
+            ) = priceAnalytics.to_optional_floats(
+                [
+                    stats[name][0]
+                    for name in (
+                        "mean",
+                        "median",
+                        "std",
+                        "volatility_percent",
+                        "min",
+                        "max",
+                    )
+                ]
+            )
+            result["statistics"] = {
+                "mean_price": mean_price,
+                "median_price": median_price,
+                "standard_deviation": std_dev,
+                "volatility_percent": volatility_percent,
+                "minimum_price": min_price,
+                "maximum_price": max_price,
+            }
+        if "returns" in groups:
+            total_return, annualized_return = priceAnalytics.to_optional_floats(
+                [
+                    returns["total_return_percent"][0],
+                    returns["annualized_return_percent"][0],
+                ]
+            )
+            result["returns"] = {
+                "start_date_used": start_used,
+                "end_date_used": end_used,
+                "start_price": start_price,
+                "end_price": end_price,
+                "total_return_percent": total_return,
+                "annualized_return_percent": annualized_return,
+            }
+        if "trend" in groups:
+            trend = priceAnalytics.compute_trends(
+                history_df[["Close"]].to_numpy(dtype=np.float64), window1, window2
+            )
+            if trend["row"][0] == priceAnalytics.NO_INDEX:
+                result["trend"] = {
+                    "error": f"Could not calculate the SMA trend for {ticker}: history is too short or has gaps near the end."
+                }
+            else:
+                current_price, sma_short, sma_long = priceAnalytics.to_optional_floats(
+                    [
+                        trend["current_price"][0],
+                        trend["sma_short"][0],
+                        trend["sma_long"][0],
+                    ]
+                )
+                result["trend"] = {
+                    "current_price": current_price,
+                    f"sma_{window1}_day": sma_short,
+                    f"sma_{window2}_day": sma_long,
+                    "trend_signal": str(trend["trend_signal"][0]),
+                }
+
+        result["message"] = (
+            f"Price analytics ({', '.join(groups)}) for {ticker} from {start_used} to {end_used} calculated."
+        )
+        logger.info(f"Price analytics calculated for {ticker}: {groups}")
+        return result
+
+    except Exception as e:
+        logger.exception(f"Error calculating price analytics for {ticker}: {e}")
+        return {"error": f"Error calculating price analytics for {ticker}: {str(e)}"}
@@ -321,6 +321,160 @@ CALCULATE_RETURNS_TOOL = {
 }
 
 
+SCREEN_PRICE_TRENDS_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "screen_price_trends",
+        "description": "Screens many stocks at once (a watchlist, portfolio or index members) for their SMA trend. Returns each ticker's current price, short- and long-term SMAs and trend signal, plus lists of tickers above and below the long-term SMA. Use for questions like 'which of these stocks are above their 200-day moving average'.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "tickers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "The stock ticker symbols to screen (e.g., ['AAPL', 'MSFT', 'NVDA']).",
+                },
+                "data_vendor": {
+                    "type": "string",
+                    "description": "The preferred data source",
+                    "enum": ["yfinance", "financialDatasetsAI"],
+                    "default": "yfinance",
+                },
+                "window1": {
+                    "type": "integer",
+                    "description": "Short-term moving average window.",
+                    "default": 50,
+                },
+                "window2": {
+                    "type": "integer",
+                    "description": "Long-term moving average window.",
+                    "default": 200,
+                },
+            },
+            "required": ["tickers"],
+        },
+    },
+}
+
+
+CALCULATE_TECHNICAL_INDICATORS_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "calculate_technical_indicators",
+        "description": "Calculates technical indicators for a stock from its daily prices: EMA, RSI, MACD, Bollinger bands, ATR (average true range) and annualized rolling volatility. Several indicators requested together are computed in one call. Returns the latest values with a short interpretation (e.g., RSI overbought/oversold, MACD bullish/bearish). Use for technical analysis questions.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "ticker": {
+                    "type": "string",
+                    "description": "The stock ticker symbol (e.g., AAPL, MSFT).",
+                },
+                "indicators": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": [
+                            "ema",
+                            "rsi",
+                            "macd",
+                            "bollinger",
+                            "atr",
+                            "volatility",
+                        ],
+                    },
+                    "description": "Indicators to calculate. Optional, defaults to all of them.",
+                },
+                "data_vendor": {
+                    "type": "string",
+                    "description": "The preferred data source",
+                    "enum": ["yfinance", "financialDatasetsAI"],
+                    "default": "yfinance",
+                },
+                "ema_span": {
+                    "type": "integer",
+                    "description": "EMA span in days.",
+                    "default": 20,
+                },
+                "rsi_window": {
+                    "type": "integer",
+                    "description": "RSI lookback in days.",
+                    "default": 14,
+                },
+                "bollinger_window": {
+                    "type": "integer",
+                    "description": "Bollinger band window in days.",
+                    "default": 20,
+                },
+                "atr_window": {
+                    "type": "integer",
+                    "description": "ATR lookback in days.",
+                    "default": 14,
+                },
+                "volatility_window": {
+                    "type": "integer",
+                    "description": "Rolling volatility window in days.",
+                    "default": 20,
+                },
+            },
+            "required": ["ticker"],
+        },
+    },
+}
+
+
+CALCULATE_PRICE_ANALYTICS_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "calculate_price_analytics",
+        "description": "Calculates a combined price analytics bundle for a stock from a single price fetch: period summary (high/low, volume, price change), statistics (mean, median, standard deviation, volatility), returns (total and annualized) and the SMA trend signal. Prefer this over calling get_ticker_history, calculate_period_statistics, calculate_returns and calculate_price_trend separately when more than one of them is needed for the same ticker.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "ticker": {
+                    "type": "string",
+                    "description": "The stock ticker symbol (e.g., AAPL, MSFT).",
+                },
+                "include": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["summary", "statistics", "returns", "trend"],
+                    },
+                    "description": "Analytics groups to return. Optional, defaults to all of them.",
+                },
+                "data_vendor": {
+                    "type": "string",
+                    "description": "The preferred data source",
+                    "enum": ["yfinance", "financialDatasetsAI"],
+                    "default": "yfinance",
+                },
+                "start_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "The start date of the period (YYYY-MM-DD). Optional, defaults to 1 year ago.",
+                },
+                "end_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "The end date of the period (YYYY-MM-DD). Optional, defaults to today.",
+                },
+                "window1": {
+                    "type": "integer",
+                    "description": "Short SMA window in days for the trend group.",
+                    "default": 50,
+                },
+                "window2": {
+                    "type": "integer",
+                    "description": "Long SMA window in days for the trend group.",
+                    "default": 200,
+                },
+            },
+            "required": ["ticker"],
+        },
+    },
+}
+
+
 AVAILABLE_TOOLS = [
     GET_TICKER_PRICE_TOOL,
     GET_TICKER_HISTORY_TOOL,
@@ -332,4 +486,7 @@ AVAILABLE_TOOLS = [
     CALCULATE_PRICE_TREND_TOOL,
     CALCULATE_PERIOD_STATISTICS_TOOL,
     CALCULATE_RETURNS_TOOL,
+    SCREEN_PRICE_TRENDS_TOOL,
+    CALCULATE_TECHNICAL_INDICATORS_TOOL,
+    CALCULATE_PRICE_ANALYTICS_TOOL,
 ]
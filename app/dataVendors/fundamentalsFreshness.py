@@ -0,0 +1,326 @@
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from ..constants.settings import (
+    FUNDAMENTALS_FRESHNESS_ENABLED,
+    FUNDAMENTALS_TTL_SECONDS,
+    FUNDAMENTALS_CHECK_INTERVAL_SECONDS,
+    FUNDAMENTALS_CHECK_CONCURRENCY,
+    FUNDAMENTALS_SETTLE_SECONDS,
+    FUNDAMENTALS_SETTLE_TTL_SECONDS,
+    FUNDAMENTALS_MAX_TICKERS,
+)
+from .dataVendorFactory import DataVendorFactory
+from .vendorCache import VendorCache, vendor_cache
+
+logger = logging.getLogger(__name__)
+
+# Fundamentals only change when a company reports, so instead of refetching
+# them on a fixed TTL they are kept (FUNDAMENTALS_TTL_SECONDS) until an event
+# makes them stale: a new 10-Q/10-K/8-K in the ticker's SEC filings or a
+# passed earnings date. Each event invalidates exactly the affected methods
+# for that ticker and refetches the calls that were cached. Tickers are
+# tracked from the vendor cache's refresh events; a background thread checks
+# their filings and earnings calendars every check interval.
+
+# Methods whose entries get the long TTL; company info also carries market
+# data (price, market cap, PE), so it keeps its configured TTL and is only
+# invalidated early by events
+LONG_LIVED_METHODS = ("get_financial_statements", "get_earnings_history")
+TRACKED_METHODS = LONG_LIVED_METHODS + ("get_company_info",)
+# Which fundamentals each event makes stale
+PERIODIC_REPORT_FORMS = ("10-Q", "10-K", "10-Q/A", "10-K/A")
+CURRENT_REPORT_FORMS = ("8-K",)
+STALE_AFTER_REPORT = TRACKED_METHODS
+STALE_AFTER_EARNINGS = ("get_earnings_history", "get_company_info")
+# Filing and earnings dates are day-granular; anything fetched before the end
+# of that day may predate the event
+EVENT_DAY_SECONDS = 24 * 3600
+# Older filings cannot make anything tracked stale
+FILING_LOOKBACK_DAYS = 45
+
+
+def _filing_time(filing: Dict[str, Any]) -> Optional[float]:
+    epoch = filing.get("epochDate")
+    if epoch:
+        try:
+            return float(epoch)
+        except (TypeError, ValueError):
+            pass
+    try:
+        return pd.Timestamp(filing.get("date")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class _TickerState:
+    __slots__ = ("calls", "handled", "settle_until")
+
+    def __init__(self):
+        self.calls: Dict[str, Set[str]] = {}  # method -> JSON-encoded kwargs
+        self.handled: Set[Tuple[str, str]] = set()  # Events already acted on
+        self.settle_until = 0.0
+
+
+class FundamentalsFreshness:
+    def __init__(
+        self,
+        cache: VendorCache,
+        enabled: bool = FUNDAMENTALS_FRESHNESS_ENABLED,
+        check_interval: float = FUNDAMENTALS_CHECK_INTERVAL_SECONDS,
+        max_tickers: int = FUNDAMENTALS_MAX_TICKERS,
+    ):
+        self.cache = cache
+        self.enabled = enabled
+        self.check_interval = check_interval
+        self.max_tickers = max_tickers
+        # (vendor, ticker) -> state, least recently fetched first
+        self._tickers: "OrderedDict[Tuple[str, str], _TickerState]" = OrderedDict()
+        self._pending: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "checks": 0,
+            "check_errors": 0,
+            "filing_events": 0,
+            "earnings_events": 0,
+            "invalidations": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+        }
+
+    # --- vendor cache hooks ---
+
+    def ttl_for(
+        self, vendor_name: str, method: str, kwargs: Dict[str, Any]
+    ) -> Optional[int]:
+        if not self.enabled or method not in TRACKED_METHODS:
+            return None
+        with self._lock:
+            state = self._tickers.get((vendor_name.lower(), kwargs.get("ticker")))
+            settling = state is not None and state.settle_until > time.time()
+        if settling:
+            # The vendor may not have the new numbers yet; look again soon
+            return FUNDAMENTALS_SETTLE_TTL_SECONDS
+        return FUNDAMENTALS_TTL_SECONDS if method in LONG_LIVED_METHODS else None
+
+    def on_vendor_event(self, event: str, info: Dict[str, Any]):
+        if not self.enabled or event != "refresh" or not info.get("ticker"):
+            return
+        if info.get("scope"):
+            return  # Keyed entries can't be refetched without the caller's key
+        vendor_name, ticker = info["vendor"].lower(), info["ticker"]
+        if info["method"] in TRACKED_METHODS:
+            self._track(vendor_name, ticker, info["method"], info["kwargs"])
+        elif info["method"] == "get_sec_filings":
+            # Whoever fetched the filings, new reports are acted on right away
+            self.check_filings(vendor_name, ticker, info["value"])
+
+    def _track(
+        self, vendor_name: str, ticker: str, method: str, kwargs: Dict[str, Any]
+    ):
+        key = (vendor_name, ticker)
+        with self._lock:
+            state = self._tickers.get(key)
+            if state is None:
+                state = self._tickers[key] = _TickerState()
+            self._tickers.move_to_end(key)
+            state.calls.setdefault(method, set()).add(
+                json.dumps(kwargs, sort_keys=True, default=str)
+            )
+            while len(self._tickers) > self.max_tickers:
+                self._tickers.popitem(last=False)
+        self._ensure_thread()
+
+    # --- events ---
+
+    def _fetched_before(
+        self, vendor_name: str, ticker: str, methods: Iterable[str], event_time: float
+    ) -> List[str]:
+        # Methods with a cached call fetched before the event could be known
+        with self._lock:
+            state = self._tickers.get((vendor_name, ticker))
+            calls = (
+                {
+                    method: [
+                        json.loads(kwargs) for kwargs in state.calls.get(method, ())
+                    ]
+                    for method in methods
+                }
+                if state is not None
+                else {}
+            )
+        stale = []
+        for method, kwargs_list in calls.items():
+            for kwargs in kwargs_list:
+                entry = self.cache.entry_info(vendor_name, method, kwargs)
+                if (
+                    entry is not None
+                    and entry["fetched_at"] < event_time + EVENT_DAY_SECONDS
+                ):
+                    stale.append(method)
+                    break
+        return stale
+
+    def _handle(
+        self,
+        vendor_name: str,
+        ticker: str,
+        event: Tuple[str, str],
+        event_time: float,
+        methods: Iterable[str],
+    ) -> bool:
+        with self._lock:
+            state = self._tickers.get((vendor_name, ticker))
+            if state is None or event in state.handled:
+                return False
+            state.handled.add(event)
+        stale = self._fetched_before(vendor_name, ticker, methods, event_time)
+        if not stale:
+            return False
+        logger.info(
+            f"{event[0]} {event[1]} for {ticker}: refreshing {', '.join(stale)}."
+        )
+        with self._lock:
+            state.settle_until = time.time() + FUNDAMENTALS_SETTLE_SECONDS
+            refreshes = [
+                (method, json.loads(kwargs))
+                for method in stale
+                for kwargs in state.calls.get(method, ())
+            ]
+        removed = sum(
+            self.cache.invalidate(vendor_name, method, ticker) for method in stale
+        )
+        with self._lock:
+            self._stats["invalidations"] += removed
+            self._pending.extend(
+                (vendor_name, method, kwargs) for method, kwargs in refreshes
+            )
+        self._wake.set()
+        return True
+
+    def check_filings(self, vendor_name: str, ticker: str, filings: Any):
+        if not isinstance(filings, list):
+            return
+        horizon = time.time() - FILING_LOOKBACK_DAYS * 24 * 3600
+        for filing in filings:
+            if not isinstance(filing, dict):
+                continue
+            form = str(filing.get("type") or "").upper()
+            if form in PERIODIC_REPORT_FORMS:
+                methods = STALE_AFTER_REPORT
+            elif form in CURRENT_REPORT_FORMS:
+                methods = STALE_AFTER_EARNINGS
+            else:
+                continue
+            filed_at = _filing_time(filing)
+            if filed_at is None or filed_at < horizon:
+                continue
+            event = (form, str(filing.get("edgarUrl") or filed_at))
+            if self._handle(vendor_name, ticker, event, filed_at, methods):
+                with self._lock:
+                    self._stats["filing_events"] += 1
+
+    def check_earnings(self, vendor_name: str, ticker: str, calendar: Any):
+        if not isinstance(calendar, dict):
+            return
+        now = time.time()
+        for day in calendar.get("earnings_dates") or []:
+            try:
+                reported_at = pd.Timestamp(day).timestamp()
+            except (TypeError, ValueError):
+                continue
+            if reported_at > now:
+                continue  # Not reported yet; checked again next interval
+            if self._handle(
+                vendor_name,
+                ticker,
+                ("earnings", str(day)),
+                reported_at,
+                STALE_AFTER_EARNINGS,
+            ):
+                with self._lock:
+                    self._stats["earnings_events"] += 1
+
+    # --- background checks ---
+
+    def _check_ticker(self, vendor_name: str, ticker: str):
+        # Through the shared cache: filings and calendars are fetched at most
+        # once per their TTL however often this runs
+        vendor = DataVendorFactory.get_vendor(vendor_name)
+        try:
+            self.check_filings(
+                vendor_name, ticker, vendor.get_sec_filings(ticker=ticker)
+            )
+            self.check_earnings(
+                vendor_name, ticker, vendor.get_earnings_calendar(ticker=ticker)
+            )
+        except Exception as e:
+            logger.warning(f"Fundamentals freshness check failed for {ticker}: {e}")
+            with self._lock:
+                self._stats["check_errors"] += 1
+
+    def check_all(self):
+        with self._lock:
+            tickers = list(self._tickers)
+            self._stats["checks"] += 1
+        if not tickers:
+            return
+        workers = max(1, min(FUNDAMENTALS_CHECK_CONCURRENCY, len(tickers)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda key: self._check_ticker(*key), tickers))
+
+    def _refresh_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for vendor_name, method, kwargs in pending:
+            try:
+                vendor = DataVendorFactory.get_vendor(vendor_name)
+                getattr(vendor, method)(**kwargs)
+                with self._lock:
+                    self._stats["refreshes"] += 1
+            except Exception as e:
+                logger.warning(f"Fundamentals refresh of {method} {kwargs} failed: {e}")
+                with self._lock:
+                    self._stats["refresh_errors"] += 1
+
+    def _run(self):
+        next_check = time.monotonic()
+        while True:
+            self._wake.wait(max(next_check - time.monotonic(), 0.0))
+            self._wake.clear()
+            self._refresh_pending()
+            if time.monotonic() >= next_check:
+                self.check_all()
+                self._refresh_pending()
+                next_check = time.monotonic() + self.check_interval
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="fundamentals-freshness", daemon=True
+            )
+            self._thread.start()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["tickers"] = len(self._tickers)
+            stats["pending_refreshes"] = len(self._pending)
+            stats["enabled"] = self.enabled
+        return stats
+
+
+fundamentals_freshness = FundamentalsFreshness(vendor_cache)
+vendor_cache.set_ttl_policy(fundamentals_freshness.ttl_for)
+vendor_cache.add_listener(fundamentals_freshness.on_vendor_event)
@@ -0,0 +1,399 @@
+import os
+import json
+import math
+import time
+import sqlite3
+import logging
+import threading
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from ..constants.settings import (
+    INDICATOR_STATE_ENABLED,
+    INDICATOR_MAX_WINDOW,
+    INDICATOR_DEFAULT_WINDOWS,
+    INDICATOR_STATE_DB_PATH,
+    INDICATOR_PERSIST_INTERVAL_SECONDS,
+)
+from . import tradingCalendar
+from .vendorCache import vendor_cache
+
+logger = logging.getLogger(__name__)
+
+# Daily frames whose last bar is older than this are history queries, not
+# updates to the live series.
+RECENT_BAR_DAYS = 5
+# Running sums are rebuilt from the buffer this often to cancel float drift
+RESYNC_EVERY_BARS = 1024
+# Completed bars that differ from the buffer by more than this (relative) mean
+# the vendor re-adjusted the series for a split or dividend
+ADJUSTMENT_TOLERANCE = 1e-6
+
+
+class RollingWindows:
+    # Ring buffer of the latest closes plus a running sum per SMA window, so
+    # adding a bar and reading an SMA are O(1) per window.
+    def __init__(self, capacity: int):
+        # One extra slot holds the value leaving the largest window
+        self.capacity = capacity + 1
+        self._buffer = [0.0] * self.capacity
+        self._next = 0
+        self.count = 0
+        self._sums: Dict[int, float] = {}
+        self._pushes = 0
+
+    def _at(self, offset: int) -> float:
+        # offset 0 is the latest close
+        return self._buffer[(self._next - 1 - offset) % self.capacity]
+
+    def latest(self) -> Optional[float]:
+        return self._at(0) if self.count else None
+
+    def size(self) -> int:
+        return min(self.count, self.capacity - 1)
+
+    def is_full(self) -> bool:
+        return self.size() == self.capacity - 1
+
+    def values(self):
+        # Oldest to newest
+        return [self._at(offset) for offset in range(self.size() - 1, -1, -1)]
+
+    def tracked(self):
+        return sorted(self._sums)
+
+    def track(self, window: int):
+        if window in self._sums or window >= self.capacity:
+            return
+        size = min(self.count, window)
+        self._sums[window] = math.fsum(self._at(offset) for offset in range(size))
+
+    def push(self, close: float):
+        self._buffer[self._next] = close
+        self._next = (self._next + 1) % self.capacity
+        self.count += 1
+        for window in self._sums:
+            self._sums[window] += close
+            if self.count > window:
+                self._sums[window] -= self._at(window)
+        self._pushes += 1
+        if self._pushes % RESYNC_EVERY_BARS == 0:
+            for window in list(self._sums):
+                del self._sums[window]
+                self.track(window)
+
+    def replace_latest(self, close: float):
+        # Intraday updates revise today's bar instead of adding one
+        delta = close - self._at(0)
+        self._buffer[(self._next - 1) % self.capacity] = close
+        for window in self._sums:
+            self._sums[window] += delta
+
+    def sma(self, window: int) -> Optional[float]:
+        if self.count < window or window >= self.capacity:
+            return None
+        self.track(window)
+        return self._sums[window] / window
+
+
+class TickerIndicatorState:
+    def __init__(self, capacity: int = INDICATOR_MAX_WINDOW):
+        self.capacity = capacity
+        self.windows = RollingWindows(capacity)
+        for window in INDICATOR_DEFAULT_WINDOWS:
+            self.windows.track(window)
+        # Dates of the newest buffered closes (states persisted before dates
+        # were kept have fewer dates than closes until they fill up)
+        self.bar_dates: Deque[date] = deque(maxlen=capacity)
+        self.last_bar: Optional[date] = None
+        self.updated_at = 0.0
+
+    def _reset(self):
+        tracked = self.windows.tracked()
+        self.windows = RollingWindows(self.capacity)
+        for window in tracked:
+            self.windows.track(window)
+        self.bar_dates.clear()
+        self.last_bar = None
+
+    def on_bar(self, bar_date: date, close: float) -> bool:
+        if close is None or not math.isfinite(close):
+            return False
+        if self.last_bar is not None and bar_date < self.last_bar:
+            return False
+        if self.last_bar is not None and bar_date == self.last_bar:
+            self.windows.replace_latest(close)
+        else:
+            self.windows.push(close)
+            self.bar_dates.append(bar_date)
+            self.last_bar = bar_date
+        self.updated_at = time.time()
+        return True
+
+    def _adjusted(self, bar_dates: list, closes: list) -> bool:
+        # Compares the frame's bars before last_bar with the buffered closes
+        # of the same dates (last_bar itself is revised, not compared)
+        values = self.windows.values()
+        buffered = dict(
+            zip(self.bar_dates, values[len(values) - len(self.bar_dates) :])
+        )
+        return any(
+            not math.isclose(close, buffered[bar_date], rel_tol=ADJUSTMENT_TOLERANCE)
+            for bar_date, close in zip(bar_dates, closes)
+            if bar_date < self.last_bar and bar_date in buffered
+        )
+
+    def sync(self, closes: pd.Series) -> int:
+        # Normally applies only the bars at or after the last one seen. Reseeds
+        # when the frame doesn't overlap the state (e.g. after an outage),
+        # carries more history than a not-yet-full buffer holds, or revises
+        # closes the buffer already has (split or dividend re-adjustment).
+        # Frames ending before last_bar are older queries and are ignored.
+        closes = closes.dropna()
+        if closes.empty:
+            return 0
+        bar_dates = [_bar_date(index) for index in closes.index]
+        values = closes.to_numpy(dtype=float).tolist()
+        if self.last_bar is not None and bar_dates[-1] < self.last_bar:
+            return 0
+        if self.last_bar is not None and (
+            bar_dates[0] > self.last_bar
+            or (not self.windows.is_full() and len(closes) > self.windows.size())
+            or self._adjusted(bar_dates, values)
+        ):
+            self._reset()
+        applied = 0
+        for bar_date, close in zip(bar_dates, values):
+            if self.last_bar is None or bar_date >= self.last_bar:
+                applied += self.on_bar(bar_date, float(close))
+        self.updated_at = time.time()
+        return applied
+
+    def is_fresh(self, last_session: date) -> bool:
+        # Current once it holds the last completed session; forming bars are
+        # never applied, so its SMAs stay valid until the next close
+        return self.last_bar is not None and self.last_bar >= last_session
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "closes": self.windows.values(),
+            "bar_dates": [bar_date.isoformat() for bar_date in self.bar_dates],
+            "last_bar": self.last_bar.isoformat() if self.last_bar else None,
+            "updated_at": self.updated_at,
+            "windows": self.windows.tracked(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "TickerIndicatorState":
+        state = cls()
+        for close in payload.get("closes", []):
+            state.windows.push(close)
+        for window in payload.get("windows", []):
+            state.windows.track(window)
+        state.bar_dates.extend(
+            date.fromisoformat(bar_date) for bar_date in payload.get("bar_dates", [])
+        )
+        if payload.get("last_bar"):
+            state.last_bar = date.fromisoformat(payload["last_bar"])
+        state.updated_at = payload.get("updated_at", 0.0)
+        return state
+
+
+def _bar_date(index: Any) -> date:
+    if isinstance(index, datetime):
+        return index.date()
+    if isinstance(index, date):
+        return index
+    return pd.Timestamp(index).date()
+
+
+def _forming_day(ticker: str) -> date:
+    # Same cut-off as tradingCalendar.bars_window: today's bar is still forming
+    calendar = tradingCalendar.calendar_for(ticker)
+    return (
+        pd.Timestamp(calendar.today()).date() if calendar is not None else date.today()
+    )
+
+
+def _is_forming(ticker: str, bar_date: date) -> bool:
+    return bar_date >= _forming_day(ticker)
+
+
+def _last_session(ticker: str) -> date:
+    start, _ = tradingCalendar.bars_window(ticker, 1, fallback_days=1)
+    return date.fromisoformat(start)
+
+
+class IndicatorStore:
+    def __init__(
+        self,
+        enabled: bool = INDICATOR_STATE_ENABLED,
+        db_path: Optional[str] = INDICATOR_STATE_DB_PATH,
+    ):
+        self.enabled = enabled
+        self.db_path = db_path
+        self._states: Dict[str, TickerIndicatorState] = {}
+        self._persisted_at: Dict[str, float] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._stats = {
+            "reads": 0,
+            "hits": 0,
+            "bars_applied": 0,
+            "syncs": 0,
+            "persisted": 0,
+        }
+
+    @staticmethod
+    def _key(vendor_name: str, ticker: str) -> str:
+        return f"{vendor_name.lower()}:{ticker.upper()}"
+
+    # --- persistence (SQLite next to the session store) ---
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.db_path:
+            try:
+                directory = os.path.dirname(self.db_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS indicator_state (key TEXT PRIMARY KEY, payload TEXT NOT NULL, updated_at REAL NOT NULL)"
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Indicator state persistence disabled: {e}")
+                self.db_path = None
+                self._conn = None
+        return self._conn
+
+    def _load_all(self):
+        # Called with the lock held, once per process
+        self._loaded = True
+        conn = self._connection()
+        if conn is None:
+            return
+        rows = conn.execute("SELECT key, payload FROM indicator_state").fetchall()
+        for key, payload in rows:
+            try:
+                self._states[key] = TickerIndicatorState.from_dict(json.loads(payload))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Skipping unreadable indicator state {key}: {e}")
+        logger.info(f"Loaded {len(rows)} indicator states from {self.db_path}.")
+
+    def _persist(self, key: str, state: TickerIndicatorState, force: bool = False):
+        # Called with the lock held; throttled per ticker
+        now = time.time()
+        if not force and (
+            now - self._persisted_at.get(key, 0.0) < INDICATOR_PERSIST_INTERVAL_SECONDS
+        ):
+            return
+        conn = self._connection()
+        if conn is None:
+            return
+        conn.execute(
+            "INSERT OR REPLACE INTO indicator_state (key, payload, updated_at) VALUES (?, ?, ?)",
+            (key, json.dumps(state.to_dict()), now),
+        )
+        conn.commit()
+        self._persisted_at[key] = now
+        self._stats["persisted"] += 1
+
+    # --- updates ---
+
+    def _state(self, key: str) -> TickerIndicatorState:
+        if not self._loaded:
+            self._load_all()
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = TickerIndicatorState()
+        return state
+
+    def on_bar(
+        self, vendor_name: str, ticker: str, bar_date: date, close: float
+    ) -> bool:
+        # Entry point for streaming updates (quote poller); O(1) per window.
+        # Only completed sessions are applied: a forming bar would be
+        # persisted and outlive the poller if it stopped before the close.
+        if not self.enabled or _is_forming(ticker, bar_date):
+            return False
+        key = self._key(vendor_name, ticker)
+        with self._lock:
+            state = self._state(key)
+            applied = state.on_bar(bar_date, close)
+            if applied:
+                self._stats["bars_applied"] += 1
+                self._persist(key, state)
+        return applied
+
+    def sync_frame(self, vendor_name: str, ticker: str, frame: pd.DataFrame) -> int:
+        if not self.enabled or frame is None or frame.empty or "Close" not in frame:
+            return 0
+        # Frames ending today carry the forming bar; like on_bar, only
+        # completed sessions enter the state
+        forming_day = _forming_day(ticker)
+        closes = frame["Close"]
+        closes = closes[[_bar_date(index) < forming_day for index in closes.index]]
+        if closes.empty:
+            return 0
+        last_bar = _bar_date(closes.index[-1])
+        if last_bar < date.today() - timedelta(days=RECENT_BAR_DAYS):
+            return 0  # Historical range, not the live series
+        key = self._key(vendor_name, ticker)
+        with self._lock:
+            state = self._state(key)
+            applied = state.sync(closes)
+            self._stats["syncs"] += 1
+            self._stats["bars_applied"] += applied
+            self._persist(key, state, force=applied > 1)
+        return applied
+
+    def on_vendor_event(self, event: str, info: Dict[str, Any]):
+        if event == "invalidate":
+            return  # Cached state stays valid; the next refresh realigns it
+        if info.get("method") != "get_prices" or not info.get("ticker"):
+            return
+        if info.get("scope"):
+            return  # Fetched with a caller's API key; the state is shared
+        if info["kwargs"].get("interval") not in ("day", "1d"):
+            return
+        self.sync_frame(info["vendor"], info["ticker"], info.get("value"))
+
+    # --- reads ---
+
+    def sma_snapshot(
+        self, vendor_name: str, ticker: str, windows: Iterable[int]
+    ) -> Optional[Tuple[float, Dict[int, float], date]]:
+        # Latest close and SMAs, or None if the state is missing, stale (lacks
+        # the last completed session) or short
+        if not self.enabled:
+            return None
+        key = self._key(vendor_name, ticker)
+        last_session = _last_session(ticker)
+        with self._lock:
+            self._stats["reads"] += 1
+            if not self._loaded:
+                self._load_all()
+            state = self._states.get(key)
+            if state is None or not state.is_fresh(last_session):
+                return None
+            smas = {window: state.windows.sma(window) for window in windows}
+            if any(value is None for value in smas.values()):
+                return None
+            self._stats["hits"] += 1
+            return state.windows.latest(), smas, state.last_bar
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["tickers"] = len(self._states)
+        stats["hit_rate"] = stats["hits"] / stats["reads"] if stats["reads"] else 0.0
+        return stats
+
+
+indicator_store = IndicatorStore()
+vendor_cache.add_listener(indicator_store.on_vendor_event)
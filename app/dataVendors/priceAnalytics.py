@@ -0,0 +1,193 @@
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Vectorized price analytics over an aligned (dates x tickers) matrix. Every
+# function works column-wise in a few NumPy passes, so one ticker and a
+# 300-ticker universe go through the same code.
+
+NO_INDEX = -1
+
+
+def price_matrix(
+    frames: Dict[str, pd.DataFrame], column: str = "Close"
+) -> Tuple[np.ndarray, pd.DatetimeIndex, List[str]]:
+    # Aligns each ticker's column on the union of dates; gaps become NaN
+    tickers = [
+        ticker
+        for ticker, frame in frames.items()
+        if frame is not None and not frame.empty and column in frame.columns
+    ]
+    if not tickers:
+        return np.empty((0, 0)), pd.DatetimeIndex([]), []
+    aligned = pd.concat({ticker: frames[ticker][column] for ticker in tickers}, axis=1)
+    aligned = aligned.sort_index()
+    return aligned.to_numpy(dtype=np.float64), pd.DatetimeIndex(aligned.index), tickers
+
+
+def to_optional_floats(values: np.ndarray) -> List[Optional[float]]:
+    # NaN/inf -> None in one pass, for JSON-ready results
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isfinite(values), values, None).tolist()
+
+
+def rolling_mean(matrix: np.ndarray, window: int) -> np.ndarray:
+    # Same semantics as rolling(window, min_periods=window).mean(): a window
+    # containing any NaN yields NaN.
+    rows = matrix.shape[0]
+    result = np.full(matrix.shape, np.nan)
+    if window <= 0 or rows < window:
+        return result
+    valid = np.isfinite(matrix)
+    sums = np.cumsum(np.where(valid, matrix, 0.0), axis=0)
+    counts = np.cumsum(valid, axis=0)
+    zero_row = np.zeros((1, matrix.shape[1]))
+    sums = np.vstack([zero_row, sums])
+    counts = np.vstack([zero_row, counts])
+    window_sums = sums[window:] - sums[:-window]
+    window_counts = counts[window:] - counts[:-window]
+    result[window - 1 :] = np.where(
+        window_counts == window, window_sums / window, np.nan
+    )
+    return result
+
+
+def first_valid_index(matrix: np.ndarray) -> np.ndarray:
+    valid = np.isfinite(matrix)
+    index = valid.argmax(axis=0)
+    return np.where(valid.any(axis=0), index, NO_INDEX)
+
+
+def last_valid_index(matrix: np.ndarray) -> np.ndarray:
+    valid = np.isfinite(matrix)
+    index = matrix.shape[0] - 1 - valid[::-1].argmax(axis=0)
+    return np.where(valid.any(axis=0), index, NO_INDEX)
+
+
+def _take(matrix: np.ndarray, index: np.ndarray) -> np.ndarray:
+    columns = np.arange(matrix.shape[1])
+    values = matrix[np.clip(index, 0, None), columns]
+    return np.where(index == NO_INDEX, np.nan, values)
+
+
+def trend_signals(
+    price: np.ndarray,
+    sma_short: np.ndarray,
+    sma_long: np.ndarray,
+    window1: int,
+    window2: int,
+) -> np.ndarray:
+    # Conditions are checked in order; the first match wins
+    with np.errstate(invalid="ignore"):
+        conditions = [
+            (price > sma_short) & (sma_short > sma_long),
+            (sma_short > price) & (price > sma_long),
+            (sma_long > price) & (price > sma_short),
+            (sma_short > sma_long) & (sma_long > price),
+            (sma_long > sma_short) & (sma_short > price),
+            (price > sma_long) & (sma_long > sma_short),
+            (np.abs(price - sma_short) < 0.005 * price)
+            | (np.abs(price - sma_long) < 0.005 * price),
+        ]
+    choices = [
+        f"Strong Uptrend (Price > SMA{window1} > SMA{window2})",
+        f"Potential Uptrend/Correction Below SMA{window1} (SMA{window1} > Price > SMA{window2})",
+        f"Potential Downtrend/Rally Below SMA{window2} (SMA{window2} > Price > SMA{window1})",
+        f"Strong Downtrend (Price < SMA{window2} < SMA{window1})",
+        f"Strong Downtrend (Price < SMA{window1} < SMA{window2})",
+        f"Potential Uptrend/Consolidation Above SMA{window2} (Price > SMA{window2} > SMA{window1})",
+        "Price Testing SMA(s)",
+    ]
+    signals = np.select(conditions, choices, default="Neutral / Sideways")
+    complete = np.isfinite(price) & np.isfinite(sma_short) & np.isfinite(sma_long)
+    return np.where(complete, signals, "Indeterminate")
+
+
+def compute_trends(
+    matrix: np.ndarray, window1: int = 50, window2: int = 200
+) -> Dict[str, np.ndarray]:
+    sma_short_all = rolling_mean(matrix, window1)
+    sma_long_all = rolling_mean(matrix, window2)
+    # Latest row where both SMAs are defined, per column
+    both_valid = np.where(
+        np.isfinite(sma_short_all) & np.isfinite(sma_long_all), 1.0, np.nan
+    )
+    row = last_valid_index(both_valid)
+    price = _take(matrix, row)
+    sma_short = _take(sma_short_all, row)
+    sma_long = _take(sma_long_all, row)
+    return {
+        "row": row,
+        "current_price": price,
+        "sma_short": sma_short,
+        "sma_long": sma_long,
+        "trend_signal": trend_signals(price, sma_short, sma_long, window1, window2),
+        "above_sma_short": np.where(row == NO_INDEX, False, price > sma_short),
+        "above_sma_long": np.where(row == NO_INDEX, False, price > sma_long),
+    }
+
+
+def compute_statistics(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    with warnings.catch_warnings():
+        # All-NaN columns legitimately produce NaN results
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        count = np.isfinite(matrix).sum(axis=0)
+        mean = np.nanmean(matrix, axis=0)
+        std = np.where(count > 1, np.nanstd(matrix, axis=0, ddof=1), np.nan)
+        stats = {
+            "count": count,
+            "mean": mean,
+            "median": np.nanmedian(matrix, axis=0),
+            "std": std,
+            "volatility_percent": np.where(mean != 0, std / mean * 100, np.nan),
+            "min": np.nanmin(matrix, axis=0),
+            "max": np.nanmax(matrix, axis=0),
+        }
+    return stats
+
+
+def compute_returns(
+    matrix: np.ndarray, dates: pd.DatetimeIndex
+) -> Dict[str, np.ndarray]:
+    start_row = first_valid_index(matrix)
+    end_row = last_valid_index(matrix)
+    start_price = _take(matrix, start_row)
+    end_price = _take(matrix, end_row)
+    # Calendar days between the first and last valid closes
+    dates = pd.DatetimeIndex(dates)
+    day_numbers = (
+        (dates.tz_localize(None) if dates.tz is not None else dates)
+        .normalize()
+        .to_numpy(dtype="datetime64[D]")
+        .astype(np.int64)
+    )
+    if len(day_numbers):
+        days = np.where(
+            start_row == NO_INDEX,
+            0,
+            day_numbers[np.clip(end_row, 0, None)]
+            - day_numbers[np.clip(start_row, 0, None)],
+        )
+    else:
+        days = np.zeros(matrix.shape[1], dtype=np.int64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        valid_start = np.isfinite(start_price) & (start_price != 0)
+        total = np.where(
+            valid_start, (end_price - start_price) / start_price * 100, np.nan
+        )
+        base = 1 + total / 100
+        years = days / 365.25
+        annualized = np.where(
+            (days > 0) & (base >= 0), (base ** (1 / years) - 1) * 100, np.nan
+        )
+    return {
+        "start_row": start_row,
+        "end_row": end_row,
+        "start_price": start_price,
+        "end_price": end_price,
+        "days": days,
+        "total_return_percent": total,
+        "annualized_return_percent": annualized,
+    }
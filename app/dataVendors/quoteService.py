@@ -0,0 +1,272 @@
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+
+from ..constants.settings import (
+    QUOTE_POLL_INTERVAL_SECONDS,
+    QUOTE_POLL_CONCURRENCY,
+    QUOTE_IDLE_SECONDS,
+    QUOTE_QUEUE_SIZE,
+)
+from .dataVendorFactory import DataVendorFactory
+from .indicatorState import indicator_store
+
+logger = logging.getLogger(__name__)
+
+# Latest price, previous close and volume per ticker, shared by every caller. One
+# poll loop fetches each active ticker once per interval, however many tools
+# and WebSocket clients ask for it, and pushes changed quotes to subscribers.
+# A ticker stays active while it has subscribers or was read within
+# QUOTE_IDLE_SECONDS.
+
+POLL_VENDOR = "yfinance"
+
+
+# Cheapest quote fields: a few days of daily bars, no company profile
+POLL_FIELDS = ("price", "previous_close", "volume")
+
+
+def _with_change(quote: Dict[str, Any]) -> Dict[str, Any]:
+    price, previous_close = quote["price"], quote["previous_close"]
+    change = change_percent = None
+    if price is not None and previous_close is not None:
+        change = price - previous_close
+        if previous_close != 0:
+            change_percent = change / previous_close * 100
+    quote.update(change=change, change_percent=change_percent, updated_at=time.time())
+    return quote
+
+
+class QuoteService:
+    def __init__(
+        self,
+        interval: float = QUOTE_POLL_INTERVAL_SECONDS,
+        concurrency: int = QUOTE_POLL_CONCURRENCY,
+        idle_seconds: float = QUOTE_IDLE_SECONDS,
+    ):
+        self.interval = interval
+        self.concurrency = concurrency
+        self.idle_seconds = idle_seconds
+        self._quotes: Dict[str, Dict[str, Any]] = {}  # "vendor:TICKER" -> quote
+        self._last_read: Dict[str, float] = {}  # Polled tickers read by tools
+        self._subscribers: Dict[asyncio.Queue, Set[str]] = {}
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._evicted_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "reads": 0,
+            "hits": 0,
+            "direct_fetches": 0,
+            "polls": 0,
+            "polled_tickers": 0,
+            "pushes": 0,
+            "dropped_pushes": 0,
+        }
+
+    @staticmethod
+    def _key(vendor_name: str, ticker: str) -> str:
+        return f"{vendor_name.lower()}:{ticker.upper()}"
+
+    # --- fetching ---
+
+    def _fetch(
+        self, vendor_name: str, ticker: str, api_key: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        # get_quote is not a cached vendor method, so every poll sees fresh bars
+        vendor = DataVendorFactory.get_vendor(vendor_name=vendor_name, api_key=api_key)
+        quote = vendor.get_quote(ticker, fields=POLL_FIELDS)
+        if quote is None:
+            return None
+        quote = _with_change(quote)
+        with self._lock:
+            self._quotes[self._key(vendor_name, ticker)] = quote
+        if quote["price"] is not None:
+            # Closes a session the daily frame hasn't brought in yet; today's
+            # forming bar is ignored by the state
+            indicator_store.on_bar(
+                vendor_name,
+                ticker,
+                pd.Timestamp(quote["as_of"]).date(),
+                quote["price"],
+            )
+        return quote
+
+    def _fresh(self, key: str) -> Optional[Dict[str, Any]]:
+        # One interval of slack so reads between two polls never refetch
+        quote = self._quotes.get(key)
+        if quote is not None and time.time() - quote["updated_at"] <= 2 * self.interval:
+            return quote
+        return None
+
+    def _evict(self, now: float):
+        # Called with the lock held, at most once per interval. Quotes not
+        # polled or fetched within idle_seconds go, and so do their fetch locks.
+        if now - self._evicted_at < self.interval:
+            return
+        self._evicted_at = now
+        for key, quote in list(self._quotes.items()):
+            if now - quote["updated_at"] > self.idle_seconds:
+                del self._quotes[key]
+        for key, fetch_lock in list(self._fetch_locks.items()):
+            if key not in self._quotes and not fetch_lock.locked():
+                del self._fetch_locks[key]
+
+    def get_quote(
+        self, vendor_name: str, ticker: str, api_key: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        # Polled quote when there is one; otherwise one direct fetch shared by
+        # all concurrent callers and reused for the next couple of intervals.
+        # Quotes are shared per vendor and ticker whichever key fetched them.
+        key = self._key(vendor_name, ticker)
+        with self._lock:
+            self._stats["reads"] += 1
+            self._evict(time.time())
+            if vendor_name.lower() == POLL_VENDOR:
+                self._last_read[ticker.upper()] = time.time()
+            quote = self._fresh(key)
+            if quote is not None:
+                self._stats["hits"] += 1
+                return dict(quote)
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+        with fetch_lock:
+            with self._lock:
+                quote = self._fresh(key)
+            if quote is None:
+                with self._lock:
+                    self._stats["direct_fetches"] += 1
+                quote = self._fetch(vendor_name, ticker, api_key)
+        return dict(quote) if quote is not None else None
+
+    # --- polling ---
+
+    def _active_tickers(self) -> List[str]:
+        now = time.time()
+        with self._lock:
+            self._evict(now)
+            for ticker, read_at in list(self._last_read.items()):
+                if now - read_at > self.idle_seconds:
+                    del self._last_read[ticker]
+            tickers = set(self._last_read)
+            for subscribed in self._subscribers.values():
+                tickers |= subscribed
+        return sorted(tickers)
+
+    def _poll(self, tickers: List[str]) -> List[Dict[str, Any]]:
+        # One fetch per distinct ticker, spread over at most `concurrency`
+        # workers; failed tickers keep their last quote
+        def fetch(ticker: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self._fetch(POLL_VENDOR, ticker)
+            except Exception as e:
+                logger.warning(f"Quote poll failed for {ticker}: {e}")
+                return None
+
+        workers = max(1, min(self.concurrency, len(tickers)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [quote for quote in executor.map(fetch, tickers) if quote]
+
+    async def _run(self):
+        previous: Dict[str, tuple] = {}
+        while True:
+            tickers = self._active_tickers()
+            if not tickers:
+                with self._lock:
+                    if not self._subscribers:
+                        self._task = None
+                        logger.info("Quote poller stopped (no active tickers).")
+                        return
+            started = time.monotonic()
+            quotes = await asyncio.to_thread(self._poll, tickers) if tickers else []
+            with self._lock:
+                self._stats["polls"] += 1
+                self._stats["polled_tickers"] += len(tickers)
+            for quote in quotes:
+                # Subscribers only hear about quotes that moved
+                state = (quote["price"], quote["previous_close"], quote["as_of"])
+                if previous.get(quote["ticker"]) != state:
+                    previous[quote["ticker"]] = state
+                    self._publish(quote)
+            elapsed = time.monotonic() - started
+            if elapsed > self.interval:
+                logger.warning(
+                    f"Quote poll of {len(tickers)} tickers took {elapsed:.1f}s, longer than the {self.interval}s interval."
+                )
+            # A slow cycle delays the next one rather than overlapping it
+            await asyncio.sleep(max(self.interval - elapsed, 0.0))
+
+    def ensure_polling(self):
+        # Must be called from the event loop
+        with self._lock:
+            if self._task is None or self._task.done():
+                self._task = asyncio.get_running_loop().create_task(self._run())
+
+    # --- WebSocket fan-out ---
+
+    def _publish(self, quote: Dict[str, Any]):
+        with self._lock:
+            queues = [
+                queue
+                for queue, tickers in self._subscribers.items()
+                if quote["ticker"] in tickers
+            ]
+        for queue in queues:
+            if queue.full():
+                # Slow consumer: drop its oldest update rather than block
+                queue.get_nowait()
+                with self._lock:
+                    self._stats["dropped_pushes"] += 1
+            queue.put_nowait(quote)
+            with self._lock:
+                self._stats["pushes"] += 1
+
+    def subscribe(self, tickers: List[str]) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUOTE_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[queue] = set()
+        self.update_subscription(queue, add=tickers)
+        self.ensure_polling()
+        return queue
+
+    def update_subscription(
+        self, queue: asyncio.Queue, add: List[str] = (), remove: List[str] = ()
+    ) -> Set[str]:
+        add = {ticker.upper() for ticker in add}
+        with self._lock:
+            tickers = self._subscribers[queue]
+            tickers -= {ticker.upper() for ticker in remove}
+            new = add - tickers
+            tickers |= add
+            snapshot = [
+                dict(self._quotes[key])
+                for key in (self._key(POLL_VENDOR, ticker) for ticker in new)
+                if key in self._quotes
+            ]
+            current = set(tickers)
+        for quote in snapshot:
+            # Newly subscribed tickers start from the last known quote
+            if not queue.full():
+                queue.put_nowait(quote)
+        return current
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["quotes"] = len(self._quotes)
+            stats["fetch_locks"] = len(self._fetch_locks)
+            stats["subscribers"] = len(self._subscribers)
+            stats["polling"] = self._task is not None and not self._task.done()
+        stats["hit_rate"] = stats["hits"] / stats["reads"] if stats["reads"] else 0.0
+        return stats
+
+
+quote_service = QuoteService()
@@ -0,0 +1,193 @@
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .priceAnalytics import rolling_mean
+
+# Indicators computed together in one pass over a single OHLCV frame. Shared
+# intermediates (close-to-close changes, EMAs) are computed once per call.
+
+INDICATORS = ("ema", "rsi", "macd", "bollinger", "atr", "volatility")
+
+DEFAULT_PARAMS = {
+    "ema_span": 20,
+    "rsi_window": 14,
+    "macd_fast": 12,
+    "macd_slow": 26,
+    "macd_signal": 9,
+    "bollinger_window": 20,
+    "bollinger_std": 2.0,
+    "atr_window": 14,
+    "volatility_window": 20,
+}
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def warmup_bars(indicators: Iterable[str], params: Dict[str, float]) -> int:
+    # Bars needed before the first fully-formed value of the slowest indicator
+    needs = {
+        "ema": params["ema_span"] * 3,  # Let the seed value decay
+        "rsi": params["rsi_window"] * 3,
+        "macd": (params["macd_slow"] + params["macd_signal"]) * 3,
+        "bollinger": params["bollinger_window"],
+        "atr": params["atr_window"] * 3,
+        "volatility": params["volatility_window"] + 1,
+    }
+    return int(max((needs[name] for name in indicators), default=0))
+
+
+def _ewm(values: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+    # Recursive average; pandas runs the recurrence in compiled code
+    return (
+        pd.Series(values)
+        .ewm(alpha=alpha, adjust=False, min_periods=min_periods)
+        .mean()
+        .to_numpy()
+    )
+
+
+def _rolling_std(values: np.ndarray, window: int, ddof: int) -> np.ndarray:
+    result = np.full(values.shape, np.nan)
+    if window <= ddof or len(values) < window:
+        return result
+    # NaN in a window propagates, matching rolling(min_periods=window)
+    result[window - 1 :] = sliding_window_view(values, window).std(axis=1, ddof=ddof)
+    return result
+
+
+class _IndicatorPass:
+    def __init__(self, frame: pd.DataFrame, params: Dict[str, float]):
+        self.params = params
+        self.close = frame["Close"].to_numpy(dtype=np.float64)
+        self.high = (
+            frame["High"].to_numpy(dtype=np.float64) if "High" in frame else None
+        )
+        self.low = frame["Low"].to_numpy(dtype=np.float64) if "Low" in frame else None
+        self._emas: Dict[int, np.ndarray] = {}
+        self._previous_close: Optional[np.ndarray] = None
+
+    def ema(self, span: int) -> np.ndarray:
+        if span not in self._emas:
+            self._emas[span] = _ewm(self.close, 2.0 / (span + 1), min_periods=span)
+        return self._emas[span]
+
+    def previous_close(self) -> np.ndarray:
+        if self._previous_close is None:
+            self._previous_close = np.concatenate(([np.nan], self.close[:-1]))
+        return self._previous_close
+
+    def compute(self, name: str) -> Dict[str, np.ndarray]:
+        params = self.params
+        if name == "ema":
+            span = int(params["ema_span"])
+            return {f"ema_{span}": self.ema(span)}
+
+        if name == "rsi":
+            window = int(params["rsi_window"])
+            change = self.close - self.previous_close()
+            gain = np.where(change > 0, change, 0.0)
+            loss = np.where(change < 0, -change, 0.0)
+            gain[0] = loss[0] = np.nan  # No change for the first bar
+            # Wilder's smoothing
+            avg_gain = _ewm(gain, 1.0 / window, min_periods=window)
+            avg_loss = _ewm(loss, 1.0 / window, min_periods=window)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            # No losses: 100 if prices rose, neutral 50 for a flat series
+            flat = np.where(avg_gain == 0, 50.0, 100.0)
+            rsi = np.where((avg_loss == 0) & np.isfinite(avg_gain), flat, rsi)
+            return {f"rsi_{window}": rsi}
+
+        if name == "macd":
+            fast, slow, signal = (
+                int(params["macd_fast"]),
+                int(params["macd_slow"]),
+                int(params["macd_signal"]),
+            )
+            macd = self.ema(fast) - self.ema(slow)
+            signal_line = _ewm(macd, 2.0 / (signal + 1), min_periods=signal)
+            return {
+                "macd": macd,
+                "macd_signal": signal_line,
+                "macd_histogram": macd - signal_line,
+            }
+
+        if name == "bollinger":
+            window = int(params["bollinger_window"])
+            width = float(params["bollinger_std"])
+            middle = rolling_mean(self.close[:, None], window)[:, 0]
+            std = _rolling_std(self.close, window, ddof=0)
+            return {
+                "bollinger_upper": middle + width * std,
+                "bollinger_middle": middle,
+                "bollinger_lower": middle - width * std,
+            }
+
+        if name == "atr":
+            window = int(params["atr_window"])
+            if self.high is None or self.low is None:
+                raise ValueError("ATR requires High and Low prices.")
+            previous = self.previous_close()
+            true_range = np.fmax(
+                self.high - self.low,
+                np.fmax(np.abs(self.high - previous), np.abs(self.low - previous)),
+            )
+            return {f"atr_{window}": _ewm(true_range, 1.0 / window, min_periods=window)}
+
+        if name == "volatility":
+            window = int(params["volatility_window"])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_returns = np.log(self.close / self.previous_close())
+            annualized = _rolling_std(log_returns[1:], window, ddof=1) * np.sqrt(
+                TRADING_DAYS_PER_YEAR
+            )
+            return {
+                f"volatility_{window}": np.concatenate(([np.nan], annualized * 100))
+            }
+
+        raise ValueError(f"Unknown indicator: {name}")
+
+
+def compute_indicators(
+    frame: pd.DataFrame,
+    indicators: Iterable[str],
+    params: Optional[Dict[str, float]] = None,
+) -> Dict[str, np.ndarray]:
+    # Returns one aligned array per output column, keyed by column name
+    merged = {**DEFAULT_PARAMS, **{k: v for k, v in (params or {}).items() if v}}
+    indicator_pass = _IndicatorPass(frame, merged)
+    columns: Dict[str, np.ndarray] = {}
+    for name in dict.fromkeys(indicators):
+        columns.update(indicator_pass.compute(name))
+    return columns
+
+
+def interpret(
+    latest: Dict[str, Optional[float]], close: Optional[float]
+) -> Dict[str, str]:
+    # Plain-language reading of the latest values for the LLM
+    signals = {}
+    for column, value in latest.items():
+        if value is None:
+            continue
+        if column.startswith("rsi_"):
+            signals["rsi"] = (
+                "overbought"
+                if value >= 70
+                else "oversold" if value <= 30 else "neutral"
+            )
+        elif column == "macd_histogram":
+            signals["macd"] = "bullish" if value > 0 else "bearish"
+        elif column.startswith("ema_") and close is not None:
+            signals["ema"] = "price above EMA" if close > value else "price below EMA"
+    upper, lower = latest.get("bollinger_upper"), latest.get("bollinger_lower")
+    if close is not None and upper is not None and lower is not None:
+        signals["bollinger"] = (
+            "above upper band"
+            if close > upper
+            else "below lower band" if close < lower else "within bands"
+        )
+    return signals
@@ -0,0 +1,60 @@
+import json
+import asyncio
+import logging
+from typing import Optional, Dict, Any, Union
+
+from . import functionTool
+from .functionToolSchema import AVAILABLE_TOOLS
+
+logger = logging.getLogger(__name__)
+
+# Only functions registered as tools may be invoked by name
+TOOL_NAMES = {tool["function"]["name"] for tool in AVAILABLE_TOOLS}
+
+
+def tool_call_key(function_name: str, function_args: Dict[str, Any]) -> str:
+    return f"{function_name}:{json.dumps(function_args, sort_keys=True, default=str)}"
+
+
+def execute_tool(
+    function_name: str,
+    function_args: Union[Dict[str, Any], str],
+    data_vendor: str = "yfinance",
+    api_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    try:
+        if isinstance(function_args, str):
+            function_args = json.loads(function_args)
+        function_args = dict(function_args or {})
+    except json.JSONDecodeError as json_err:
+        logger.error(
+            f"Failed to parse arguments for tool {function_name}: {function_args}. Error: {json_err}"
+        )
+        return {"error": f"Invalid arguments format received for tool {function_name}."}
+
+    if function_name not in TOOL_NAMES or not hasattr(functionTool, function_name):
+        logger.warning(f"Function {function_name} not found in functionTool module.")
+        return {"error": f"Tool {function_name} is defined but not implemented."}
+
+    logger.info(f"Attempting to call tool: {function_name} with args: {function_args}")
+    function_args["data_vendor"] = data_vendor
+    if api_key:
+        function_args["api_key"] = api_key
+
+    try:
+        return getattr(functionTool, function_name)(**function_args)
+    except Exception as func_exc:
+        logger.exception(f"Error executing tool {function_name} function: {func_exc}")
+        return {"error": f"Error executing tool {function_name}: {str(func_exc)}"}
+
+
+async def execute_tool_async(
+    function_name: str,
+    function_args: Union[Dict[str, Any], str],
+    data_vendor: str = "yfinance",
+    api_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    # Tools are blocking (vendor HTTP calls); run them off the event loop
+    return await asyncio.to_thread(
+        execute_tool, function_name, function_args, data_vendor, api_key
+    )
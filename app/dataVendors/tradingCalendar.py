@@ -0,0 +1,207 @@
+import re
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import MO
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+
+logger = logging.getLogger(__name__)
+
+# Exchange session dates as a sorted datetime64[D] array, so "N daily bars
+# ending now" becomes an exact start date (a searchsorted and an index step)
+# instead of a calendar-day guess with a buffer. Windows end at the day after
+# the last completed session (vendor end dates are exclusive), which gives
+# every call between two sessions the same dates and so the same cache key.
+
+DateLike = Union[str, datetime, pd.Timestamp, np.datetime64]
+FIRST_YEAR = 1990
+# Plain exchange symbols (AAPL, BRK-B, ^GSPC); suffixed, crypto, FX and
+# futures symbols trade on other calendars
+US_SYMBOL = re.compile(r"\^?[A-Z]{1,5}(-[A-Z])?")
+
+
+class NYSEHolidays(AbstractHolidayCalendar):
+    rules = [
+        # A Saturday New Year's Day is not observed on the Friday before
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        Holiday(
+            "Martin Luther King Jr. Day",
+            month=1,
+            day=1,
+            offset=pd.DateOffset(weekday=MO(3)),
+            start_date="1998-01-01",
+        ),
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday(
+            "Juneteenth",
+            month=6,
+            day=19,
+            start_date="2022-01-01",
+            observance=nearest_workday,
+        ),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas Day", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+NYSE_SPECIAL_CLOSURES = (
+    "1994-04-27",  # Nixon funeral
+    "2001-09-11",  # September 11
+    "2001-09-12",
+    "2001-09-13",
+    "2001-09-14",
+    "2004-06-11",  # Reagan funeral
+    "2007-01-02",  # Ford funeral
+    "2012-10-29",  # Hurricane Sandy
+    "2012-10-30",
+    "2018-12-05",  # G.H.W. Bush funeral
+    "2025-01-09",  # Carter funeral
+)
+
+
+def _day(value: DateLike) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+def _label(day: np.datetime64) -> str:
+    return str(day.astype("datetime64[D]"))
+
+
+class TradingCalendar:
+    def __init__(
+        self,
+        name: str,
+        tz: str,
+        holidays: AbstractHolidayCalendar,
+        special_closures: Iterable[str] = (),
+        first_year: int = FIRST_YEAR,
+    ):
+        self.name = name
+        self.tz = tz
+        self._holidays = holidays
+        self._special_closures = np.array(list(special_closures), dtype="datetime64[D]")
+        self._first_year = first_year
+        self._last_year = first_year - 1
+        self._sessions = np.array([], dtype="datetime64[D]")
+        self._lock = threading.Lock()
+
+    def _build(self, last_year: int) -> np.ndarray:
+        days = np.arange(
+            np.datetime64(f"{self._first_year}-01-01"),
+            np.datetime64(f"{last_year + 1}-01-01"),
+            dtype="datetime64[D]",
+        )
+        closed = self._holidays.holidays(
+            start=f"{self._first_year}-01-01", end=f"{last_year}-12-31"
+        ).values.astype("datetime64[D]")
+        closed = np.concatenate([closed, self._special_closures])
+        return days[np.is_busday(days, holidays=closed)]
+
+    def sessions(self, through: Optional[DateLike] = None) -> np.ndarray:
+        # Built lazily and extended a year past whatever is asked for
+        year = pd.Timestamp(through).year if through is not None else self.today_year()
+        if year + 1 > self._last_year:
+            with self._lock:
+                if year + 1 > self._last_year:
+                    self._sessions = self._build(year + 1)
+                    self._last_year = year + 1
+                    logger.info(
+                        f"{self.name} calendar: {len(self._sessions)} sessions through {self._last_year}."
+                    )
+        return self._sessions
+
+    def today(self) -> np.datetime64:
+        return _day(pd.Timestamp.now(tz=self.tz).tz_localize(None))
+
+    def today_year(self) -> int:
+        return pd.Timestamp.now(tz=self.tz).year
+
+    def is_session(self, dates: Union[DateLike, Iterable[DateLike]]) -> np.ndarray:
+        days = np.atleast_1d(np.asarray(pd.to_datetime(dates)).astype("datetime64[D]"))
+        sessions = self.sessions(days.max())
+        positions = np.searchsorted(sessions, days)
+        found = positions < len(sessions)
+        found[found] = sessions[positions[found]] == days[found]
+        return found
+
+    def sessions_between(self, start: DateLike, end: DateLike) -> int:
+        # Sessions in [start, end)
+        sessions = self.sessions(end)
+        return int(
+            np.searchsorted(sessions, _day(end))
+            - np.searchsorted(sessions, _day(start))
+        )
+
+    def bars_window(self, bars: int, end: Optional[DateLike] = None) -> Tuple[str, str]:
+        # Exact (start, exclusive end) for the last `bars` sessions before
+        # `end` (default today, whose bar is still forming)
+        end_day = _day(end) if end is not None else self.today()
+        sessions = self.sessions(end_day)
+        last = max(int(np.searchsorted(sessions, end_day)) - 1, 0)
+        first = max(last - max(bars, 1) + 1, 0)
+        return _label(sessions[first]), _label(sessions[last] + 1)
+
+    def align_range(self, start: DateLike, end: DateLike) -> Tuple[str, str]:
+        # Same sessions, canonical dates: start moves forward to a session,
+        # the exclusive end back to the day after the last session before it
+        start_day, end_day = _day(start), _day(end)
+        sessions = self.sessions(end_day)
+        if start_day < sessions[0]:
+            return str(start), str(end)
+        first = int(np.searchsorted(sessions, start_day))
+        last = int(np.searchsorted(sessions, end_day)) - 1
+        if first > last:
+            return str(start), str(end)  # No sessions; leave it to the vendor
+        return _label(sessions[first]), _label(sessions[last] + 1)
+
+
+nyse_calendar = TradingCalendar(
+    "NYSE", "America/New_York", NYSEHolidays(), NYSE_SPECIAL_CLOSURES
+)
+
+
+def calendar_for(ticker: str) -> Optional[TradingCalendar]:
+    return nyse_calendar if US_SYMBOL.fullmatch(ticker.strip().upper()) else None
+
+
+def bars_window(
+    ticker: str, bars: int, fallback_days: int, end: Optional[str] = None
+) -> Tuple[str, str]:
+    # Daily-bar fetch window for one ticker; tickers without a known calendar
+    # keep the calendar-day offset
+    calendar = calendar_for(ticker)
+    if calendar is not None:
+        return calendar.bars_window(bars, end)
+    end_dt = datetime.strptime(end, "%Y-%m-%d") if end else datetime.today()
+    return (
+        (end_dt - timedelta(days=fallback_days)).strftime("%Y-%m-%d"),
+        end_dt.strftime("%Y-%m-%d"),
+    )
+
+
+def align_range(ticker: str, start_date: str, end_date: str) -> Tuple[str, str]:
+    calendar = calendar_for(ticker)
+    if calendar is None:
+        return start_date, end_date
+    try:
+        return calendar.align_range(start_date, end_date)
+    except (ValueError, TypeError):
+        return start_date, end_date  # Unparseable; the vendor reports it
@@ -0,0 +1,295 @@
+import copy
+import json
+import inspect
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..constants.settings import VENDOR_CACHE_MAX_ENTRIES, VENDOR_CACHE_TTLS
+
+logger = logging.getLogger(__name__)
+
+
+def _is_empty(value: Any) -> bool:
+    # Empty results usually mean a vendor error was swallowed; don't pin them
+    if value is None:
+        return True
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.empty
+    if isinstance(value, (list, dict)):
+        return not value
+    return False
+
+
+def _copy_value(value: Any) -> Any:
+    # Callers (e.g. calculate_price_trend) add columns to the frames they get
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, (list, dict)):
+        return copy.deepcopy(value)
+    return value
+
+
+class _InFlight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class VendorCache:
+    def __init__(
+        self,
+        max_entries: int = VENDOR_CACHE_MAX_ENTRIES,
+        ttls: Optional[Dict[str, int]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttls = dict(ttls if ttls is not None else VENDOR_CACHE_TTLS)
+        # key -> (value, fetched_at, expires_at, version)
+        self._entries: "OrderedDict[str, Tuple[Any, float, float, int]]" = OrderedDict()
+        self._inflight: Dict[str, _InFlight] = {}
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+        self._ttl_policy: Optional[
+            Callable[[str, str, Dict[str, Any]], Optional[int]]
+        ] = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "stores": 0,
+            "invalidations": 0,
+        }
+
+    @staticmethod
+    def make_key(
+        vendor_name: str, method: str, kwargs: Dict[str, Any], scope: str = ""
+    ) -> str:
+        # scope is the vendor's credential hash, so data fetched with one
+        # caller's API key is never served to another
+        key = f"{vendor_name.lower()}:{method}:{json.dumps(kwargs, sort_keys=True, default=str)}"
+        return f"{key}@{scope}" if scope else key
+
+    def is_cached_method(self, method: str) -> bool:
+        return self.ttls.get(method, 0) > 0
+
+    def add_listener(self, callback: Callable[[str, Dict[str, Any]], None]):
+        # Called with ("refresh" | "invalidate", info) whenever data changes;
+        # refresh events carry the freshly fetched value
+        with self._lock:
+            self._listeners.append(callback)
+
+    def set_ttl_policy(
+        self, policy: Callable[[str, str, Dict[str, Any]], Optional[int]]
+    ):
+        # policy(vendor_name, method, kwargs) -> TTL seconds for a new entry,
+        # or None for the configured per-method TTL
+        self._ttl_policy = policy
+
+    def _ttl(self, vendor_name: str, method: str, kwargs: Dict[str, Any]) -> int:
+        if self._ttl_policy is not None:
+            try:
+                ttl = self._ttl_policy(vendor_name, method, kwargs)
+                if ttl is not None:
+                    return ttl
+            except Exception as e:
+                logger.error(f"Vendor cache TTL policy failed for {method}: {e}")
+        return self.ttls[method]
+
+    def _notify(self, event: str, info: Dict[str, Any]):
+        for callback in list(self._listeners):
+            try:
+                callback(event, info)
+            except Exception as e:
+                logger.error(f"Vendor cache listener failed on {event}: {e}")
+
+    def fetch(
+        self,
+        vendor_name: str,
+        method: str,
+        kwargs: Dict[str, Any],
+        loader: Callable[[], Any],
+        scope: str = "",
+    ) -> Any:
+        key = self.make_key(vendor_name, method, kwargs, scope)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > now:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return _copy_value(entry[0])
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _InFlight()
+                self._inflight[key] = flight
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            # Single-flight: concurrent requests for the same data share one fetch
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _copy_value(flight.value)
+
+        try:
+            value = loader()
+            flight.value = value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+        if not _is_empty(value):
+            self._store(key, vendor_name, method, kwargs, value, scope)
+        return _copy_value(value)
+
+    def _store(
+        self,
+        key: str,
+        vendor_name: str,
+        method: str,
+        kwargs: Dict[str, Any],
+        value: Any,
+        scope: str = "",
+    ):
+        now = time.time()
+        ttl = self._ttl(vendor_name, method, kwargs)
+        with self._lock:
+            self._version += 1
+            version = self._version
+            self._entries[key] = (value, now, now + ttl, version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._stats["stores"] += 1
+        self._notify(
+            "refresh",
+            {
+                "vendor": vendor_name,
+                "method": method,
+                "ticker": kwargs.get("ticker"),
+                "kwargs": kwargs,
+                "scope": scope,
+                "version": version,
+                "fetched_at": now,
+                "value": value,  # Shared cached object; listeners must not mutate it
+            },
+        )
+
+    def entry_info(
+        self, vendor_name: str, method: str, kwargs: Dict[str, Any], scope: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        key = self.make_key(vendor_name, method, kwargs, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return {"fetched_at": entry[1], "expires_at": entry[2], "version": entry[3]}
+
+    def invalidate(
+        self,
+        vendor_name: Optional[str] = None,
+        method: Optional[str] = None,
+        ticker: Optional[str] = None,
+    ) -> int:
+        prefix = f"{vendor_name.lower()}:" if vendor_name else ""
+        ticker_fragment = json.dumps(ticker) if ticker else None
+        with self._lock:
+            removed = [
+                key
+                for key in self._entries
+                if key.startswith(prefix)
+                and (method is None or key.split(":", 2)[1] == method)
+                and (ticker_fragment is None or f'"ticker": {ticker_fragment}' in key)
+            ]
+            for key in removed:
+                del self._entries[key]
+            self._stats["invalidations"] += len(removed)
+        if removed:
+            self._notify(
+                "invalidate",
+                {"vendor": vendor_name, "method": method, "ticker": ticker},
+            )
+        return len(removed)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self._notify("invalidate", {"vendor": None, "method": None, "ticker": None})
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = (
+            (stats["hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+
+def _call_kwargs(
+    method: Callable, args: tuple, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    # Normalize positional/defaulted arguments so equivalent calls share a key
+    bound = inspect.signature(method).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+class CachedDataVendor:
+    # Transparent proxy: cacheable vendor methods go through the shared cache,
+    # everything else is passed to the wrapped vendor unchanged.
+    def __init__(self, vendor: Any, vendor_name: str, cache: VendorCache):
+        self._vendor = vendor
+        self._vendor_name = vendor_name
+        self._cache = cache
+        credential_scope = getattr(vendor, "credential_scope", None)
+        self._scope = credential_scope() if credential_scope else ""
+
+    @property
+    def vendor(self) -> Any:
+        return self._vendor
+
+    @property
+    def vendor_name(self) -> str:
+        return self._vendor_name
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._vendor, name)
+        if not callable(attribute) or not self._cache.is_cached_method(name):
+            return attribute
+
+        def cached_call(*args, **kwargs):
+            call_kwargs = _call_kwargs(attribute, args, kwargs)
+            return self._cache.fetch(
+                self._vendor_name,
+                name,
+                call_kwargs,
+                lambda: attribute(**call_kwargs),
+                self._scope,
+            )
+
+        return cached_call
+
+    def cache_info(self, name: str, *args, **kwargs) -> Optional[Dict[str, Any]]:
+        # Version and freshness of the entry a call with these arguments reads
+        if not self._cache.is_cached_method(name):
+            return None
+        call_kwargs = _call_kwargs(getattr(self._vendor, name), args, kwargs)
+        return self._cache.entry_info(self._vendor_name, name, call_kwargs, self._scope)
+
+
+vendor_cache = VendorCache()
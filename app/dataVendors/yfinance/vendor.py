@@ -1,8 +1,8 @@
 import yfinance as yf
 import pandas as pd
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict, Iterable
 import logging
-from ..baseDataVendor import BaseDataVendor
+from ..baseDataVendor import BaseDataVendor, QUOTE_FIELDS
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +11,9 @@ class YahooFinance(BaseDataVendor):
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
 
+    def credential_scope(self) -> str:
+        return ""  # Keyless; the api_key argument is ignored
+
     def get_prices(
         self,
         ticker: str,
@@ -26,6 +29,10 @@ class YahooFinance(BaseDataVendor):
             "week": "1wk",
             "month": "1mo",
             "year": "1y",
+            # Native yfinance intervals, as the direct endpoints pass them
+            "1d": "1d",
+            "1wk": "1wk",
+            "1mo": "1mo",
         }
         yf_interval = yf_interval_map.get(interval, "1d")
 
@@ -114,6 +121,32 @@ class YahooFinance(BaseDataVendor):
             )
             return None
 
+    def get_quote(
+        self, ticker: str, fields: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        # Prices come from one daily chart request (fast_info's last_price and
+        # previous close cost a year of bars plus a metadata request); the
+        # market cap uses fast_info's share count instead of the info blob
+        fields = list(QUOTE_FIELDS if fields is None else fields)
+        price_fields = fields + ["price"] if "market_cap" in fields else fields
+        try:
+            quote = super().get_quote(ticker, price_fields)
+        except Exception as e:
+            logger.warning(f"Could not fetch quote from yfinance for {ticker}: {e}")
+            return None
+        if quote is None or "market_cap" not in fields:
+            return quote
+        price = quote["price"] if "price" in fields else quote.pop("price")
+        try:
+            shares = yf.Ticker(ticker).fast_info.shares
+            if shares and price is not None:
+                quote["market_cap"] = float(shares * price)
+        except Exception as e:
+            logger.warning(
+                f"Could not fetch share count from yfinance for {ticker}: {e}"
+            )
+        return quote
+
     def get_institutional_holders(self, ticker: str) -> pd.DataFrame:
         try:
             company = yf.Ticker(ticker)
@@ -176,6 +209,23 @@ class YahooFinance(BaseDataVendor):
             logger.error(f"Error fetching news from yfinance for {ticker}: {e}")
             return []
 
+    def get_earnings_calendar(self, ticker: str) -> Dict[str, Any]:
+        try:
+            calendar = yf.Ticker(ticker).calendar or {}
+            earnings_dates = [
+                pd.Timestamp(value).date().isoformat()
+                for value in calendar.get("Earnings Date") or []
+            ]
+            logger.info(
+                f"Successfully fetched earnings calendar for {ticker} from yfinance."
+            )
+            return {"earnings_dates": earnings_dates} if earnings_dates else {}
+        except Exception as e:
+            logger.warning(
+                f"Could not fetch earnings calendar from yfinance for {ticker}: {e}"
+            )
+            return {}
+
     def get_earnings_history(self, ticker: str) -> pd.DataFrame:
         try:
             company = yf.Ticker(ticker)
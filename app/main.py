@@ -1,14 +1,38 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import (
+    FastAPI,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
+from typing import List, Optional, Dict, Any, Union, Callable, Tuple
 from pydantic import BaseModel, Field
 from .api import chat
-import yfinance as yf
+from .api import exportFormats, pagination, httpCaching
+from .api.responseCache import response_cache
+from .api.jsonResponse import FastJSONResponse, model_response
 import pandas as pd
+import asyncio
 import logging
 from datetime import datetime
 
-from .dataVendors import functionTool
+from .dataVendors import functionTool, frameSerializer
+from .dataVendors.dataVendorFactory import DataVendorFactory
+from .dataVendors.quoteService import quote_service
+from .dataVendors.companySnapshot import company_snapshots, parse_fields
+from .constants.settings import (
+    HISTORICAL_PAGE_MAX_ROWS,
+    BULK_MAX_TICKERS,
+    BULK_FETCH_CONCURRENCY,
+    QUOTE_MAX_TICKERS_PER_CONNECTION,
+    GZIP_MINIMUM_SIZE,
+    GZIP_COMPRESS_LEVEL,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,6 +41,7 @@ app = FastAPI(
     title="QuantAI Finance Chatbot",
     version="0.1.0",
     description="API for the QuantAI financial chatbot, providing chat interface and direct data endpoints.",
+    default_response_class=FastJSONResponse,
 )
 
 origins = [
@@ -31,6 +56,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[pagination.NEXT_CURSOR_HEADER],
+)
+# Chat NDJSON streams stay unbuffered; Parquet is already compressed
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESS_LEVEL,
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES
+    + (
+        exportFormats.EXPORT_MEDIA_TYPES["ndjson"],
+        exportFormats.EXPORT_MEDIA_TYPES["parquet"],
+    ),
 )
 
 app.include_router(chat.chatRouter, prefix="/chat", tags=["Chat"])
@@ -198,76 +235,35 @@ class CompanyInfo(BaseModel):
 # --- Direct Data Endpoints ---
 
 
+def _snapshot(vendor: Any, ticker: str, fields=None) -> Dict[str, Any]:
+    snapshot = company_snapshots.get(vendor, ticker, fields)
+    if snapshot is None:
+        raise HTTPException(
+            status_code=404, detail=f"No data found for ticker: {ticker}"
+        )
+    return snapshot
+
+
+def _company_info_model(vendor: Any, ticker: str) -> CompanyInfo:
+    snapshot = _snapshot(vendor, ticker, ("officers", "profile"))
+    return CompanyInfo(**snapshot["profile"], companyOfficers=snapshot["officers"])
+
+
 @app.get(
     "/company_info/{ticker}", response_model=CompanyInfo, tags=["Direct Data - Company"]
 )
-async def get_company_info_direct(ticker: str):
+async def get_company_info_direct(request: Request, ticker: str):
     try:
-        company = yf.Ticker(ticker)
-        info = company.info
-        if not info or not info.get("symbol"):
-            raise HTTPException(
-                status_code=404, detail=f"No data found for ticker: {ticker}"
-            )
-
-        # Clean officers data before validating with Pydantic model
-        raw_officers = info.get("companyOfficers", [])
-        valid_officers = []
-        if isinstance(raw_officers, list):
-            for officer_data in raw_officers:
-                if isinstance(officer_data, dict):
-                    # Coerce numeric fields that might be missing or NaN
-                    for field in [
-                        "age",
-                        "yearBorn",
-                        "fiscalYear",
-                        "totalPay",
-                        "exercisedValue",
-                        "unexercisedValue",
-                    ]:
-                        if field in officer_data and not isinstance(
-                            officer_data[field], (int, float)
-                        ):
-                            try:
-                                officer_data[field] = float(officer_data[field])
-                            except (ValueError, TypeError):
-                                officer_data[field] = (
-                                    None  # Set to None if conversion fails
-                                )
-                    try:
-                        valid_officers.append(
-                            CompanyOfficer(**officer_data).model_dump(exclude_none=True)
-                        )
-                    except Exception as officer_exc:
-                        logger.warning(
-                            f"Skipping officer due to validation error for {ticker}: {officer_exc} - Data: {officer_data}"
-                        )
-                else:
-                    logger.warning(
-                        f"Skipping invalid officer data structure for {ticker}: {officer_data}"
-                    )
-        info["companyOfficers"] = valid_officers
-
-        # Handle potential NaN/Infinity before creating the main CompanyInfo model
-        cleaned_info = {}
-        for key, value in info.items():
-            if isinstance(value, (float, int)):
-                if pd.isna(value) or not pd.core.dtypes.common.is_number(
-                    value
-                ):  # More robust check
-                    cleaned_info[key] = None
-                else:
-                    cleaned_info[key] = value
-            else:
-                cleaned_info[key] = (
-                    value  # Keep non-numeric as is for Pydantic validation
-                )
-
-        # Ensure required 'symbol' is present
-        if "symbol" not in cleaned_info:
-            cleaned_info["symbol"] = ticker  # Add if missing
-
-        return CompanyInfo(**cleaned_info)
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        # Hot hits are served as stored bytes by the response cache
+        return response_cache.serve(
+            request,
+            "company_info",
+            {"ticker": ticker},
+            vendor,
+            [("get_company_info", {"ticker": ticker})],
+            lambda: model_response(_company_info_model(vendor, ticker)),
+        )
 
     except HTTPException as http_exc:
         raise http_exc
@@ -293,54 +289,46 @@ class EarningsData(BaseModel):
     tags=["Direct Data - Financials"],
 )
 async def get_earnings_direct(
+    request: Request,
     ticker: str,
     limit: int = Query(
         4, description="Number of recent earnings periods to retrieve", ge=1, le=16
     ),
 ):
     try:
-        company = yf.Ticker(ticker)
-        earnings_history_df = company.earnings_history
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        calls = [("get_earnings_history", {"ticker": ticker})]
+        unchanged = httpCaching.not_modified(
+            request, httpCaching.vendor_etag(request, vendor, calls), "earnings"
+        )
+        if unchanged is not None:
+            return unchanged
+
+        earnings_history_df = vendor.get_earnings_history(ticker=ticker)
 
         if earnings_history_df.empty:
             logger.warning(f"No earnings history found via yfinance for {ticker}")
-            return []  # Return empty list if no data
-
-        earnings_list = []
-        # Take the latest 'limit' rows
-        for index, row in earnings_history_df.tail(limit).iterrows():
-            # Ensure index is timezone-naive string if it's a timestamp
-            date_str = (
-                str(index.date()) if isinstance(index, pd.Timestamp) else str(index)
+            # Return empty list if no data
+            return httpCaching.finalize(
+                request, FastJSONResponse(content=[]), "earnings"
             )
 
-            # Safely get values, defaulting to None if key missing or value is NaN
-            earnings_list.append(
-                EarningsData(
-                    date=date_str,
-                    epsActual=(
-                        row.get("EPS Actual")
-                        if pd.notna(row.get("EPS Actual"))
-                        else None
-                    ),
-                    epsEstimate=(
-                        row.get("EPS Estimate")
-                        if pd.notna(row.get("EPS Estimate"))
-                        else None
-                    ),
-                    epsDifference=(
-                        row.get("Difference")
-                        if pd.notna(row.get("Difference"))
-                        else None
-                    ),
-                    surprisePercent=(
-                        row.get("Surprise(%)")
-                        if pd.notna(row.get("Surprise(%)"))
-                        else None
-                    ),
-                ).model_dump(exclude_none=True)
-            )
-        return earnings_list
+        # Latest 'limit' rows; missing columns or NaN values become None
+        earnings_list = frameSerializer.frame_to_records(
+            earnings_history_df.tail(limit),
+            columns={
+                "EPS Actual": "epsActual",
+                "EPS Estimate": "epsEstimate",
+                "Difference": "epsDifference",
+                "Surprise(%)": "surprisePercent",
+            },
+        )
+        return httpCaching.finalize(
+            request,
+            FastJSONResponse(content=earnings_list),
+            "earnings",
+            httpCaching.vendor_etag(request, vendor, calls),
+        )
     except Exception as e:
         logger.exception(f"Error fetching direct earnings for {ticker}: {e}")
         raise HTTPException(
@@ -356,12 +344,40 @@ class FinancialStatementResponse(BaseModel):
     statement: Dict[str, Dict[str, Optional[float]]]  # Dates as keys, metrics as keys
 
 
+def _financial_statement_response(
+    vendor: Any, ticker: str, statement_type: str, period: str
+) -> Response:
+    statement_df = vendor.get_financial_statements(
+        ticker=ticker, statement_type=statement_type, period=period
+    )
+
+    if statement_df is None or statement_df.empty:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{period.capitalize()} {statement_type.replace('_', ' ')} not found for {ticker}",
+        )
+
+    # {YYYY-MM-DD: {line item: value}}, NaN -> None
+    statement_dict = frameSerializer.frame_to_nested(statement_df)
+
+    # Values are already floats/None; encode once without re-validation
+    return FastJSONResponse(
+        content={
+            "ticker": ticker,
+            "statement_type": statement_type,
+            "period": period,
+            "statement": statement_dict,
+        }
+    )
+
+
 @app.get(
     "/financial_statements/{ticker}",
     response_model=FinancialStatementResponse,
     tags=["Direct Data - Financials"],
 )
 async def get_financial_statements_direct(
+    request: Request,
     ticker: str,
     statement_type: str = Query(
         ...,
@@ -371,49 +387,17 @@ async def get_financial_statements_direct(
     period: str = Query("annual", description="Period", enum=["annual", "quarterly"]),
 ):
     try:
-        company = yf.Ticker(ticker)
-        statement_df = None
-
-        if statement_type == "income_statement":
-            statement_df = (
-                company.income_stmt
-                if period == "annual"
-                else company.quarterly_income_stmt
-            )
-        elif statement_type == "balance_sheet":
-            statement_df = (
-                company.balance_sheet
-                if period == "annual"
-                else company.quarterly_balance_sheet
-            )
-        elif statement_type == "cash_flow_statement":
-            statement_df = (
-                company.cashflow if period == "annual" else company.quarterly_cashflow
-            )
-
-        if statement_df is None or statement_df.empty:
-            raise HTTPException(
-                status_code=404,
-                detail=f"{period.capitalize()} {statement_type.replace('_', ' ')} not found for {ticker}",
-            )
-
-        # Convert DataFrame to the desired dictionary format, handling NaN/NaT
-        statement_dict = {}
-        for col in statement_df.columns:
-            # Convert timestamp column to YYYY-MM-DD string
-            col_date_str = (
-                str(col.date()) if isinstance(col, pd.Timestamp) else str(col)
-            )
-            metrics = {}
-            for idx, value in statement_df[col].items():
-                metrics[str(idx)] = float(value) if pd.notna(value) else None
-            statement_dict[col_date_str] = metrics
-
-        return FinancialStatementResponse(
-            ticker=ticker,
-            statement_type=statement_type,
-            period=period,
-            statement=statement_dict,
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        params = {"ticker": ticker, "statement_type": statement_type, "period": period}
+        return response_cache.serve(
+            request,
+            "financial_statements",
+            params,
+            vendor,
+            [("get_financial_statements", params)],
+            lambda: _financial_statement_response(
+                vendor, ticker, statement_type, period
+            ),
         )
 
     except HTTPException as http_exc:
@@ -441,6 +425,7 @@ class SECFiling(BaseModel):
     tags=["Direct Data - Company"],
 )
 async def get_sec_filings_direct(
+    request: Request,
     ticker: str,
     filing_type: Optional[str] = Query(
         None,
@@ -460,17 +445,21 @@ async def get_sec_filings_direct(
     ),
 ):
     try:
-        company = yf.Ticker(ticker)
-        from .dataVendors.yfinance.vendor import (
-            YahooFinance,
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        calls = [("get_sec_filings", {"ticker": ticker})]
+        unchanged = httpCaching.not_modified(
+            request, httpCaching.vendor_etag(request, vendor, calls), "sec_filings"
         )
+        if unchanged is not None:
+            return unchanged
 
-        yfinance_vendor = YahooFinance()
-        filings_list = yfinance_vendor.get_sec_filings(ticker=ticker)
+        filings_list = vendor.get_sec_filings(ticker=ticker)
 
         if not filings_list:
             logger.warning(f"No SEC filings returned via yfinance vendor for {ticker}")
-            return []
+            return httpCaching.finalize(
+                request, FastJSONResponse(content=[]), "sec_filings"
+            )
 
         processed_filings = []
         count = 0
@@ -509,13 +498,18 @@ async def get_sec_filings_direct(
                     description=filing_data.get(
                         "title", filing_data.get("description")
                     ),
-                ).model_dump(exclude_none=True)
+                )
             )
             count += 1
             if count >= limit:
                 break
 
-        return processed_filings
+        return httpCaching.finalize(
+            request,
+            model_response(processed_filings),
+            "sec_filings",
+            httpCaching.vendor_etag(request, vendor, calls),
+        )
 
     except Exception as e:
         logger.exception(f"Error fetching direct SEC filings for {ticker}: {e}")
@@ -531,74 +525,27 @@ class FinancialMetric(BaseModel):
     # value: Union[str, float, int, None] = None # More flexible type
 
 
+def _key_metrics_list(vendor: Any, ticker: str) -> List[FinancialMetric]:
+    snapshot = _snapshot(vendor, ticker, ("key_metrics",))
+    return [FinancialMetric(**metric) for metric in snapshot["key_metrics"]]
+
+
 @app.get(
     "/key_metrics/{ticker}",
     response_model=List[FinancialMetric],
     tags=["Direct Data - Financials"],
 )
-async def get_key_metrics_direct(ticker: str):
+async def get_key_metrics_direct(request: Request, ticker: str):
     try:
-        company = yf.Ticker(ticker)
-        info = company.info
-        if not info or not info.get("symbol"):
-            raise HTTPException(
-                status_code=404, detail=f"No data found for ticker: {ticker}"
-            )
-
-        metrics_to_extract = {
-            "Market Cap": "marketCap",
-            "PE Ratio (TTM)": "trailingPE",
-            "Forward PE": "forwardPE",
-            "Dividend Yield": "dividendYield",
-            "Beta": "beta",
-            "52 Week High": "fiftyTwoWeekHigh",
-            "52 Week Low": "fiftyTwoWeekLow",
-            "Price to Book": "priceToBook",
-            "Profit Margin": "profitMargins",
-            "Revenue Growth (YoY)": "revenueGrowth",  # Note: yfinance might call this 'revenueQuarterlyGrowth' sometimes
-            "Earnings Growth (YoY)": "earningsGrowth",  # Note: yfinance might call this 'earningsQuarterlyGrowth'
-            "Return on Equity (ROE)": "returnOnEquity",
-            "Debt to Equity": "debtToEquity",
-        }
-
-        metrics_list = []
-        for name, key in metrics_to_extract.items():
-            raw_value = info.get(key)
-            value = None
-            if pd.notna(raw_value):
-                if isinstance(raw_value, (float, int)):
-                    # Format percentages nicely
-                    if key in [
-                        "dividendYield",
-                        "profitMargins",
-                        "revenueGrowth",
-                        "earningsGrowth",
-                        "returnOnEquity",
-                    ]:
-                        value = f"{raw_value * 100:.2f}%"
-                    # Format large numbers (Market Cap)
-                    elif key == "marketCap":
-                        if raw_value > 1_000_000_000_000:
-                            value = f"${raw_value / 1_000_000_000_000:.2f}T"
-                        elif raw_value > 1_000_000_000:
-                            value = f"${raw_value / 1_000_000_000:.2f}B"
-                        elif raw_value > 1_000_000:
-                            value = f"${raw_value / 1_000_000:.2f}M"
-                        else:
-                            value = f"${raw_value:,.2f}"
-                    # Default formatting for other numbers
-                    else:
-                        value = (
-                            f"{raw_value:,.2f}"
-                            if isinstance(raw_value, float)
-                            else f"{raw_value:,}"
-                        )
-                else:
-                    value = str(raw_value)  # Convert non-numeric to string
-
-            metrics_list.append(FinancialMetric(metric_name=name, value=value))
-
-        return metrics_list
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        return response_cache.serve(
+            request,
+            "key_metrics",
+            {"ticker": ticker},
+            vendor,
+            [("get_company_info", {"ticker": ticker})],
+            lambda: model_response(_key_metrics_list(vendor, ticker)),
+        )
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
@@ -609,6 +556,50 @@ async def get_key_metrics_direct(ticker: str):
         )
 
 
+class CompanySnapshot(BaseModel):
+    ticker: str
+    profile: Optional[Dict[str, Any]] = None
+    officers: Optional[List[CompanyOfficer]] = None
+    key_metrics: Optional[List[FinancialMetric]] = None
+
+
+@app.get(
+    "/company_snapshot/{ticker}",
+    response_model=CompanySnapshot,
+    response_model_exclude_unset=True,
+    tags=["Direct Data - Company"],
+)
+async def get_company_snapshot_direct(
+    request: Request,
+    ticker: str,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated sections (profile, officers, key_metrics) and/or single profile fields (e.g. longName,sector). All sections by default.",
+    ),
+):
+    # Profile, officers and key metrics from one info fetch, so a company page
+    # needs a single request instead of /company_info plus /key_metrics
+    try:
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        selected = parse_fields(fields)
+        return response_cache.serve(
+            request,
+            "company_snapshot",
+            {"ticker": ticker, "fields": selected},
+            vendor,
+            [("get_company_info", {"ticker": ticker})],
+            lambda: model_response(_snapshot(vendor, ticker, selected)),
+        )
+    except HTTPException as http_exc:
+        raise http_exc
+    except Exception as e:
+        logger.exception(f"Error fetching company snapshot for {ticker}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error fetching company snapshot for {ticker}: {str(e)}",
+        )
+
+
 class HistoricalPriceData(BaseModel):
     date: str
     open: Optional[float] = None
@@ -619,12 +610,43 @@ class HistoricalPriceData(BaseModel):
     volume: Optional[int] = None
 
 
+class HistoricalPriceColumns(BaseModel):
+    # format=columns: one array per field, aligned by position
+    date: List[str]
+    open: List[Optional[float]]
+    high: List[Optional[float]]
+    low: List[Optional[float]]
+    close: List[Optional[float]]
+    adj_close: List[Optional[float]] = Field(..., alias="adjClose")
+    volume: List[Optional[int]]
+
+
+# yfinance column -> response field, in HistoricalPriceData order
+HISTORICAL_PRICE_FIELDS = {
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Adj Close": "adjClose",
+    "Volume": "volume",
+}
+
+
 @app.get(
     "/historical_prices/{ticker}",
-    response_model=List[HistoricalPriceData],
+    response_model=Union[List[HistoricalPriceData], HistoricalPriceColumns],
+    responses={
+        200: {
+            "content": {
+                media_type: {}
+                for media_type in exportFormats.EXPORT_MEDIA_TYPES.values()
+            }
+        }
+    },
     tags=["Direct Data - Prices"],
 )
 async def get_historical_prices_direct(
+    request: Request,
     ticker: str,
     start_date: str = Query(
         ..., description="Start date (YYYY-MM-DD)", pattern=r"^\d{4}-\d{2}-\d{2}$"
@@ -633,6 +655,21 @@ async def get_historical_prices_direct(
         ..., description="End date (YYYY-MM-DD)", pattern=r"^\d{4}-\d{2}-\d{2}$"
     ),
     interval: str = Query("1d", description="Interval", enum=["1d", "1wk", "1mo"]),
+    format: Optional[str] = Query(
+        None,
+        description="rows (default): list of objects; columns: one array per field. csv, ndjson, arrow (IPC stream) and parquet stream the range in chunks and can also be requested through the Accept header.",
+        enum=["rows", "columns", *exportFormats.EXPORT_MEDIA_TYPES],
+    ),
+    limit: Optional[int] = Query(
+        None,
+        description="Page size. Enables cursor pagination: the next page's cursor is returned in the X-Next-Cursor header (absent on the last page).",
+        ge=1,
+        le=HISTORICAL_PAGE_MAX_ROWS,
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from X-Next-Cursor; send it with the original query parameters",
+    ),
 ):
     try:
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
@@ -653,37 +690,112 @@ async def get_historical_prices_direct(
             detail=f"Invalid date format. Please use YYYY-MM-DD. Error: {date_err}",
         )
 
+    paginated = limit is not None or cursor is not None
+    range_params = {
+        "ticker": ticker.upper(),
+        "start_date": start_date,
+        "end_date": end_date,
+        "interval": interval,
+    }
+    if paginated:
+        fingerprint = pagination.query_fingerprint(range_params)
+        after = pagination.decode_cursor(cursor, fingerprint) if cursor else None
+
+    # Ranges that ended before today no longer change
+    route = (
+        "historical_prices_closed"
+        if end_dt.date() < datetime.now().date()
+        else "historical_prices"
+    )
+
+    price_kwargs = {
+        "ticker": ticker,
+        "interval": interval,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+
+    def current_etag(vendor) -> Optional[str]:
+        if paginated:
+            info = pagination.snapshot_cache.entry_info(
+                "yfinance", "get_prices", range_params
+            )
+            return httpCaching.make_etag(request, [httpCaching.entry_version(info)])
+        return httpCaching.vendor_etag(request, vendor, [("get_prices", price_kwargs)])
+
     try:
-        company = yf.Ticker(ticker)
-        history = company.history(start=start_date, end=end_date, interval=interval)
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        unchanged = httpCaching.not_modified(request, current_etag(vendor), route)
+        if unchanged is not None:
+            return unchanged
+
+        def load_history() -> pd.DataFrame:
+            return vendor.get_prices(**price_kwargs)
+
+        if paginated:
+            # Every page of a query slices one snapshot of the range
+            history = pagination.snapshot_cache.fetch(
+                "yfinance", "get_prices", range_params, load_history
+            )
+        else:
+            history = load_history()
 
         if history.empty:
             logger.warning(
                 f"No historical price data found via yfinance for {ticker} in range {start_date}-{end_date} (interval: {interval})"
             )
-            return []
 
-        prices = []
-        for index, row in history.iterrows():
-            date_str = (
-                str(index.date()) if isinstance(index, pd.Timestamp) else str(index)
+        next_cursor = None
+        if paginated:
+            history, next_after = pagination.page_frame(
+                history, limit or HISTORICAL_PAGE_MAX_ROWS, after
             )
-            prices.append(
-                HistoricalPriceData(
-                    date=date_str,
-                    open=row.get("Open") if pd.notna(row.get("Open")) else None,
-                    high=row.get("High") if pd.notna(row.get("High")) else None,
-                    low=row.get("Low") if pd.notna(row.get("Low")) else None,
-                    close=row.get("Close") if pd.notna(row.get("Close")) else None,
-                    adjClose=(
-                        row.get("Adj Close")
-                        if pd.notna(row.get("Adj Close"))
-                        else row.get("Close") if pd.notna(row.get("Close")) else None
-                    ),
-                    volume=int(row["Volume"]) if pd.notna(row.get("Volume")) else None,
-                ).model_dump(exclude_none=True, by_alias=True)
+            if next_after is not None:
+                next_cursor = pagination.encode_cursor(fingerprint, next_after)
+
+        # Only the response columns (dividends/splits are dropped); adjusted
+        # close falls back to close where the vendor has none
+        history = history.loc[
+            :, history.columns.intersection(list(HISTORICAL_PRICE_FIELDS))
+        ]
+        if "Close" in history:
+            history = history.assign(
+                **{
+                    "Adj Close": (
+                        history["Adj Close"].fillna(history["Close"])
+                        if "Adj Close" in history
+                        else history["Close"]
+                    )
+                }
+            )
+        export_format = format or exportFormats.negotiate_format(
+            request.headers.get("accept")
+        )
+        if export_format in exportFormats.EXPORT_MEDIA_TYPES:
+            # Fixed column set, named like the JSON fields
+            response = exportFormats.export_response(
+                history.reindex(columns=list(HISTORICAL_PRICE_FIELDS)).rename(
+                    columns=HISTORICAL_PRICE_FIELDS
+                ),
+                export_format,
+                filename=f"{ticker}_{start_date}_{end_date}_{interval}",
+                int_columns=["volume"],
+            )
+        else:
+            # Whole-column extraction; no per-row models or re-validation
+            columns = frameSerializer.frame_to_columns(
+                history, columns=HISTORICAL_PRICE_FIELDS, int_columns=["Volume"]
+            )
+            response = FastJSONResponse(
+                content=(
+                    columns
+                    if export_format == "columns"
+                    else frameSerializer.columns_to_records(columns)
+                )
             )
-        return prices
+        if next_cursor:
+            response.headers[pagination.NEXT_CURSOR_HEADER] = next_cursor
+        return httpCaching.finalize(request, response, route, current_etag(vendor))
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
@@ -707,21 +819,26 @@ class NewsItem(BaseModel):
 
 @app.get("/news/{ticker}", response_model=List[NewsItem], tags=["Direct Data - News"])
 async def get_news_direct(
+    request: Request,
     ticker: str,
     limit: int = Query(
         10, description="Maximum number of news articles to retrieve", ge=1, le=30
     ),
 ):
     try:
-        company = yf.Ticker(ticker)
-        from .dataVendors.yfinance.vendor import YahooFinance
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        calls = [("get_news", {"ticker": ticker})]
+        unchanged = httpCaching.not_modified(
+            request, httpCaching.vendor_etag(request, vendor, calls), "news"
+        )
+        if unchanged is not None:
+            return unchanged
 
-        yfinance_vendor = YahooFinance()
-        news_list_raw = yfinance_vendor.get_news(ticker=ticker)
+        news_list_raw = vendor.get_news(ticker=ticker)
 
         if not news_list_raw:
             logger.warning(f"No news found via yfinance vendor for {ticker}")
-            return []
+            return httpCaching.finalize(request, FastJSONResponse(content=[]), "news")
 
         news_items = []
         for item in news_list_raw[:limit]:
@@ -750,10 +867,15 @@ async def get_news_direct(
                         publish_time=publish_time_str,
                         summary=summary,
                         description=description,
-                    ).model_dump(exclude_none=True)
+                    )
                 )
 
-        return news_items
+        return httpCaching.finalize(
+            request,
+            model_response(news_items),
+            "news",
+            httpCaching.vendor_etag(request, vendor, calls),
+        )
     except Exception as e:
         logger.exception(f"Error fetching direct news for {ticker}: {e}")
         raise HTTPException(
@@ -778,49 +900,65 @@ class InstitutionalHolder(BaseModel):
     tags=["Direct Data - Company"],
 )
 async def get_institutional_holders_direct(
+    request: Request,
     ticker: str,
     limit: int = Query(
         10, description="Maximum number of top holders to retrieve", ge=1, le=50
     ),
 ):
     try:
-        company = yf.Ticker(ticker)
-        holders_df = company.institutional_holders
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        calls = [("get_institutional_holders", {"ticker": ticker})]
+        unchanged = httpCaching.not_modified(
+            request,
+            httpCaching.vendor_etag(request, vendor, calls),
+            "institutional_holders",
+        )
+        if unchanged is not None:
+            return unchanged
+
+        holders_df = vendor.get_institutional_holders(ticker=ticker)
 
         if holders_df.empty:
             logger.warning(
                 f"No institutional holders data found via yfinance for {ticker}"
             )
-            return []
-
-        holders_list = []
-        for index, row in holders_df.head(limit).iterrows():
-            # Format Date Reported
-            date_rep_str = (
-                str(row["Date Reported"].date())
-                if isinstance(row.get("Date Reported"), pd.Timestamp)
-                else str(row.get("Date Reported"))
-            )
-
-            # Format % Out
-            percent_out_val = row.get("% Out")
-            percent_out_str = (
-                f"{percent_out_val * 100:.2f}%" if pd.notna(percent_out_val) else None
+            return httpCaching.finalize(
+                request, FastJSONResponse(content=[]), "institutional_holders"
             )
 
-            # Ensure shares is integer
-            shares_val = int(row["Shares"]) if pd.notna(row.get("Shares")) else 0
-
-            holders_list.append(
-                InstitutionalHolder(
-                    holder=str(row["Holder"]),
-                    shares=shares_val,
-                    date_reported=date_rep_str,
-                    percentOut=percent_out_str,  # Alias handled by Pydantic
-                    value=float(row["Value"]) if pd.notna(row.get("Value")) else None,
-                ).model_dump(exclude_none=True, by_alias=True)
-            )
-        return holders_list
+        top_holders = holders_df.head(limit)
+        missing = [None] * len(top_holders)
+        # Columns in InstitutionalHolder field order
+        columns = frameSerializer.frame_to_columns(
+            top_holders,
+            columns={"Holder": "holder", "Shares": "shares"},
+            index_key=None,
+            int_columns=["Shares"],
+        )
+        columns["shares"] = [shares or 0 for shares in columns["shares"]]
+        columns["date_reported"] = (
+            frameSerializer.labels(top_holders["Date Reported"])
+            if "Date Reported" in top_holders
+            else missing
+        )
+        columns["percentOut"] = (
+            frameSerializer.percent_strings(top_holders["% Out"])
+            if "% Out" in top_holders
+            else missing
+        )
+        columns["value"] = (
+            frameSerializer.column_values(top_holders["Value"])
+            if "Value" in top_holders
+            else missing
+        )
+        holders_list = frameSerializer.columns_to_records(columns)
+        return httpCaching.finalize(
+            request,
+            FastJSONResponse(content=holders_list),
+            "institutional_holders",
+            httpCaching.vendor_etag(request, vendor, calls),
+        )
     except Exception as e:
         logger.exception(
             f"Error fetching direct institutional holders for {ticker}: {e}"
@@ -841,8 +979,20 @@ class TrendData(BaseModel):
     trend_signal: Optional[str] = None
 
 
+def _trend_data(trend_result: Dict[str, Any], window1: int, window2: int) -> TrendData:
+    # Map result to response model (adjust keys/aliases if needed)
+    return TrendData(
+        ticker=trend_result["ticker"],
+        current_price=trend_result.get("current_price"),
+        sma_short=trend_result.get(f"sma_{window1}_day"),
+        sma_long=trend_result.get(f"sma_{window2}_day"),
+        trend_signal=trend_result.get("trend_signal"),
+    )
+
+
 @app.get("/trend/{ticker}", response_model=TrendData, tags=["Direct Data - Analysis"])
 async def get_trend_direct(
+    request: Request,
     ticker: str,
     window1: int = Query(50, description="Short-term SMA window", ge=5, le=100),
     window2: int = Query(200, description="Long-term SMA window", ge=50, le=300),
@@ -858,13 +1008,10 @@ async def get_trend_direct(
         if "error" in trend_result:
             raise HTTPException(status_code=404, detail=trend_result["error"])
 
-        # Map result to response model (adjust keys/aliases if needed)
-        return TrendData(
-            ticker=trend_result["ticker"],
-            current_price=trend_result.get("current_price"),
-            sma_short=trend_result.get(f"sma_{window1}_day"),
-            sma_long=trend_result.get(f"sma_{window2}_day"),
-            trend_signal=trend_result.get("trend_signal"),
+        return httpCaching.finalize(
+            request,
+            model_response(_trend_data(trend_result, window1, window2)),
+            "analysis",
         )
     except HTTPException as http_exc:
         raise http_exc
@@ -896,6 +1043,7 @@ class StatisticsData(BaseModel):
     tags=["Direct Data - Analysis"],
 )
 async def get_statistics_direct(
+    request: Request,
     ticker: str,
     start_date: Optional[str] = Query(
         None, description="Start date (YYYY-MM-DD), defaults to 1 year ago"
@@ -915,7 +1063,9 @@ async def get_statistics_direct(
             raise HTTPException(status_code=404, detail=stats_result["error"])
 
         # Pydantic will automatically map matching keys
-        return StatisticsData(**stats_result)
+        return httpCaching.finalize(
+            request, model_response(StatisticsData(**stats_result)), "analysis"
+        )
 
     except HTTPException as http_exc:
         raise http_exc
@@ -942,6 +1092,7 @@ class ReturnsData(BaseModel):
     "/returns/{ticker}", response_model=ReturnsData, tags=["Direct Data - Analysis"]
 )
 async def get_returns_direct(
+    request: Request,
     ticker: str,
     start_date: Optional[str] = Query(
         None, description="Start date (YYYY-MM-DD), defaults to 1 year ago"
@@ -961,7 +1112,9 @@ async def get_returns_direct(
             raise HTTPException(status_code=404, detail=returns_result["error"])
 
         # Pydantic will automatically map matching keys
-        return ReturnsData(**returns_result)
+        return httpCaching.finalize(
+            request, model_response(ReturnsData(**returns_result)), "analysis"
+        )
 
     except HTTPException as http_exc:
         raise http_exc
@@ -971,3 +1124,369 @@ async def get_returns_direct(
             status_code=500,
             detail=f"Internal server error fetching returns for {ticker}: {str(e)}",
         )
+
+
+class TechnicalIndicatorsData(BaseModel):
+    ticker: str
+    as_of: str
+    start_date: str
+    end_date: str
+    current_price: Optional[float] = None
+    indicators: Dict[str, Optional[float]]  # Latest value per output column
+    signals: Dict[str, str]
+    parameters: Dict[str, float]
+    series: Dict[str, List[Any]]  # Columnar: "date", "close" and one array per column
+
+
+@app.get(
+    "/technical_indicators/{ticker}",
+    response_model=TechnicalIndicatorsData,
+    tags=["Direct Data - Analysis"],
+)
+async def get_technical_indicators_direct(
+    request: Request,
+    ticker: str,
+    indicators: Optional[List[str]] = Query(
+        None,
+        description="Indicators to compute in one pass; defaults to all",
+        enum=["ema", "rsi", "macd", "bollinger", "atr", "volatility"],
+    ),
+    start_date: Optional[str] = Query(
+        None, description="Start date (YYYY-MM-DD), defaults to 1 year ago"
+    ),
+    end_date: Optional[str] = Query(
+        None, description="End date (YYYY-MM-DD), defaults to today"
+    ),
+    ema_span: int = Query(20, ge=2, le=400),
+    rsi_window: int = Query(14, ge=2, le=100),
+    bollinger_window: int = Query(20, ge=2, le=200),
+    atr_window: int = Query(14, ge=2, le=100),
+    volatility_window: int = Query(20, ge=2, le=252),
+):
+    try:
+        indicators_result = functionTool.calculate_technical_indicators(
+            ticker=ticker,
+            data_vendor="yfinance",
+            indicators=indicators,
+            start_date=start_date,
+            end_date=end_date,
+            ema_span=ema_span,
+            rsi_window=rsi_window,
+            bollinger_window=bollinger_window,
+            atr_window=atr_window,
+            volatility_window=volatility_window,
+            include_series=True,
+        )
+        if "error" in indicators_result:
+            raise HTTPException(status_code=404, detail=indicators_result["error"])
+
+        indicators_result.pop("message", None)
+        # Already JSON-ready columns; encode once without re-validation
+        return httpCaching.finalize(
+            request, FastJSONResponse(content=indicators_result), "analysis"
+        )
+
+    except HTTPException as http_exc:
+        raise http_exc
+    except Exception as e:
+        logger.exception(f"Error fetching technical indicators for {ticker}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error fetching technical indicators for {ticker}: {str(e)}",
+        )
+
+
+class PriceAnalyticsData(BaseModel):
+    ticker: str
+    start_date: str
+    end_date: str
+    summary: Optional[Dict[str, Any]] = None
+    statistics: Optional[Dict[str, Any]] = None
+    returns: Optional[Dict[str, Any]] = None
+    trend: Optional[Dict[str, Any]] = None
+
+
+@app.get(
+    "/price_analytics/{ticker}",
+    response_model=PriceAnalyticsData,
+    response_model_exclude_none=True,
+    tags=["Direct Data - Analysis"],
+)
+async def get_price_analytics_direct(
+    request: Request,
+    ticker: str,
+    include: Optional[List[str]] = Query(
+        None,
+        description="Analytics groups computed from one price fetch; defaults to all",
+        enum=list(functionTool.PRICE_ANALYTICS_GROUPS),
+    ),
+    start_date: Optional[str] = Query(
+        None, description="Start date (YYYY-MM-DD), defaults to 1 year ago"
+    ),
+    end_date: Optional[str] = Query(
+        None, description="End date (YYYY-MM-DD), defaults to today"
+    ),
+    window1: int = Query(50, description="Short-term SMA window", ge=5, le=100),
+    window2: int = Query(200, description="Long-term SMA window", ge=50, le=300),
+):
+    try:
+        analytics_result = functionTool.calculate_price_analytics(
+            ticker=ticker,
+            data_vendor="yfinance",
+            start_date=start_date,
+            end_date=end_date,
+            include=include,
+            window1=window1,
+            window2=window2,
+        )
+        if "error" in analytics_result:
+            raise HTTPException(status_code=404, detail=analytics_result["error"])
+
+        analytics_result.pop("message", None)
+        return httpCaching.finalize(
+            request, FastJSONResponse(content=analytics_result), "analysis"
+        )
+
+    except HTTPException as http_exc:
+        raise http_exc
+    except Exception as e:
+        logger.exception(f"Error fetching price analytics for {ticker}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error fetching price analytics for {ticker}: {str(e)}",
+        )
+
+
+# --- Bulk Direct Data Endpoints ---
+
+
+class BulkCompanyInfo(BaseModel):
+    results: Dict[str, CompanyInfo]
+    errors: Dict[str, str]  # Ticker -> reason; other tickers are unaffected
+
+
+class BulkKeyMetrics(BaseModel):
+    results: Dict[str, List[FinancialMetric]]
+    errors: Dict[str, str]
+
+
+class BulkTrendData(BaseModel):
+    results: Dict[str, TrendData]
+    errors: Dict[str, str]
+
+
+BULK_TICKERS_DESCRIPTION = (
+    f"Comma-separated ticker symbols (at most {BULK_MAX_TICKERS}), e.g. AAPL,MSFT,NVDA"
+)
+
+
+def _parse_tickers(tickers: str) -> List[str]:
+    symbols = list(
+        dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip())
+    )
+    if not symbols:
+        raise HTTPException(status_code=400, detail="No tickers provided.")
+    if len(symbols) > BULK_MAX_TICKERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many tickers ({len(symbols)}); at most {BULK_MAX_TICKERS} per request.",
+        )
+    return symbols
+
+
+async def _fan_out(
+    symbols: List[str], fetch: Callable[[str], Any]
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    # Blocking per-ticker work runs in threads, at most BULK_FETCH_CONCURRENCY
+    # at a time for this request; a failing ticker never fails the batch
+    semaphore = asyncio.Semaphore(BULK_FETCH_CONCURRENCY)
+
+    async def run(symbol: str):
+        async with semaphore:
+            try:
+                return symbol, await asyncio.to_thread(fetch, symbol), None
+            except HTTPException as http_exc:
+                return symbol, None, str(http_exc.detail)
+            except Exception as e:
+                logger.warning(f"Bulk fetch failed for {symbol}: {e}")
+                return symbol, None, f"Error fetching data for {symbol}: {str(e)}"
+
+    results, errors = {}, {}
+    for symbol, value, error in await asyncio.gather(*map(run, symbols)):
+        if error is None:
+            results[symbol] = value
+        else:
+            errors[symbol] = error
+    logger.info(f"Bulk fetch of {len(symbols)} tickers ({len(errors)} failed).")
+    return results, errors
+
+
+@app.get(
+    "/bulk/company_info",
+    response_model=BulkCompanyInfo,
+    tags=["Direct Data - Bulk"],
+)
+async def get_bulk_company_info(
+    request: Request,
+    tickers: str = Query(..., description=BULK_TICKERS_DESCRIPTION),
+):
+    symbols = _parse_tickers(tickers)
+    try:
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        results, errors = await _fan_out(
+            symbols, lambda symbol: _company_info_model(vendor, symbol)
+        )
+        return httpCaching.finalize(
+            request,
+            model_response(BulkCompanyInfo(results=results, errors=errors)),
+            "company_info",
+        )
+    except Exception as e:
+        logger.exception(f"Error fetching bulk company info for {symbols}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error fetching bulk company info: {str(e)}",
+        )
+
+
+@app.get(
+    "/bulk/key_metrics",
+    response_model=BulkKeyMetrics,
+    tags=["Direct Data - Bulk"],
+)
+async def get_bulk_key_metrics(
+    request: Request,
+    tickers: str = Query(..., description=BULK_TICKERS_DESCRIPTION),
+):
+    symbols = _parse_tickers(tickers)
+    try:
+        vendor = DataVendorFactory.get_vendor("yfinance")
+        results, errors = await _fan_out(
+            symbols, lambda symbol: _key_metrics_list(vendor, symbol)
+        )
+        return httpCaching.finalize(
+            request,
+            model_response(BulkKeyMetrics(results=results, errors=errors)),
+            "key_metrics",
+        )
+    except Exception as e:
+        logger.exception(f"Error fetching bulk key metrics for {symbols}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error fetching bulk key metrics: {str(e)}",
+        )
+
+
+@app.get(
+    "/bulk/trend",
+    response_model=BulkTrendData,
+    tags=["Direct Data - Bulk"],
+)
+async def get_bulk_trend(
+    request: Request,
+    tickers: str = Query(..., description=BULK_TICKERS_DESCRIPTION),
+    window1: int = Query(50, description="Short-term SMA window", ge=5, le=100),
+    window2: int = Query(200, description="Long-term SMA window", ge=50, le=300),
+):
+    symbols = _parse_tickers(tickers)
+
+    def trend(symbol: str) -> TrendData:
+        trend_result = functionTool.calculate_price_trend(
+            ticker=symbol, data_vendor="yfinance", window1=window1, window2=window2
+        )
+        if "error" in trend_result:
+            raise HTTPException(status_code=404, detail=trend_result["error"])
+        return _trend_data(trend_result, window1, window2)
+
+    try:
+        results, errors = await _fan_out(symbols, trend)
+        return httpCaching.finalize(
+            request,
+            model_response(BulkTrendData(results=results, errors=errors)),
+            "analysis",
+        )
+    except Exception as e:
+        logger.exception(f"Error fetching bulk trend data for {symbols}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error fetching bulk trend data: {str(e)}",
+        )
+
+
+# --- Live Quotes ---
+
+
+def _parse_quote_tickers(symbols: Any) -> List[str]:
+    if isinstance(symbols, str):
+        symbols = symbols.split(",")
+    if not isinstance(symbols, list):
+        return []
+    return list(
+        dict.fromkeys(str(t).strip().upper() for t in symbols if str(t).strip())
+    )
+
+
+@app.websocket("/ws/quotes")
+async def quotes_websocket(websocket: WebSocket, tickers: str = ""):
+    # Connect with ?tickers=AAPL,MSFT and send
+    # {"action": "subscribe" | "unsubscribe", "tickers": [...]} to change the
+    # set. Quotes are pushed as {"type": "quote", ...} whenever they move.
+    await websocket.accept()
+    subscribed = _parse_quote_tickers(tickers)[:QUOTE_MAX_TICKERS_PER_CONNECTION]
+    queue = quote_service.subscribe(subscribed)
+
+    async def receive():
+        current = set(subscribed)
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                message = None
+            if not isinstance(message, dict) or message.get("action") not in (
+                "subscribe",
+                "unsubscribe",
+            ):
+                await websocket.send_json(
+                    {
+                        "type": "error",
+                        "detail": 'Send {"action": "subscribe" | "unsubscribe", "tickers": [...]}.',
+                    }
+                )
+                continue
+            symbols = _parse_quote_tickers(message.get("tickers"))
+            if message["action"] == "unsubscribe":
+                current = quote_service.update_subscription(queue, remove=symbols)
+            elif len(current | set(symbols)) > QUOTE_MAX_TICKERS_PER_CONNECTION:
+                await websocket.send_json(
+                    {
+                        "type": "error",
+                        "detail": f"At most {QUOTE_MAX_TICKERS_PER_CONNECTION} tickers per connection.",
+                    }
+                )
+                continue
+            else:
+                current = quote_service.update_subscription(queue, add=symbols)
+                quote_service.ensure_polling()
+            await websocket.send_json(
+                {"type": "subscribed", "tickers": sorted(current)}
+            )
+
+    async def send():
+        while True:
+            quote = await queue.get()
+            await websocket.send_json({"type": "quote", **quote})
+
+    try:
+        await websocket.send_json({"type": "subscribed", "tickers": sorted(subscribed)})
+        tasks = [asyncio.create_task(receive()), asyncio.create_task(send())]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                logger.warning(f"Quote WebSocket failed: {error}")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        quote_service.unsubscribe(queue)
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List, Dict, Any
+
+
+class BaseSessionStore(ABC):
+
+    @abstractmethod
+    def create(self, data_vendor: str) -> str:
+        pass
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def get_messages(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        pass
+
+    @abstractmethod
+    def append_messages(self, session_id: str, messages: List[Dict[str, Any]]) -> bool:
+        pass
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        pass
@@ -0,0 +1,76 @@
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any
+
+from .baseSessionStore import BaseSessionStore
+
+logger = logging.getLogger(__name__)
+
+
+class InMemorySessionStore(BaseSessionStore):
+    def __init__(self, max_sessions: int = 1000, ttl_seconds: int = 86400):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _touch(self, session_id: str) -> Optional[Dict[str, Any]]:
+        # Caller holds the lock. Returns the live session or None if missing/expired.
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        if time.time() - session["updated_at"] > self.ttl_seconds:
+            del self._sessions[session_id]
+            return None
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def create(self, data_vendor: str) -> str:
+        session_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._sessions[session_id] = {
+                "session_id": session_id,
+                "data_vendor": data_vendor,
+                "created_at": now,
+                "updated_at": now,
+                "messages": [],
+            }
+            while len(self._sessions) > self.max_sessions:
+                evicted_id, _ = self._sessions.popitem(last=False)
+                logger.info(f"Evicted least recently used chat session {evicted_id}.")
+        return session_id
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._touch(session_id)
+            if session is None:
+                return None
+            return {
+                "session_id": session_id,
+                "data_vendor": session["data_vendor"],
+                "created_at": session["created_at"],
+                "updated_at": session["updated_at"],
+                "message_count": len(session["messages"]),
+            }
+
+    def get_messages(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            session = self._touch(session_id)
+            return list(session["messages"]) if session is not None else None
+
+    def append_messages(self, session_id: str, messages: List[Dict[str, Any]]) -> bool:
+        with self._lock:
+            session = self._touch(session_id)
+            if session is None:
+                return False
+            session["messages"].extend(messages)
+            session["updated_at"] = time.time()
+            return True
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
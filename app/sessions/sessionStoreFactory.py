@@ -0,0 +1,47 @@
+from typing import Type, Optional
+import logging
+
+from ..constants.settings import (
+    SESSION_STORE,
+    SESSION_MAX_ENTRIES,
+    SESSION_TTL_SECONDS,
+    SESSION_DB_PATH,
+)
+from .baseSessionStore import BaseSessionStore
+from .inMemorySessionStore import InMemorySessionStore
+from .sqliteSessionStore import SQLiteSessionStore
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStoreFactory:
+    _stores: dict[str, Type[BaseSessionStore]] = {
+        "memory": InMemorySessionStore,
+        "sqlite": SQLiteSessionStore,
+    }
+    _instance: Optional[BaseSessionStore] = None
+
+    @classmethod
+    def create_store(cls, store_name: str) -> BaseSessionStore:
+        store_name = store_name.lower()
+        if store_name not in cls._stores:
+            logger.error(f"Unsupported session store requested: {store_name}")
+            raise ValueError(f"Unsupported session store: {store_name}")
+
+        logger.info(f"Creating session store: {store_name}")
+        if store_name == "sqlite":
+            return SQLiteSessionStore(
+                db_path=SESSION_DB_PATH,
+                ttl_seconds=SESSION_TTL_SECONDS,
+                max_sessions=SESSION_MAX_ENTRIES,
+            )
+        return InMemorySessionStore(
+            max_sessions=SESSION_MAX_ENTRIES, ttl_seconds=SESSION_TTL_SECONDS
+        )
+
+    @classmethod
+    def get_store(cls) -> BaseSessionStore:
+        # One shared store per process, chosen by the SESSION_STORE setting
+        if cls._instance is None:
+            cls._instance = cls.create_store(SESSION_STORE)
+        return cls._instance
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from typing import Optional, List, Dict, Any
+
+from .baseSessionStore import BaseSessionStore
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteSessionStore(BaseSessionStore):
+    def __init__(
+        self,
+        db_path: str = "data/sessions.db",
+        ttl_seconds: int = 86400,
+        max_sessions: int = 1000,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                data_vendor TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                message_count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS messages (
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                message TEXT NOT NULL,
+                PRIMARY KEY (session_id, seq)
+            );
+            CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions (updated_at);
+            """)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        logger.info(f"SQLite session store ready at {db_path}.")
+
+    def _is_live(self, row) -> bool:
+        return row is not None and time.time() - row[3] <= self.ttl_seconds
+
+    def _prune(self, now: float):
+        # Caller holds the lock. Drops expired sessions, then the least
+        # recently updated ones beyond max_sessions (leaving room for one more)
+        cutoff = now - self.ttl_seconds
+        removed = [
+            row[0]
+            for row in self._conn.execute(
+                "SELECT session_id FROM sessions WHERE updated_at < ?", (cutoff,)
+            )
+        ]
+        removed += [
+            row[0]
+            for row in self._conn.execute(
+                "SELECT session_id FROM sessions WHERE updated_at >= ? ORDER BY updated_at DESC LIMIT -1 OFFSET ?",
+                (cutoff, max(self.max_sessions - 1, 0)),
+            )
+        ]
+        if not removed:
+            return
+        params = [(session_id,) for session_id in removed]
+        self._conn.executemany("DELETE FROM messages WHERE session_id = ?", params)
+        self._conn.executemany("DELETE FROM sessions WHERE session_id = ?", params)
+        logger.info(f"Pruned {len(removed)} expired or evicted chat sessions.")
+
+    def create(self, data_vendor: str) -> str:
+        session_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._prune(now)
+            self._conn.execute(
+                "INSERT INTO sessions (session_id, data_vendor, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (session_id, data_vendor, now, now),
+            )
+            self._conn.commit()
+        return session_id
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT session_id, data_vendor, created_at, updated_at, message_count FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+        if not self._is_live(row):
+            return None
+        return {
+            "session_id": row[0],
+            "data_vendor": row[1],
+            "created_at": row[2],
+            "updated_at": row[3],
+            "message_count": row[4],
+        }
+
+    def get_messages(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        if self.get(session_id) is None:
+            return None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT message FROM messages WHERE session_id = ? ORDER BY seq",
+                (session_id,),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def append_messages(self, session_id: str, messages: List[Dict[str, Any]]) -> bool:
+        with self._lock:
+            # Read and insert in one locked transaction so concurrent turns on
+            # a session get consecutive seqs
+            row = self._conn.execute(
+                "SELECT session_id, data_vendor, created_at, updated_at, message_count FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if not self._is_live(row):
+                return False
+            start_seq = row[4]
+            self._conn.executemany(
+                "INSERT INTO messages (session_id, seq, message) VALUES (?, ?, ?)",
+                [
+                    (session_id, start_seq + offset, json.dumps(message))
+                    for offset, message in enumerate(messages)
+                ],
+            )
+            self._conn.execute(
+                "UPDATE sessions SET updated_at = ?, message_count = message_count + ? WHERE session_id = ?",
+                (time.time(), len(messages), session_id),
+            )
+            self._conn.commit()
+        return True
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM messages WHERE session_id = ?", (session_id,)
+            )
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
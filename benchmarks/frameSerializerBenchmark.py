@@ -0,0 +1,115 @@
+# Compares per-cell conversion (safe_float / pd.notna inside Python loops)
+# with the vectorized frameSerializer on vendor-shaped frames.
+# Run from the repository root: python -m benchmarks.frameSerializerBenchmark
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from app.dataVendors import frameSerializer
+from app.dataVendors.functionTool import safe_float
+
+REPEAT = 5
+
+
+def statement_frame(line_items: int, periods: int) -> pd.DataFrame:
+    # Wide statement: line items as rows, report dates as columns, ~1 in 7 NaN
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(line_items, periods)) * 1e9
+    values[rng.random(values.shape) < 0.15] = np.nan
+    return pd.DataFrame(
+        values,
+        index=[f"Line Item {i}" for i in range(line_items)],
+        columns=pd.date_range("2000-12-31", periods=periods, freq="YE")[::-1],
+    )
+
+
+def holders_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    percent = rng.random(rows) / 10
+    percent[::9] = np.nan
+    return pd.DataFrame(
+        {
+            "Date Reported": pd.Timestamp("2024-06-30")
+            - pd.to_timedelta(rng.integers(0, 90, rows), unit="D"),
+            "Holder": [f"Fund {i}" for i in range(rows)],
+            "% Out": percent,
+            "Shares": rng.integers(1_000, 10_000_000, rows),
+            "Value": rng.random(rows) * 1e9,
+        }
+    )
+
+
+def old_statement(frame: pd.DataFrame) -> dict:
+    result = {}
+    for col in frame.columns:
+        col_date_str = str(col.date()) if isinstance(col, pd.Timestamp) else str(col)
+        metrics = {}
+        for idx, value in frame[col].items():
+            metrics[idx] = safe_float(value) if pd.notna(value) else None
+        result[col_date_str] = metrics
+    return result
+
+
+def old_holders(frame: pd.DataFrame) -> list:
+    cleaned = []
+    for record in frame.to_dict(orient="records"):
+        cleaned_record = {}
+        for k, v in record.items():
+            if pd.notna(v):
+                if k == "Date Reported" and isinstance(v, pd.Timestamp):
+                    cleaned_record[k] = v.strftime("%Y-%m-%d")
+                elif k == "% Out" and isinstance(v, (float, np.number)):
+                    cleaned_record[k] = f"{safe_float(v * 100):.2f}%"
+                elif isinstance(v, (int, float, np.number)):
+                    cleaned_record[k] = safe_float(v)
+                else:
+                    cleaned_record[k] = str(v)
+        if cleaned_record:
+            cleaned.append(cleaned_record)
+    return cleaned
+
+
+def new_holders(frame: pd.DataFrame) -> list:
+    columns = frameSerializer.frame_to_columns(frame, index_key=None)
+    columns["% Out"] = frameSerializer.percent_strings(frame["% Out"])
+    return [
+        record
+        for record in frameSerializer.columns_to_records(columns, drop_none=True)
+        if record
+    ]
+
+
+def main():
+    cases = []
+    for line_items, periods in [(40, 4), (200, 20), (1000, 40)]:
+        frame = statement_frame(line_items, periods)
+        assert old_statement(frame) == frameSerializer.frame_to_nested(frame)
+        cases.append(
+            (
+                f"statement ({line_items}x{periods})",
+                lambda frame=frame: old_statement(frame),
+                lambda frame=frame: frameSerializer.frame_to_nested(frame),
+            )
+        )
+    for rows in [10, 1000]:
+        frame = holders_frame(rows)
+        assert old_holders(frame) == new_holders(frame)
+        cases.append(
+            (
+                f"holders records ({rows} rows)",
+                lambda frame=frame: old_holders(frame),
+                lambda frame=frame: new_holders(frame),
+            )
+        )
+
+    for name, old, new in cases:
+        old_s = min(timeit.repeat(old, number=1, repeat=REPEAT))
+        new_s = min(timeit.repeat(new, number=1, repeat=REPEAT))
+        print(
+            f"{name:32s} old {old_s * 1000:8.2f} ms  new {new_s * 1000:8.2f} ms  speedup {old_s / new_s:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Compares the previous /historical_prices body construction (iterrows, one
+# pydantic model per row) with the vectorized row and column modes, in time
+# and peak traced memory. Response encoding is included in every path.
+# Run from the repository root: python -m benchmarks.historicalPricesBenchmark
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from app.api.jsonResponse import dumps_bytes, model_response
+from app.dataVendors import frameSerializer
+from app.main import HISTORICAL_PRICE_FIELDS, HistoricalPriceData
+
+REPEAT = 3
+
+
+def history_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1_000, 10_000_000, rows),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=pd.date_range(
+            "2000-01-03", periods=rows, freq="B", tz="America/New_York"
+        ),
+    )
+
+
+def old_body(history: pd.DataFrame) -> bytes:
+    prices = []
+    for index, row in history.iterrows():
+        date_str = str(index.date()) if isinstance(index, pd.Timestamp) else str(index)
+        prices.append(
+            HistoricalPriceData(
+                date=date_str,
+                open=row.get("Open") if pd.notna(row.get("Open")) else None,
+                high=row.get("High") if pd.notna(row.get("High")) else None,
+                low=row.get("Low") if pd.notna(row.get("Low")) else None,
+                close=row.get("Close") if pd.notna(row.get("Close")) else None,
+                adjClose=(
+                    row.get("Adj Close")
+                    if pd.notna(row.get("Adj Close"))
+                    else row.get("Close") if pd.notna(row.get("Close")) else None
+                ),
+                volume=int(row["Volume"]) if pd.notna(row.get("Volume")) else None,
+            )
+        )
+    return model_response(prices).body
+
+
+def _columns(history: pd.DataFrame) -> dict:
+    history = history.loc[
+        :, history.columns.intersection(list(HISTORICAL_PRICE_FIELDS))
+    ]
+    history = history.assign(**{"Adj Close": history["Close"]})
+    return frameSerializer.frame_to_columns(
+        history, columns=HISTORICAL_PRICE_FIELDS, int_columns=["Volume"]
+    )
+
+
+def rows_body(history: pd.DataFrame) -> bytes:
+    return dumps_bytes(frameSerializer.columns_to_records(_columns(history)))
+
+
+def columns_body(history: pd.DataFrame) -> bytes:
+    return dumps_bytes(_columns(history))
+
+
+def peak_kib(func, history: pd.DataFrame) -> float:
+    tracemalloc.start()
+    func(history)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    for rows in [2520, 20000]:  # ~10 years daily; a long intraday range
+        history = history_frame(rows)
+        assert old_body(history) == rows_body(history)
+        old_s = min(timeit.repeat(lambda: old_body(history), number=1, repeat=REPEAT))
+        old_kib = peak_kib(old_body, history)
+        for name, func in [("rows", rows_body), ("columns", columns_body)]:
+            new_s = min(timeit.repeat(lambda: func(history), number=1, repeat=REPEAT))
+            print(
+                f"{rows:6d} rows, {name:8s} old {old_s * 1000:8.2f} ms / {old_kib:8.0f} KiB"
+                f"  new {new_s * 1000:7.2f} ms / {peak_kib(func, history):7.0f} KiB"
+                f"  speedup {old_s / new_s:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
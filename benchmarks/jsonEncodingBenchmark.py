@@ -0,0 +1,122 @@
+# Compares the previous encoding path (per-row pydantic dump, FastAPI
+# response_model re-validation, stdlib json) with the fast path used now.
+# Run from the repository root: python -m benchmarks.jsonEncodingBenchmark
+import json
+import timeit
+from typing import List
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.api.jsonResponse import dumps, dumps_bytes, model_response
+from app.main import HistoricalPriceData, FinancialStatementResponse
+
+ROWS = 2520  # ~10 years of daily bars
+REPEAT = 5
+
+
+def price_models() -> List[HistoricalPriceData]:
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(ROWS).cumsum()
+    dates = pd.bdate_range("2015-01-01", periods=ROWS)
+    return [
+        HistoricalPriceData(
+            date=str(day.date()),
+            open=float(price),
+            high=float(price) + 1,
+            low=float(price) - 1,
+            close=float(price),
+            adjClose=float(price),
+            volume=1_000_000 + i,
+        )
+        for i, (day, price) in enumerate(zip(dates, close))
+    ]
+
+
+def statement_dict() -> dict:
+    rng = np.random.default_rng(1)
+    return {
+        f"{2024 - year}-12-31": {
+            f"Line Item {i}": (None if i % 7 == 0 else float(rng.normal() * 1e9))
+            for i in range(120)
+        }
+        for year in range(5)
+    }
+
+
+def main():
+    models = price_models()
+    adapter = TypeAdapter(List[HistoricalPriceData])
+
+    def old_prices():
+        # model_dump per row, then FastAPI validates the list and encodes it
+        rows = [m.model_dump(exclude_none=True, by_alias=True) for m in models]
+        validated = adapter.validate_python(rows)
+        content = jsonable_encoder(validated, by_alias=True)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def new_prices():
+        return model_response(models).body
+
+    statement = statement_dict()
+
+    def old_statement():
+        model = FinancialStatementResponse(
+            ticker="AAPL",
+            statement_type="income_statement",
+            period="annual",
+            statement=statement,
+        )
+        validated = FinancialStatementResponse.model_validate(model.model_dump())
+        content = jsonable_encoder(validated)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def new_statement():
+        return dumps_bytes(
+            {
+                "ticker": "AAPL",
+                "statement_type": "income_statement",
+                "period": "annual",
+                "statement": statement,
+            }
+        )
+
+    tool_result = {
+        "ticker": "AAPL",
+        "prices": [
+            {
+                "date": f"2024-01-{d:02d}",
+                "close": np.float64(100 + d),
+                "volume": np.int64(d),
+            }
+            for d in range(1, 29)
+        ]
+        * 20,
+    }
+
+    def old_tool():
+        return json.dumps(
+            jsonable_encoder(
+                tool_result, custom_encoder={np.generic: lambda v: v.item()}
+            )
+        )
+
+    def new_tool():
+        return dumps(tool_result)
+
+    for name, old, new in [
+        (f"/historical_prices ({ROWS} rows)", old_prices, new_prices),
+        ("/financial_statements (5x120)", old_statement, new_statement),
+        ("tool message (560 rows, numpy scalars)", old_tool, new_tool),
+    ]:
+        old_s = min(timeit.repeat(old, number=1, repeat=REPEAT))
+        new_s = min(timeit.repeat(new, number=1, repeat=REPEAT))
+        print(
+            f"{name:42s} old {old_s * 1000:8.2f} ms  new {new_s * 1000:8.2f} ms  speedup {old_s / new_s:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Compares rebuilding /company_info, /key_metrics and /financial_statements
+# responses from vendor-cached data (cleaning, model validation, encoding)
+# with serving the stored bytes from the response cache.
+# Run from the repository root: python -m benchmarks.responseCacheBenchmark
+import timeit
+
+import numpy as np
+import pandas as pd
+from starlette.requests import Request
+
+from app.api.responseCache import ResponseCache
+from app.dataVendors.vendorCache import CachedDataVendor, VendorCache
+from app.api.jsonResponse import model_response
+from app.main import (
+    _company_info_model,
+    _financial_statement_response,
+    _key_metrics_list,
+)
+
+NUMBER = 200
+
+
+class StubVendor:
+    # Vendor-shaped data: a yfinance-sized info blob and a wide statement
+    def get_company_info(self, ticker: str) -> pd.Series:
+        info = {f"field{i}": float(i) * 1.5 for i in range(150)}
+        info.update(
+            symbol=ticker,
+            longName="Example Corp",
+            longBusinessSummary="Makes things. " * 60,
+            marketCap=2.5e12,
+            trailingPE=float("nan"),
+            dividendYield=0.005,
+            companyOfficers=[
+                {"name": f"Officer {i}", "title": "VP", "age": "50", "totalPay": i}
+                for i in range(10)
+            ],
+        )
+        return pd.Series(info)
+
+    def get_financial_statements(
+        self, ticker: str, statement_type: str, period: str = "annual"
+    ) -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        return pd.DataFrame(
+            rng.normal(size=(80, 4)) * 1e9,
+            index=[f"Line Item {i}" for i in range(80)],
+            columns=pd.date_range("2021-12-31", periods=4, freq="YE")[::-1],
+        )
+
+
+def make_request(path: str, query: str = "") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [(b"accept-encoding", b"gzip")],
+        }
+    )
+
+
+def main():
+    vendor = CachedDataVendor(StubVendor(), "stub", VendorCache())
+    cache = ResponseCache()
+    statement = {
+        "ticker": "AAPL",
+        "statement_type": "balance_sheet",
+        "period": "annual",
+    }
+    cases = [
+        (
+            "company_info",
+            {"ticker": "AAPL"},
+            [("get_company_info", {"ticker": "AAPL"})],
+            lambda: model_response(_company_info_model(vendor, "AAPL")),
+        ),
+        (
+            "key_metrics",
+            {"ticker": "AAPL"},
+            [("get_company_info", {"ticker": "AAPL"})],
+            lambda: model_response(_key_metrics_list(vendor, "AAPL")),
+        ),
+        (
+            "financial_statements",
+            statement,
+            [("get_financial_statements", statement)],
+            lambda: _financial_statement_response(vendor, **statement),
+        ),
+    ]
+    for route, params, calls, build in cases:
+        request = make_request(f"/{route}/AAPL")
+        build()  # Warm the vendor cache so both paths skip the fetch
+        cache.serve(request, route, params, vendor, calls, build)
+        rebuild_s = min(timeit.repeat(build, number=NUMBER, repeat=3)) / NUMBER
+        hit_s = (
+            min(
+                timeit.repeat(
+                    lambda: cache.serve(request, route, params, vendor, calls, build),
+                    number=NUMBER,
+                    repeat=3,
+                )
+            )
+            / NUMBER
+        )
+        print(
+            f"{route:22s} rebuild {rebuild_s * 1e6:8.1f} us  cached {hit_s * 1e6:7.1f} us"
+            f"  speedup {rebuild_s / hit_s:5.1f}x"
+        )
+    print(cache.stats())
+
+
+if __name__ == "__main__":
+    main()
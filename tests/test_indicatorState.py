@@ -0,0 +1,135 @@
+import pandas as pd
+import pytest
+
+from app.dataVendors import tradingCalendar
+from app.dataVendors.indicatorState import IndicatorStore, TickerIndicatorState
+
+
+def _closes(values, start="2024-01-02"):
+    return pd.Series(values, index=pd.bdate_range(start, periods=len(values)))
+
+
+def test_sync_applies_only_new_bars():
+    state = TickerIndicatorState(capacity=4)
+    state.windows.track(3)
+    state.sync(_closes([10.0, 11.0, 12.0, 13.0]))
+
+    applied = state.sync(_closes([10.0, 11.0, 12.0, 13.0, 14.0]))
+
+    assert applied == 2  # Last bar revised, one new bar
+    assert state.windows.values() == [11.0, 12.0, 13.0, 14.0]
+    assert state.windows.sma(3) == pytest.approx(13.0)
+
+
+def test_sync_reseeds_after_split_adjustment():
+    state = TickerIndicatorState(capacity=4)
+    state.windows.track(3)
+    state.sync(_closes([100.0, 102.0, 104.0, 106.0]))
+
+    # 2-for-1 split: the vendor re-adjusts every close it returns
+    state.sync(_closes([50.0, 51.0, 52.0, 53.0, 27.0]))
+
+    assert state.windows.values() == [51.0, 52.0, 53.0, 27.0]
+    assert state.windows.sma(3) == pytest.approx(44.0)
+    assert state.last_bar == _closes([0.0] * 5).index[-1].date()
+
+
+def test_sync_reseeds_after_dividend_adjustment():
+    state = TickerIndicatorState(capacity=3)
+    state.windows.track(2)
+    state.sync(_closes([20.0, 20.0, 20.0]))
+
+    state.sync(_closes([19.9, 19.9, 20.0, 20.1]))
+
+    assert state.windows.values() == [19.9, 20.0, 20.1]
+    assert state.windows.sma(2) == pytest.approx(20.05)
+
+
+def test_sync_keeps_state_when_only_latest_bar_moves():
+    state = TickerIndicatorState(capacity=10)
+    state.sync(_closes([10.0, 11.0, 12.0]))
+
+    # Today's bar was polled intraday; the daily close revises only it
+    state.sync(_closes([10.0, 11.0, 12.5]))
+
+    assert state.windows.values() == [10.0, 11.0, 12.5]
+    assert state.windows.count == 3
+
+
+def test_sync_frame_keeps_forming_bar_out():
+    calendar = tradingCalendar.nyse_calendar
+    today = calendar.today()
+    sessions = calendar.sessions(today)
+    completed = sessions[sessions < today][-30:]
+    index = pd.DatetimeIndex(list(completed) + [today])
+    frame = pd.DataFrame({"Close": [10.0] * 30 + [11.0]}, index=index)
+    store = IndicatorStore(db_path=None)
+
+    store.sync_frame("yfinance", "AAPL", frame)
+
+    state = store._states[store._key("yfinance", "AAPL")]
+    assert state.last_bar == pd.Timestamp(completed[-1]).date()
+    assert state.windows.latest() == 10.0
+
+
+def test_sync_ignores_frames_ending_before_last_bar():
+    state = TickerIndicatorState()
+    closes = _closes([float(value) for value in range(100, 300)])
+    state.sync(closes)
+
+    # Same data, requested with an end date a few sessions back
+    applied = state.sync(closes.iloc[:-3])
+
+    assert applied == 0
+    assert state.last_bar == closes.index[-1].date()
+    assert state.windows.count == 200
+
+
+def test_sync_matches_overlap_by_date_when_bars_are_missing():
+    state = TickerIndicatorState(capacity=5)
+    state.sync(_closes([1.0, 2.0, 3.0, 4.0, 5.0]))
+
+    # The refreshed frame lacks the third close; the others are unchanged
+    state.sync(_closes([1.0, 2.0, float("nan"), 4.0, 5.0, 6.0]))
+
+    assert state.windows.values() == [2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_bar_dates_survive_persistence():
+    state = TickerIndicatorState(capacity=5)
+    state.sync(_closes([1.0, 2.0, 3.0, 4.0, 5.0]))
+
+    restored = TickerIndicatorState.from_dict(state.to_dict())
+    # Re-adjusted closes are still recognized after a reload
+    restored.sync(_closes([0.5, 1.0, 1.5, 2.0, 2.5]))
+
+    assert restored.windows.values() == [0.5, 1.0, 1.5, 2.0, 2.5]
+
+
+def test_sma_snapshot_is_fresh_until_the_next_session_closes():
+    calendar = tradingCalendar.nyse_calendar
+    today = calendar.today()
+    sessions = calendar.sessions(today)
+    completed = sessions[sessions < today]
+    store = IndicatorStore(db_path=None)
+    store.sync_frame(
+        "yfinance",
+        "AAPL",
+        pd.DataFrame({"Close": [10.0] * 60}, index=pd.DatetimeIndex(completed[-60:])),
+    )
+    state = store._states[store._key("yfinance", "AAPL")]
+    state.updated_at = 0.0  # Age no longer matters
+
+    assert store.sma_snapshot("yfinance", "AAPL", (50,)) == (
+        10.0,
+        {50: 10.0},
+        pd.Timestamp(completed[-1]).date(),
+    )
+
+    # Missing the last completed session: stale
+    store.sync_frame(
+        "yfinance",
+        "MSFT",
+        pd.DataFrame({"Close": [10.0] * 60}, index=pd.DatetimeIndex(completed[-61:-1])),
+    )
+    assert store.sma_snapshot("yfinance", "MSFT", (50,)) is None
@@ -0,0 +1,56 @@
+import pytest
+
+from app.ai.intentRouter import IntentRouter
+
+
+@pytest.fixture
+def router():
+    return IntentRouter(enabled=True, min_confidence=0.85, max_words=12)
+
+
+@pytest.mark.parametrize(
+    "query, tools, ticker",
+    [
+        ("AAPL price", ["get_ticker_price"], "AAPL"),
+        ("$TSLA quote", ["get_ticker_price"], "TSLA"),
+        ("apple stock price", ["get_ticker_price"], "AAPL"),
+        ("MSFT price history", ["get_ticker_history"], "MSFT"),
+        ("MSFT balance sheet", ["get_financial_statements"], "MSFT"),
+        ("nvidia revenue", ["get_financial_statements"], "NVDA"),
+        ("NVDA rsi", ["calculate_technical_indicators"], "NVDA"),
+        ("TSLA returns", ["calculate_returns"], "TSLA"),
+        ("AAPL news", ["get_financial_news"], "AAPL"),
+    ],
+)
+def test_routes_confident_queries(router, query, tools, ticker):
+    tool_calls = router.route(query)
+
+    assert [call["name"] for call in tool_calls] == tools
+    assert all(call["arguments"]["ticker"] == ticker for call in tool_calls)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        # Ranges the tools' default windows would answer wrongly
+        "TSLA ytd performance",
+        "TSLA year to date returns",
+        "MSFT price last week",
+        "AAPL returns past year",
+        "NVDA price yesterday",
+        "AAPL performance this month",
+        "AAPL returns since 2020",
+        # Analyst targets are not the current price
+        "Target price for AAPL",
+        "AAPL price target",
+        # Company names in their everyday sense
+        "apple pie recipe price",
+        "how much is an apple",
+        # Several tickers or no intent
+        "compare AAPL and MSFT",
+        "AAPL MSFT price",
+        "AAPL",
+    ],
+)
+def test_defers_to_llm(router, query):
+    assert router.route(query) is None
@@ -0,0 +1,61 @@
+import threading
+import time
+
+from app.sessions.sqliteSessionStore import SQLiteSessionStore
+
+
+def test_concurrent_appends_get_consecutive_seqs(tmp_path):
+    store = SQLiteSessionStore(db_path=str(tmp_path / "sessions.db"))
+    session_id = store.create("yfinance")
+    start = threading.Barrier(8)
+    results = []
+
+    def turn(index):
+        start.wait()
+        results.append(
+            store.append_messages(
+                session_id,
+                [{"role": "user", "content": f"q{index}"}, {"role": "assistant"}],
+            )
+        )
+
+    threads = [threading.Thread(target=turn, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 8
+    assert store.get(session_id)["message_count"] == 16
+    assert len(store.get_messages(session_id)) == 16
+
+
+def test_append_to_expired_session_fails(tmp_path):
+    store = SQLiteSessionStore(db_path=str(tmp_path / "sessions.db"), ttl_seconds=0)
+    session_id = store.create("yfinance")
+    time.sleep(0.01)
+
+    assert store.append_messages(session_id, [{"role": "user"}]) is False
+
+
+def test_create_prunes_expired_and_excess_sessions(tmp_path):
+    store = SQLiteSessionStore(db_path=str(tmp_path / "sessions.db"), max_sessions=2)
+    oldest = store.create("yfinance")
+    store.append_messages(oldest, [{"role": "user", "content": "hi"}])
+    store.create("yfinance")
+    newest = store.create("yfinance")
+
+    count = store._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    assert count == 2
+    assert store.get(oldest) is None
+    assert store.get(newest) is not None
+    orphans = store._conn.execute(
+        "SELECT COUNT(*) FROM messages WHERE session_id = ?", (oldest,)
+    ).fetchone()[0]
+    assert orphans == 0
+
+    store.ttl_seconds = 0
+    time.sleep(0.01)
+    store.create("yfinance")
+    count = store._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    assert count == 1
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.dataVendors.technicalIndicators import compute_indicators, interpret
+
+
+def _frame(closes):
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame(
+        {"Open": closes, "High": closes, "Low": closes, "Close": closes},
+        index=pd.bdate_range("2024-01-02", periods=len(closes)),
+    )
+
+
+@pytest.mark.parametrize(
+    "closes, expected",
+    [
+        ([10.0] * 40, 50.0),  # Flat: neutral, not overbought
+        (np.arange(40) + 10.0, 100.0),  # Only gains
+        (np.arange(40, 0, -1) + 10.0, 0.0),  # Only losses
+    ],
+)
+def test_rsi_without_losses_or_gains(closes, expected):
+    rsi = compute_indicators(_frame(closes), ["rsi"])["rsi_14"]
+
+    assert rsi[-1] == pytest.approx(expected)
+
+
+def test_flat_series_is_not_overbought():
+    rsi = compute_indicators(_frame([10.0] * 40), ["rsi"])["rsi_14"]
+
+    signals = interpret({"rsi_14": float(rsi[-1])}, 10.0)
+
+    assert signals["rsi"] == "neutral"
@@ -0,0 +1,40 @@
+import pandas as pd
+
+from app.dataVendors.financialDatasetsAI.vendor import FinancialDatasetsAI
+from app.dataVendors.vendorCache import CachedDataVendor, VendorCache
+from app.dataVendors.yfinance.vendor import YahooFinance
+
+
+class KeyEchoVendor(FinancialDatasetsAI):
+    # Answers with the key it was called with instead of hitting the API
+    def get_company_info(self, ticker: str):
+        return pd.Series({"symbol": ticker, "api_key": self.api_key})
+
+
+def test_entries_are_not_shared_across_api_keys():
+    cache = VendorCache(ttls={"get_company_info": 60})
+    first = CachedDataVendor(KeyEchoVendor("key-1"), "financialDatasetsAI", cache)
+    second = CachedDataVendor(KeyEchoVendor("key-2"), "financialDatasetsAI", cache)
+
+    assert first.get_company_info(ticker="AAPL")["api_key"] == "key-1"
+    assert second.get_company_info(ticker="AAPL")["api_key"] == "key-2"
+    assert first.get_company_info(ticker="AAPL")["api_key"] == "key-1"
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["hits"] == 1
+    assert first.cache_info("get_company_info", ticker="AAPL") != second.cache_info(
+        "get_company_info", ticker="AAPL"
+    )
+
+
+def test_api_key_stays_out_of_cache_keys():
+    cache = VendorCache(ttls={"get_company_info": 60})
+    vendor = CachedDataVendor(KeyEchoVendor("secret-key"), "financialDatasetsAI", cache)
+
+    vendor.get_company_info(ticker="AAPL")
+
+    assert not any("secret-key" in key for key in cache._entries)
+
+
+def test_keyless_vendor_ignores_api_key():
+    assert YahooFinance(api_key="anything").credential_scope() == ""
+    assert YahooFinance().credential_scope() == ""